@@ -0,0 +1,291 @@
+"""
+async_client.py
+- Jira / Confluence / Slack 요청을 asyncio(httpx.AsyncClient)로 실행하는 공용 클라이언트
+- 전체 동시 요청 수(global)와 호스트별 동시 요청 수(per-host)를 세마포어로 제한
+- 429/503 응답은 Retry-After 헤더만큼 기다린 후 재시도 (대기 중에는 세마포어를 점유하지 않음)
+- Jira 검색은 첫 페이지의 total로 나머지 페이지를 계산해서 동시에 요청
+- 기존 스크립트(jql_search.py, jira_report.py, confluence_report.py)에서 호출할 수 있는 동기 래퍼(*_sync) 제공
+"""
+
+import asyncio
+import itertools
+import os
+from urllib.parse import urlsplit
+
+try:
+    import httpx
+except ImportError:  # "http.backend"가 "async"일 때만 필요합니다.
+    httpx = None
+
+DEFAULT_MAX_CONCURRENCY = 200  # 이벤트 루프 하나에서 동시에 진행할 최대 요청 수
+DEFAULT_PER_HOST_LIMIT = 50    # 같은 호스트로 동시에 보낼 최대 요청 수 (Atlassian Cloud 요청 제한 대비)
+DEFAULT_TIMEOUT = 30
+DEFAULT_RETRIES = 3
+MAX_RETRY_WAIT = 60            # Retry-After가 너무 긴 경우 최대 대기 시간 (초)
+POOL_SLICE_SIZE = 8            # httpx 연결 풀 하나의 최대 연결 수 (httpcore는 풀의 연결 수가 많을수록 요청 배정 비용이 급격히 커지므로, 작은 풀 여러 개로 나눕니다.)
+JIRA_PAGE_SIZE = 100
+JIRA_SEARCH_FIELDS = ["key", "summary", "status", "assignee", "updated", "priority", "comment"]
+
+class AsyncClientError(Exception):
+    """API가 실패 응답을 리턴한 경우 발생합니다. (status_code, text 포함)"""
+
+    def __init__(self, method, url, status_code, text):
+        super().__init__(f"{method} {url} 실패 ({status_code}): {text[:300]}")
+        self.status_code = status_code
+        self.text = text
+
+def confluence_api_url(base_url):
+    # atlassian-python-api와 동일하게, Atlassian Cloud 주소에는 "/wiki" 경로를 붙입니다.
+    base_url = base_url.rstrip("/")
+    if "atlassian.net" in base_url and "/wiki" not in base_url:
+        base_url += "/wiki"
+    return f"{base_url}/rest/api"
+
+class AsyncAtlassianClient:
+    """Jira / Confluence / Slack 비동기 클라이언트
+
+    Args:
+        max_concurrency: 전체 동시 요청 수 제한, Default 200
+        per_host_limit: 호스트별 동시 요청 수 제한, Default 50
+        timeout: 요청 타임아웃 (초), Default 30
+        retries: 429/503/연결 오류 재시도 횟수, Default 3
+
+    Notes:
+        # 1. "async with AsyncAtlassianClient() as client:" 형태로 사용하며, 연결은 클라이언트 안에서 재사용됩니다.
+        # 2. 모든 요청 함수는 auth=(email, api_token) 튜플을 받습니다.
+    """
+
+    def __init__(self, max_concurrency=DEFAULT_MAX_CONCURRENCY, per_host_limit=DEFAULT_PER_HOST_LIMIT, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES):
+        if httpx is None:
+            raise RuntimeError("비동기 클라이언트를 사용하려면 httpx가 필요합니다. (pip install httpx)")
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        self.retries = retries
+        self.clients = []
+        self.next_client = None
+        self.global_semaphore = None
+        self.host_semaphores = {}
+
+    async def __aenter__(self):
+        slice_count = max(1, -(-self.max_concurrency // POOL_SLICE_SIZE))
+        self.clients = [
+            httpx.AsyncClient(timeout=self.timeout, limits=httpx.Limits(max_connections=POOL_SLICE_SIZE, max_keepalive_connections=POOL_SLICE_SIZE))
+            for _ in range(slice_count)
+        ]
+        self.next_client = itertools.cycle(self.clients)
+        self.global_semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self
+
+    async def __aexit__(self, *exc):
+        for client in self.clients:
+            await client.aclose()
+
+    def host_semaphore(self, url):
+        host = urlsplit(url).netloc
+        if host not in self.host_semaphores:
+            self.host_semaphores[host] = asyncio.Semaphore(self.per_host_limit)
+        return self.host_semaphores[host]
+
+    async def request(self, method, url, expected=(200,), **kwargs):
+        """세마포어와 재시도 정책을 적용해서 요청합니다.
+
+        Returns:
+            resp: httpx.Response 객체 (상태 코드가 expected에 없으면 AsyncClientError 발생)
+        """
+        for attempt in range(self.retries + 1):
+            try:
+                async with self.global_semaphore, self.host_semaphore(url):
+                    resp = await next(self.next_client).request(method, url, **kwargs)
+            except httpx.TransportError:
+                if attempt == self.retries:
+                    raise
+                await asyncio.sleep(2 ** attempt)
+                continue
+
+            if resp.status_code in (429, 503) and attempt < self.retries:
+                retry_after = resp.headers.get("Retry-After", "")
+                wait = float(retry_after) if retry_after.replace(".", "", 1).isdigit() else 2 ** attempt
+                await asyncio.sleep(min(wait, MAX_RETRY_WAIT))
+                continue
+            if resp.status_code not in expected:
+                raise AsyncClientError(method, url, resp.status_code, resp.text)
+            return resp
+
+    # =====================================
+    # Jira
+    # =====================================
+    async def search_page(self, base_url, auth, jql, fields, start_at, max_results, method="GET", headers=None, next_page_token=None):
+        url = f"{base_url}/rest/api/3/search/jql"
+        if method == "GET":
+            params = {"jql": jql, "startAt": start_at, "maxResults": max_results, "fields": fields if isinstance(fields, str) else ",".join(fields)}
+            if next_page_token:
+                params["nextPageToken"] = next_page_token
+            resp = await self.request("GET", url, auth=auth, headers=headers, params=params)
+        else:
+            payload = {"jql": jql, "startAt": start_at, "maxResults": max_results, "fields": fields.split(",") if isinstance(fields, str) else list(fields)}
+            if next_page_token:
+                payload["nextPageToken"] = next_page_token
+            resp = await self.request("POST", url, auth=auth, headers=headers, json=payload)
+        return resp.json()
+
+    async def search_jql(self, base_url, auth, jql, fields=JIRA_SEARCH_FIELDS, max_results=1000, page_size=JIRA_PAGE_SIZE, method="GET", headers=None):
+        """JQL 검색 결과 전체를 조회합니다.
+
+        Returns:
+            issues: 이슈 리스트 (Jira 응답 순서 유지)
+
+        Notes:
+            # 1. 첫 페이지 응답의 total로 나머지 startAt 목록을 계산하고, 나머지 페이지는 동시에 요청합니다.
+            # 2. 응답에 total이 없으면(nextPageToken 방식) 페이지를 순서대로 요청합니다.
+        """
+        first = await self.search_page(base_url, auth, jql, fields, 0, min(page_size, max_results), method, headers)
+        issues = list(first.get("issues", []))
+        if "total" not in first:
+            token = first.get("nextPageToken")
+            while token and not first.get("isLast") and len(issues) < max_results:
+                first = await self.search_page(base_url, auth, jql, fields, len(issues), min(page_size, max_results - len(issues)), method, headers, token)
+                issues.extend(first.get("issues", []))
+                token = first.get("nextPageToken")
+            return issues[:max_results]
+
+        if not issues:
+            return issues
+        total = min(first["total"], max_results)
+        step = len(issues)  # 서버가 maxResults보다 적게 주는 경우 실제 페이지 크기를 사용합니다.
+        pages = await asyncio.gather(*(
+            self.search_page(base_url, auth, jql, fields, start_at, min(step, total - start_at), method, headers)
+            for start_at in range(len(issues), total, step)
+        ))
+        for page in pages:
+            issues.extend(page.get("issues", []))
+        return issues[:max_results]
+
+    async def clean_jql(self, base_url, auth, queries, headers=None):
+        """pdcleaner API로 username/userKey 기반 JQL 여러 개를 한 번에 accountId 기반으로 변환합니다."""
+        resp = await self.request("POST", f"{base_url}/rest/api/3/jql/pdcleaner", auth=auth, headers=headers, json={"queries": list(queries)})
+        cleaned = resp.json().get("queries", [])
+        return [cleaned[index].get("query", query) if index < len(cleaned) else query for index, query in enumerate(queries)]
+
+    async def add_comment(self, base_url, auth, issue_key, body):
+        """이슈에 ADF 형식의 코멘트(body)를 추가합니다."""
+        resp = await self.request("POST", f"{base_url}/rest/api/3/issue/{issue_key}/comment", expected=(200, 201), auth=auth, json={"body": body})
+        return resp.json()
+
+    # =====================================
+    # Slack
+    # =====================================
+    async def post_slack(self, webhook_url, payload):
+        await self.request("POST", webhook_url, json=payload)
+        return True
+
+    # =====================================
+    # Confluence
+    # =====================================
+    async def get_page_by_title(self, base_url, auth, space_key, title, expand="version"):
+        resp = await self.request("GET", f"{confluence_api_url(base_url)}/content", auth=auth, params={"spaceKey": space_key, "title": title, "type": "page", "expand": expand})
+        results = resp.json().get("results", [])
+        return results[0] if results else None
+
+    async def create_page(self, base_url, auth, space_key, parent_id, title, body):
+        data = {"type": "page", "title": title, "space": {"key": space_key}, "body": {"storage": {"value": body, "representation": "storage"}}}
+        if parent_id:
+            data["ancestors"] = [{"type": "page", "id": parent_id}]
+        resp = await self.request("POST", f"{confluence_api_url(base_url)}/content", auth=auth, json=data)
+        return resp.json()
+
+    async def update_page(self, base_url, auth, page_id, title, body, version_number, parent_id=None):
+        data = {
+            "id": page_id, "type": "page", "title": title,
+            "body": {"storage": {"value": body, "representation": "storage"}},
+            "version": {"number": version_number, "minorEdit": True}
+        }
+        if parent_id:
+            data["ancestors"] = [{"type": "page", "id": parent_id}]
+        resp = await self.request("PUT", f"{confluence_api_url(base_url)}/content/{page_id}", auth=auth, json=data)
+        return resp.json()
+
+    async def get_page_property(self, base_url, auth, page_id, key):
+        try:
+            resp = await self.request("GET", f"{confluence_api_url(base_url)}/content/{page_id}/property/{key}", auth=auth)
+        except AsyncClientError as e:
+            if e.status_code == 404:
+                return None
+            raise
+        return resp.json()
+
+    async def set_page_property(self, base_url, auth, page_id, key, value, version_number=None):
+        # version_number가 None이면 새로 작성하고, 있으면 다음 버전으로 수정합니다.
+        url = f"{confluence_api_url(base_url)}/content/{page_id}/property"
+        if version_number is None:
+            resp = await self.request("POST", url, auth=auth, json={"key": key, "value": value})
+        else:
+            resp = await self.request("PUT", f"{url}/{key}", auth=auth, json={"key": key, "value": value, "version": {"number": version_number + 1, "minorEdit": True}})
+        return resp.json()
+
+    async def attach_file(self, base_url, auth, page_id, filename):
+        """파일을 페이지에 첨부합니다. 같은 이름의 첨부파일이 있으면 새 버전으로 올립니다."""
+        url = f"{confluence_api_url(base_url)}/content/{page_id}/child/attachment"
+        name = os.path.basename(filename)
+        headers = {"X-Atlassian-Token": "no-check"}
+
+        resp = await self.request("GET", url, auth=auth, params={"filename": name})
+        existing = resp.json().get("results", [])
+        if existing:
+            url = f"{url}/{existing[0]['id']}/data"
+
+        with open(filename, "rb") as f:
+            content = f.read()
+        resp = await self.request("POST", url, auth=auth, headers=headers, files={"file": (name, content)}, data={"minorEdit": "true"})
+        return resp.json()
+
+# =====================================
+# 동기 래퍼 (기존 스크립트에서 호출)
+# =====================================
+def run_with_client(operation, *args, client_options=None, **kwargs):
+    """새 이벤트 루프에서 클라이언트를 열고 operation(client, ...)을 실행한 결과를 리턴합니다.
+
+    Notes:
+        # 1. 이미 실행 중인 이벤트 루프 안에서는 사용할 수 없습니다. (그 경우 AsyncAtlassianClient를 직접 사용합니다.)
+    """
+    async def runner():
+        async with AsyncAtlassianClient(**(client_options or {})) as client:
+            return await operation(client, *args, **kwargs)
+    return asyncio.run(runner())
+
+def gather_with_client(operation, calls, client_options=None):
+    """같은 operation을 인자 목록(calls)만큼 한 이벤트 루프에서 동시에 실행합니다.
+
+    Args:
+        operation: AsyncAtlassianClient의 비동기 메서드 (예: AsyncAtlassianClient.search_jql)
+        calls: (args 튜플, kwargs 딕셔너리) 리스트
+
+    Returns:
+        results: calls와 같은 순서의 결과 리스트 (실패한 호출은 예외 객체)
+    """
+    async def runner(client):
+        return await asyncio.gather(*(operation(client, *args, **kwargs) for args, kwargs in calls), return_exceptions=True)
+    return run_with_client(runner, client_options=client_options)
+
+def search_jql_sync(base_url, auth, jql, client_options=None, **kwargs):
+    return run_with_client(AsyncAtlassianClient.search_jql, base_url, auth, jql, client_options=client_options, **kwargs)
+
+def search_many_sync(base_url, auth, jql_list, client_options=None, **kwargs):
+    # 여러 JQL을 동시에 검색합니다. (jql_list와 같은 순서, 실패한 검색은 예외 객체)
+    return gather_with_client(AsyncAtlassianClient.search_jql, [((base_url, auth, jql), kwargs) for jql in jql_list], client_options)
+
+def clean_jql_sync(base_url, auth, queries, client_options=None, **kwargs):
+    return run_with_client(AsyncAtlassianClient.clean_jql, base_url, auth, queries, client_options=client_options, **kwargs)
+
+def add_comments_sync(base_url, auth, comments, client_options=None):
+    # comments: (이슈 키, ADF body) 리스트
+    return gather_with_client(AsyncAtlassianClient.add_comment, [((base_url, auth, key, body), {}) for key, body in comments], client_options)
+
+def post_slack_sync(webhook_url, payload, client_options=None):
+    return run_with_client(AsyncAtlassianClient.post_slack, webhook_url, payload, client_options=client_options)
+
+def create_page_sync(base_url, auth, space_key, parent_id, title, body, client_options=None):
+    return run_with_client(AsyncAtlassianClient.create_page, base_url, auth, space_key, parent_id, title, body, client_options=client_options)
+
+def attach_file_sync(base_url, auth, page_id, filename, client_options=None):
+    return run_with_client(AsyncAtlassianClient.attach_file, base_url, auth, page_id, filename, client_options=client_options)
@@ -0,0 +1,161 @@
+"""
+slack_dispatcher.py
+- Slack 웹훅 메세지를 백그라운드 스레드에서 순서대로 전송하는 전송 큐 (보고서 생성은 Slack 전송을 기다리지 않음)
+- 웹훅 주소별로 큐와 전송 스레드를 따로 두어, 한 웹훅의 대기 시간이 다른 웹훅(팀/채널)의 전송을 막지 않음
+- 같은 웹훅 주소로는 min_interval(기본 1초) 간격으로 전송하고, 429 응답은 Retry-After 만큼 기다린 후 같은 메세지를 다시 전송
+- 긴 보고서는 자르지 않고 Block Kit 제한(메세지당 블록 50개, section 텍스트 3000자) 안에서 여러 메세지로 나누어 전송
+"""
+
+import queue
+import threading
+import time
+
+import requests
+
+DEFAULT_MIN_INTERVAL = 1.0   # 같은 웹훅으로 보내는 메세지 사이의 최소 간격 (초), Slack 웹훅 제한은 초당 1건
+DEFAULT_MAX_RETRIES = 5      # 429/5xx 응답을 받은 메세지를 다시 전송하는 횟수
+MAX_RETRY_WAIT = 60          # Retry-After가 너무 긴 경우 최대 대기 시간 (초)
+MAX_BLOCKS_PER_MESSAGE = 50  # Block Kit 메세지 하나의 최대 블록 수
+MAX_SECTION_TEXT = 3000      # section 블록 text의 최대 글자 수
+MAX_HEADER_TEXT = 150        # header 블록 text의 최대 글자 수
+
+def escape_mrkdwn(text):
+    # Slack mrkdwn에서 제어 문자로 쓰이는 &, <, >를 이스케이프합니다. (링크 <url|text> 형식은 호출한 쪽에서 직접 작성)
+    return str(text).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+def build_block_messages(title, lines, footer=None, max_messages=0):
+    """보고서 줄 리스트를 Block Kit 메세지(payload) 리스트로 나눕니다.
+
+    Args:
+        title: 메세지 제목 (첫 메세지는 header 블록, 이어지는 메세지는 "(이어서 n/N)"이 붙은 context 블록)
+        lines: mrkdwn 형식의 보고서 줄 리스트 (한 줄이 3000자를 넘으면 잘라서 사용)
+        footer: 마지막 메세지 끝에 붙일 context 문구, Default None
+        max_messages: 최대 메세지 수, Default 0 (제한 없음) - 넘치는 줄은 마지막 메세지에 "외 n건"으로 표시
+
+    Returns:
+        payloads: 웹훅으로 보낼 {"text", "blocks"} 딕셔너리 리스트 (text는 알림/미리보기용)
+    """
+    sections = []
+    current = ""
+    for line in lines:
+        line = line if len(line) <= MAX_SECTION_TEXT else line[:MAX_SECTION_TEXT - 1] + "…"
+        if current and len(current) + 1 + len(line) > MAX_SECTION_TEXT:
+            sections.append(current)
+            current = line
+        else:
+            current = f"{current}\n{line}" if current else line
+    if current:
+        sections.append(current)
+
+    # 첫 메세지의 header/마지막 메세지의 footer, 이어지는 메세지의 context 자리를 남겨둡니다.
+    per_message = MAX_BLOCKS_PER_MESSAGE - 2
+    chunks = [sections[start:start + per_message] for start in range(0, len(sections), per_message)] or [[]]
+    omitted = 0
+    if max_messages and len(chunks) > max_messages:
+        omitted = sum(section.count("\n") + 1 for chunk in chunks[max_messages:] for section in chunk)
+        chunks = chunks[:max_messages]
+
+    payloads = []
+    for index, chunk in enumerate(chunks):
+        if index == 0:
+            blocks = [{"type": "header", "text": {"type": "plain_text", "text": title[:MAX_HEADER_TEXT], "emoji": True}}]
+        else:
+            blocks = [{"type": "context", "elements": [{"type": "mrkdwn", "text": f"*{escape_mrkdwn(title)}* (이어서 {index + 1}/{len(chunks)})"}]}]
+        blocks += [{"type": "section", "text": {"type": "mrkdwn", "text": section}} for section in chunk]
+        if index == len(chunks) - 1:
+            footer_text = " — ".join(text for text in (f"외 {omitted}건은 생략되었습니다." if omitted else "", footer or "") if text)
+            if footer_text:
+                blocks.append({"type": "context", "elements": [{"type": "mrkdwn", "text": footer_text}]})
+        suffix = f" ({index + 1}/{len(chunks)})" if len(chunks) > 1 else ""
+        payloads.append({"text": f"{title}{suffix}", "blocks": blocks})
+    return payloads
+
+class SlackDispatcher:
+    """Slack 웹훅 전송 큐
+    submit()으로 넣은 메세지를 웹훅 주소별 백그라운드 스레드가 넣은 순서대로 전송합니다.
+
+    Notes:
+        # 1. 웹훅 주소별로 마지막 전송 시각을 기록해서, min_interval보다 빨리 보내지 않습니다.
+        # 2. 429/5xx 응답은 Retry-After(없으면 min_interval) 만큼 기다린 후 max_retries번까지 같은 메세지를 다시 보냅니다. 순서를 지키기 위해 그동안 다음 메세지는 보내지 않습니다.
+        # 3. 프로세스가 끝나기 전에 flush()를 호출해야 큐에 남은 메세지가 모두 전송됩니다.
+        # 4. 웹훅은 메세지 ts를 돌려주지 않으므로 스레드 답글 대신 "(이어서 n/N)" 메세지로 나누어 보냅니다.
+    """
+
+    def __init__(self, min_interval=DEFAULT_MIN_INTERVAL, max_retries=DEFAULT_MAX_RETRIES, timeout=30):
+        self.min_interval = min_interval
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.queues = {}
+        self.threads = {}
+        self.last_sent = {}
+        self.sent = 0
+        self.failed = 0
+        self.thread_lock = threading.Lock()
+
+    def submit(self, webhook_url, payload, label=None):
+        """메세지를 전송 큐에 넣고 바로 리턴합니다. label은 전송 결과 로그에 사용됩니다."""
+        with self.thread_lock:
+            if webhook_url not in self.queues:
+                self.queues[webhook_url] = queue.Queue()
+            thread = self.threads.get(webhook_url)
+            if thread is None or not thread.is_alive():
+                thread = threading.Thread(target=self.run, args=(webhook_url, self.queues[webhook_url]), name="slack-dispatcher", daemon=True)
+                self.threads[webhook_url] = thread
+                thread.start()
+            self.queues[webhook_url].put((payload, label))
+
+    def submit_many(self, webhook_url, payloads, label=None):
+        for index, payload in enumerate(payloads):
+            self.submit(webhook_url, payload, f"{label} ({index + 1}/{len(payloads)})" if label and len(payloads) > 1 else label)
+
+    def flush(self, timeout=None, webhook_url=None):
+        """큐의 메세지가 모두 전송(또는 실패 처리)될 때까지 기다립니다. timeout(초)이 지나면 False를 리턴합니다.
+        webhook_url을 지정하면 해당 웹훅의 메세지만 기다립니다.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while any(webhook_queue.unfinished_tasks for url, webhook_queue in list(self.queues.items()) if webhook_url in (None, url)):
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    def run(self, webhook_url, webhook_queue):
+        while True:
+            payload, label = webhook_queue.get()
+            try:
+                self.deliver(webhook_url, payload, label)
+            except Exception as e:
+                with self.thread_lock:
+                    self.failed += 1
+                print(f"Slack 전송 실패: {label or webhook_url} ({e})")
+            finally:
+                webhook_queue.task_done()
+
+    def deliver(self, webhook_url, payload, label):
+        for attempt in range(self.max_retries + 1):
+            wait = self.last_sent.get(webhook_url, 0) + self.min_interval - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                resp = self.session.post(webhook_url, json=payload, timeout=self.timeout)
+                status_code, retry_after = resp.status_code, resp.headers.get("Retry-After")
+            except requests.RequestException as e:
+                resp, status_code, retry_after = None, None, None
+                print(f"Slack 전송 오류: {label or webhook_url} ({e})")
+            self.last_sent[webhook_url] = time.monotonic()
+
+            if status_code == 200:
+                with self.thread_lock:
+                    self.sent += 1
+                print(f"Slack 메시지 전송 완료: {label}" if label else "Slack 메시지 전송 완료")
+                return True
+            if status_code is not None and status_code != 429 and status_code < 500:
+                break
+            if attempt < self.max_retries:
+                time.sleep(min(float(retry_after or self.min_interval or 1), MAX_RETRY_WAIT))
+
+        with self.thread_lock:
+            self.failed += 1
+        print(f"Slack 전송 실패: {status_code}, {resp.text if resp is not None else ''} ({label or webhook_url})")
+        return False
@@ -0,0 +1,242 @@
+"""
+stage_profiler.py
+- 보고서 스크립트의 단계(fetch, transform, render, publish, crawl)별 프로파일러 (기본 비활성, 표준 라이브러리만 사용)
+- 활성화: 스크립트의 --profile-stages 옵션 또는 QA_REPORT_PROFILE 환경변수 ("1"이면 ./profiles/<실행 시각>/, 그 외 값은 결과 디렉토리 경로)
+- 단계별 cProfile 결과(<단계>.prof, snakeviz/pstats로 열기)와 스택 샘플링 결과(<단계>.collapsed, 전체는 all_stages.collapsed)를 저장
+- collapsed 파일은 flamegraph.pl, speedscope, inferno 등 flamegraph 도구에 바로 입력할 수 있는 "프레임;프레임;... 샘플수" 형식
+- 실행이 끝나면 단계별 소요 시간과 자체 실행 시간(tottime) 기준 상위 함수 목록을 출력
+"""
+
+import atexit
+import contextlib
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+
+PROFILE_ENV_VAR = "QA_REPORT_PROFILE"
+DEFAULT_PROFILE_DIR = "profiles"
+DEFAULT_SAMPLE_INTERVAL = 0.005  # 스택 샘플링 간격 (초)
+DEFAULT_TOP_N = 25               # 실행 종료 시 출력할 상위 함수 수
+ALL_STAGES_FILENAME = "all_stages.collapsed"
+
+PROFILER = None
+PROFILER_LOCK = threading.Lock()
+
+def format_frame(code):
+    # collapsed 형식의 프레임 이름 (같은 함수의 샘플이 합쳐지도록 호출 줄 번호 대신 함수 정의 줄 번호를 사용합니다.)
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+class StageProfiler:
+    """단계별 프로파일러
+    stage(name) 구간마다 cProfile로 함수별 실행 시간을 측정하고, 백그라운드 스레드가 구간을 실행 중인 스레드의 스택을 주기적으로 샘플링합니다.
+
+    Notes:
+        # 1. 같은 이름의 구간은 여러 번(여러 보고서 프로필) 실행되어도 하나로 합쳐서 저장합니다.
+        # 2. 구간 안에서 다시 구간을 시작하면, cProfile은 바깥 구간만 측정하고 샘플은 안쪽 구간으로 집계합니다.
+        # 3. Python 3.12부터는 cProfile을 프로세스에서 하나만 실행할 수 있으므로, 다른 스레드의 구간과 겹치는 구간은 샘플링만 합니다.
+        # 4. 샘플링은 실제 경과 시간 기준이므로 네트워크 대기(I/O) 중인 스택도 집계됩니다. (CPU 시간은 .prof 파일의 tottime 참고)
+    """
+
+    def __init__(self, output_dir, interval=DEFAULT_SAMPLE_INTERVAL):
+        self.output_dir = output_dir
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.active = {}       # {스레드 아이디: 실행 중인 구간 이름 리스트}
+        self.samples = {}      # {구간 이름: Counter(collapsed 스택)}
+        self.stats = {}        # {구간 이름: pstats.Stats}
+        self.wall_time = Counter()
+        self.calls = Counter()
+        self.stop_event = threading.Event()
+        self.sampler = None
+        self.finished = False
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        import cProfile
+        import pstats
+
+        thread_id = threading.get_ident()
+        with self.lock:
+            stages = self.active.setdefault(thread_id, [])
+            stages.append(name)
+            if self.sampler is None:
+                self.sampler = threading.Thread(target=self.sample_loop, name="stage-profiler", daemon=True)
+                self.sampler.start()
+
+        profile = None
+        if not getattr(self.local, "profiling", False):
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+                self.local.profiling = True
+            except ValueError:
+                profile = None
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            if profile is not None:
+                profile.disable()
+                self.local.profiling = False
+            with self.lock:
+                stages.pop()
+                if not stages:
+                    del self.active[thread_id]
+                self.wall_time[name] += elapsed
+                self.calls[name] += 1
+                if profile is not None:
+                    if name in self.stats:
+                        self.stats[name].add(profile)
+                    else:
+                        self.stats[name] = pstats.Stats(profile)
+
+    def sample_loop(self):
+        while not self.stop_event.wait(self.interval):
+            frames = sys._current_frames()
+            with self.lock:
+                for thread_id, stages in self.active.items():
+                    frame = frames.get(thread_id)
+                    stack = []
+                    while frame is not None:
+                        stack.append(format_frame(frame.f_code))
+                        frame = frame.f_back
+                    # 스택의 맨 아래(루트)에 구간 이름을 붙여서, flamegraph에서 단계별로 나누어 보이도록 합니다.
+                    key = ";".join([f"stage:{stage}" for stage in stages] + stack[::-1])
+                    self.samples.setdefault(stages[-1], Counter())[key] += 1
+
+    def write_results(self):
+        """단계별 .prof/.collapsed 파일과 all_stages.collapsed 파일을 저장하고, 저장한 파일 경로 리스트를 리턴합니다."""
+        os.makedirs(self.output_dir, exist_ok=True)
+        paths = []
+        for name, stats in self.stats.items():
+            path = os.path.join(self.output_dir, f"{name}.prof")
+            stats.dump_stats(path)
+            paths.append(path)
+
+        all_samples = Counter()
+        for name, samples in self.samples.items():
+            all_samples.update(samples)
+            paths.append(write_collapsed(os.path.join(self.output_dir, f"{name}.collapsed"), samples))
+        if all_samples:
+            paths.append(write_collapsed(os.path.join(self.output_dir, ALL_STAGES_FILENAME), all_samples))
+        return paths
+
+    def hot_functions(self, top_n=DEFAULT_TOP_N):
+        """자체 실행 시간(tottime) 기준 상위 함수 리스트를 리턴합니다.
+
+        Returns:
+            rows: [(tottime, cumtime, 호출 수, "함수 (파일:줄)")] 리스트, cProfile 결과가 없으면 샘플의 맨 위 프레임 기준 [(샘플 비율, None, 샘플 수, 프레임)]
+        """
+        merged = {}
+        for stats in self.stats.values():
+            for (filename, lineno, func_name), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+                label = f"{func_name} ({os.path.basename(filename)}:{lineno})" if lineno else func_name
+                total = merged.get(label, (0.0, 0.0, 0))
+                merged[label] = (total[0] + tottime, total[1] + cumtime, total[2] + ncalls)
+        if merged:
+            ranked = sorted(merged.items(), key=lambda item: item[1][0], reverse=True)[:top_n]
+            return [(tottime, cumtime, ncalls, label) for label, (tottime, cumtime, ncalls) in ranked]
+
+        leaf_counts = Counter()
+        for samples in self.samples.values():
+            for key, count in samples.items():
+                leaf_counts[key.rsplit(";", 1)[-1]] += count
+        total_samples = sum(leaf_counts.values()) or 1
+        return [(count / total_samples, None, count, label) for label, count in leaf_counts.most_common(top_n)]
+
+    def finish(self, top_n=DEFAULT_TOP_N):
+        """샘플링을 종료하고 결과 파일 저장과 요약 출력을 한 번만 실행합니다."""
+        with self.lock:
+            if self.finished:
+                return
+            self.finished = True
+        self.stop_event.set()
+        if self.sampler is not None:
+            self.sampler.join()
+
+        if not self.calls:
+            print("\n[프로파일] 측정된 단계가 없습니다.")
+            return
+        try:
+            paths = self.write_results()
+        except OSError as e:
+            print(f"\n[프로파일] 결과 파일 저장 실패: {e}")
+            paths = []
+
+        print(f"\n=== 단계별 프로파일 ({self.output_dir}) ===")
+        for name, seconds in self.wall_time.most_common():
+            sample_count = sum(self.samples.get(name, {}).values())
+            print(f"{name:<10} {seconds:>9.3f}s  {self.calls[name]:>4}회  샘플 {sample_count}")
+
+        rows = self.hot_functions(top_n)
+        if rows and rows[0][1] is None:
+            print(f"\n--- 상위 {len(rows)}개 프레임 (샘플 기준) ---")
+            for ratio, _, count, label in rows:
+                print(f"{ratio * 100:>6.1f}%  {count:>7}  {label}")
+        elif rows:
+            print(f"\n--- 상위 {len(rows)}개 함수 (tottime 기준) ---")
+            print(f"{'tottime':>9} {'cumtime':>9} {'ncalls':>9}  function")
+            for tottime, cumtime, ncalls, label in rows:
+                print(f"{tottime:>9.3f} {cumtime:>9.3f} {ncalls:>9}  {label}")
+
+        if paths:
+            print(f"\n저장된 파일 {len(paths)}개: {', '.join(os.path.basename(path) for path in paths)}")
+
+def write_collapsed(path, samples):
+    with open(path, "w", encoding="utf-8") as f:
+        for key, count in sorted(samples.items()):
+            f.write(f"{key} {count}\n")
+    return path
+
+def resolve_output_dir(value):
+    # "1", "true", "yes"는 기본 디렉토리(./profiles/<실행 시각>)를, 그 외 값은 디렉토리 경로로 사용합니다.
+    if value is True or str(value).lower() in ("1", "true", "yes", "on"):
+        return os.path.join(os.getcwd(), DEFAULT_PROFILE_DIR, datetime.now().strftime("%Y%m%d_%H%M%S"))
+    return os.path.abspath(str(value))
+
+def enable_profiling(output_dir=True, interval=DEFAULT_SAMPLE_INTERVAL):
+    """프로파일링 모드를 켜고 프로파일러를 리턴합니다. (이미 켜져 있으면 기존 프로파일러를 리턴합니다.)
+
+    Args:
+        output_dir: 결과 디렉토리 경로, Default True (./profiles/<실행 시각>/)
+        interval: 스택 샘플링 간격 (초), Default DEFAULT_SAMPLE_INTERVAL
+
+    Notes:
+        # 1. 프로세스가 종료될 때 finish_profiling()이 자동으로 호출됩니다. (스크립트에서 먼저 호출하면 다시 실행되지 않습니다.)
+    """
+    global PROFILER
+    with PROFILER_LOCK:
+        if PROFILER is None:
+            PROFILER = StageProfiler(resolve_output_dir(output_dir), interval)
+            atexit.register(finish_profiling)
+            print(f"[프로파일] 단계별 프로파일링 사용: {PROFILER.output_dir}")
+        return PROFILER
+
+def get_profiler():
+    # 프로파일링 모드가 아니면 None을 리턴합니다. QA_REPORT_PROFILE 환경변수가 있으면 처음 호출될 때 프로파일링 모드를 켭니다.
+    if PROFILER is None:
+        value = os.environ.get(PROFILE_ENV_VAR, "")
+        if value and value.lower() not in ("0", "false", "no", "off"):
+            return enable_profiling(value)
+    return PROFILER
+
+def stage(name):
+    """단계 이름으로 측정 구간을 만드는 context manager를 리턴합니다. 프로파일링 모드가 아니면 아무것도 측정하지 않습니다.
+
+    Example:
+        with stage_profiler.stage("fetch"):
+            issues = fetch_jira_issues(jql)
+    """
+    profiler = get_profiler()
+    return profiler.stage(name) if profiler is not None else contextlib.nullcontext()
+
+def finish_profiling(top_n=DEFAULT_TOP_N):
+    # 프로파일링 모드일 때만 결과 파일을 저장하고 요약을 출력합니다.
+    if PROFILER is not None:
+        PROFILER.finish(top_n)
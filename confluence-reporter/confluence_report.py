@@ -1,24 +1,19 @@
 import json
+import hashlib
 from time import localtime, strftime
 import time
 import os
 import html
+import re
+import subprocess
+from html.parser import HTMLParser
 from datetime import datetime, timedelta
 import calendar
+import argparse
+import sys
 
-# Confluence API 및 Store review 수집
-from atlassian import Confluence
-import pandas as pd
-from google_play_scraper import Sort, reviews
-from app_store_scraper import AppStore
-import urllib.parse
-
-# Selenium
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
+# Confluence API, Store review 수집, Selenium 등 무거운 라이브러리는 해당 보고서를 작성하는 함수 안에서 import합니다.
+# (리뷰 보고서만 작성할 때 Selenium/webdriver_manager를 로드하지 않도록 하여 시작 시간을 줄입니다. startup_benchmark.py 참고)
 
 """Atlassian API를 사용하여 월간 보고서 페이지를 작성합니다. 작성된 페이지는 Config.json에 정의된 페이지에 작성됩니다.
 
@@ -27,22 +22,218 @@ Notes:
     # 2. Window OS의 Task Scheduler 또는 Mac OS의 Crontab, Launchd 등을 활용하여 특정 주기마다 이 스크립트를 실행시킬 수 있습니다.
 """
 
-def web_driver_setting():
+# 점유율 페이지를 HTTP로 직접 요청할 때 사용하는 User-Agent (브라우저가 아닌 요청을 차단하는 경우 대비)
+HTTP_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+HTTP_TIMEOUT = 15
+
+# 앱 스토어 고객 리뷰 피드 (국가별 최신순, 페이지당 50건, 최대 10페이지)
+APP_STORE_FEED_URL = "https://itunes.apple.com/{country}/rss/customerreviews/page={page}/id={app_id}/sortby=mostrecent/json"
+APP_STORE_MAX_PAGES = 10
+APP_STORE_PAGES_PER_WAVE = 3  # 국가별로 한 번에 동시에 요청할 페이지 수 (지난달 리뷰가 끝나면 다음 페이지는 요청하지 않습니다.)
+APP_STORE_WORKERS = 8
+
+# 크롬 드라이버 캐시 설정 ("webdriver_config"의 "cache_dir"로 변경할 수 있습니다.)
+DEFAULT_DRIVER_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "qa-productivity-tools", "chromedriver")
+DRIVER_LOCK_FILENAME = "chromedriver.lock.json"
+# 설치된 크롬 브라우저 버전을 확인할 실행 파일 후보 ("webdriver_config"의 "browser_path"가 없을 때 순서대로 확인)
+CHROME_BROWSER_CANDIDATES = [
+    "google-chrome", "google-chrome-stable", "chromium", "chromium-browser",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe"
+]
+
+# 공용 모듈(async_client, stage_profiler) 디렉토리
+COMMON_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "common")
+
+# 페이지 본문/첨부파일 해시값을 저장하는 페이지 속성 키
+REPORT_HASH_PROPERTY_KEY = "qa-report-content-hash"
+
+# 리뷰 요약 통계 설정 (월별 지표 아카이브, 키워드 토크나이저)
+DEFAULT_REVIEW_ARCHIVE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "review_archive.json")
+REVIEW_KOREAN_TOKEN_PATTERN = r"(?<![가-힣])([가-힣]{2,}?)(?:에서|에게|으로|까지|부터|은|는|이|가|을|를|에|의|도|로|와|과|만)?(?![가-힣])"
+REVIEW_LATIN_TOKEN_PATTERN = r"\b[a-z]{3,}\b"
+REVIEW_COLUMNS = ['score', 'content', 'date', 'source']
+REVIEW_SOURCES = ['Google Play', 'App Store']  # 리뷰 DataFrame의 source 컬럼(category) 값
+REVIEW_CSV_CHUNK_ROWS = 10000  # CSV 파일을 나누어 쓸 때 한 번에 쓰는 행 수
+REVIEW_CSV_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"  # CSV 파일의 리뷰 작성 시각 형식
+REVIEW_CHILD_PAGE_DIGITS = 3  # 하위 페이지 제목의 구간 번호 자릿수 (제목순 정렬이 구간 순서와 같도록 0으로 채웁니다.)
+REVIEW_STOPWORDS = {"너무", "진짜", "정말", "그냥", "그리고", "근데", "그런데", "이거", "이건", "있어요", "있습니다", "합니다", "했는데", "하는데", "the", "and", "this", "that"}
+
+def get_chromedriver_version(driver_path):
+    """크롬 드라이버 버전 확인 함수
+    드라이버 실행 파일의 "--version" 출력에서 버전 문자열을 추출합니다. (네트워크를 사용하지 않습니다.)
+
+    Args:
+        driver_path: 크롬 드라이버 실행 파일 경로
+
+    Returns:
+        version: "120.0.6099.109" 형태의 버전 문자열, 확인할 수 없으면 None을 리턴합니다.
+    """
+    try:
+        result = subprocess.run([driver_path, "--version"], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = re.search(r"ChromeDriver\s+([\d.]+)", result.stdout)
+    return match.group(1) if match else None
+
+def get_chrome_browser_version(browser_path=None):
+    """설치된 크롬 브라우저 버전 확인 함수
+    브라우저 실행 파일의 "--version" 출력(Windows는 레지스트리)에서 버전 문자열을 추출합니다. (네트워크를 사용하지 않습니다.)
+
+    Args:
+        browser_path: 크롬 브라우저 실행 파일 경로, Default None (CHROME_BROWSER_CANDIDATES에서 찾기)
+
+    Returns:
+        version: "120.0.6099.109" 형태의 버전 문자열, 확인할 수 없으면 None을 리턴합니다.
+    """
+    if sys.platform == "win32" and not browser_path:
+        try:
+            import winreg
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Google\Chrome\BLBeacon") as key:
+                return winreg.QueryValueEx(key, "version")[0]
+        except OSError:
+            pass
+
+    for candidate in [browser_path] if browser_path else CHROME_BROWSER_CANDIDATES:
+        try:
+            result = subprocess.run([candidate, "--version"], capture_output=True, text=True, timeout=10)
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = re.search(r"(\d+\.[\d.]+)", result.stdout)
+        if match:
+            return match.group(1)
+    return None
+
+def invalidate_chromedriver_lock(driver_config):
+    # 잠금 파일을 삭제해서 다음 resolve_chromedriver_path() 호출에서 드라이버를 다시 설치하도록 합니다. 삭제했으면 True를 리턴합니다.
+    lock_path = os.path.join(driver_config.get('cache_dir') or DEFAULT_DRIVER_CACHE_DIR, DRIVER_LOCK_FILENAME)
+    try:
+        os.remove(lock_path)
+    except FileNotFoundError:
+        return False
+    except OSError as e:
+        print(f"드라이버 잠금 파일 삭제 실패: {e}")
+        return False
+    return True
+
+def resolve_chromedriver_path(driver_config):
+    """크롬 드라이버 경로를 결정하는 함수
+    캐시 디렉토리의 버전 잠금 파일(chromedriver.lock.json)을 확인하고, 유효한 드라이버가 있으면 다운로드 없이 재사용합니다.
+
+    Args:
+        driver_config: "confluence_config.json"의 "webdriver_config" 데이터
+
+    Returns:
+        driver_path: 사용할 크롬 드라이버 실행 파일 경로를 리턴합니다.
+
+    Notes:
+        # 1. "driver_path"가 지정되어 있으면 해당 드라이버를 그대로 사용합니다.
+        # 2. 잠금 파일의 드라이버가 없거나, 버전이 "driver_version"(지정하지 않으면 설치된 크롬 브라우저의 메이저 버전)과 다르면,
+            # ChromeDriverManager로 한 번만 내려받고 잠금 파일을 갱신합니다. (크롬 자동 업데이트 후에도 맞는 드라이버를 사용)
+        # 3. 잠금 파일이 유효한 동안에는 버전 확인을 위한 네트워크 요청을 하지 않으므로 오프라인 환경에서도 실행할 수 있습니다.
+        # 4. 드라이버나 브라우저 버전을 확인할 수 없으면 잠금 파일의 드라이버를 그대로 사용합니다. (매 실행마다 다시 설치하지 않음)
+    """
+    driver_path = driver_config.get('driver_path')
+    if driver_path:
+        if not os.path.isfile(driver_path):
+            raise FileNotFoundError(f"지정된 크롬 드라이버를 찾을 수 없습니다: {driver_path}")
+        return driver_path
+
+    cache_dir = driver_config.get('cache_dir') or DEFAULT_DRIVER_CACHE_DIR
+    pinned_version = driver_config.get('driver_version') or None
+    lock_path = os.path.join(cache_dir, DRIVER_LOCK_FILENAME)
+
+    # 1. 잠금 파일에 기록된 드라이버 검증 (로컬 검사만 수행)
+    lock = None
+    if os.path.exists(lock_path):
+        try:
+            with open(lock_path, 'r', encoding='utf-8') as f:
+                lock = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"드라이버 잠금 파일을 읽을 수 없어 새로 작성합니다: {e}")
+
+    if lock:
+        locked_path = lock.get('path', "")
+        if os.path.isfile(locked_path) and os.access(locked_path, os.X_OK):
+            version = get_chromedriver_version(locked_path) or lock.get('version')
+            if pinned_version:
+                valid = bool(version) and version.startswith(pinned_version)
+            else:
+                browser_version = get_chrome_browser_version(driver_config.get('browser_path') or None)
+                valid = not (version and browser_version) or version.split('.')[0] == browser_version.split('.')[0]
+                if valid and not browser_version:
+                    print("설치된 크롬 브라우저 버전을 확인할 수 없어 캐시된 드라이버를 그대로 사용합니다.")
+                elif not valid:
+                    print(f"크롬 브라우저({browser_version})와 캐시된 드라이버({version})의 메이저 버전이 다릅니다.")
+            if valid:
+                print(f"캐시된 크롬 드라이버 사용: {version or '버전 확인 불가'}")
+                return locked_path
+        print("캐시된 크롬 드라이버가 유효하지 않아 다시 설치합니다.")
+
+    # 2. 드라이버 설치 및 잠금 파일 갱신
+    from webdriver_manager.chrome import ChromeDriverManager
+    from webdriver_manager.core.driver_cache import DriverCacheManager
+
+    os.makedirs(cache_dir, exist_ok=True)
+    driver_path = ChromeDriverManager(
+        driver_version=pinned_version,
+        cache_manager=DriverCacheManager(root_dir=cache_dir)
+    ).install()
+
+    version = get_chromedriver_version(driver_path) or pinned_version
+    with open(lock_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            "path": driver_path,
+            "version": version,
+            "resolved_at": datetime.now().isoformat(timespec='seconds')
+        }, f, ensure_ascii=False, indent=2)
+    print(f"크롬 드라이버 설치 및 잠금 파일 작성 완료: {version}")
+    return driver_path
+
+def web_driver_setting(config=None):
     """점유율 웹사이트 크롤링을 위한 초기 설정 함수
     크롬 웹드라이버를 초기화하고, 헤드리스 모드로 설정합니다.
 
+    Args:
+        config: "confluence_config.json" 파일의 데이터, Default None ("webdriver_config"가 없으면 기본 캐시 설정 사용)
+
     Returns:
         driver: 헤드리스 모드로 설정된 크롬 웹드라이버를 리턴합니다.
+
+    Notes:
+        # 1. "webdriver_config"의 "remote_url"이 지정되어 있으면, 이미 실행 중인 원격/Standalone 드라이버에 연결합니다.
+        # 2. 그 외에는 resolve_chromedriver_path()로 캐시된 드라이버를 사용합니다.
+            # 캐시된 드라이버로 세션 생성에 실패하면(브라우저 업데이트 등) 잠금 파일을 한 번 무효화하고 드라이버를 다시 설치해서 재시도합니다.
     """
+    driver_config = (config or {}).get('webdriver_config', {})
     try:
-        service = ChromeService(ChromeDriverManager().install())
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service as ChromeService
+
         chrome_options = Options()
         chrome_options.add_argument("--headless")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--window-size=1920,1080")
 
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        from selenium.common.exceptions import SessionNotCreatedException
+
+        remote_url = driver_config.get('remote_url')
+        if remote_url:
+            driver = webdriver.Remote(command_executor=remote_url, options=chrome_options)
+        else:
+            try:
+                service = ChromeService(resolve_chromedriver_path(driver_config))
+                driver = webdriver.Chrome(service=service, options=chrome_options)
+            except SessionNotCreatedException as e:
+                if driver_config.get('driver_path') or not invalidate_chromedriver_lock(driver_config):
+                    raise
+                print(f"캐시된 크롬 드라이버로 세션을 만들 수 없어 드라이버를 다시 설치합니다: {str(e).splitlines()[0]}")
+                service = ChromeService(resolve_chromedriver_path(driver_config))
+                driver = webdriver.Chrome(service=service, options=chrome_options)
+
         driver.implicitly_wait(10)
         print("WebDriver 초기화 완료 (Headless Mode).")
         return driver
@@ -50,6 +241,25 @@ def web_driver_setting():
         print(f"WebDriver 초기화 실패. Chrome 또는 드라이버 관리 문제: {e}")
         return None
 
+def ensure_common_on_path():
+    # common 디렉토리가 sys.path에 없을 때만 맨 앞에 추가합니다.
+    if COMMON_DIR not in sys.path:
+        sys.path.insert(0, COMMON_DIR)
+
+def load_stage_profiler():
+    """단계별 프로파일러 모듈(common/stage_profiler.py)을 import해서 리턴하는 함수
+
+    Notes:
+        # 1. 표준 라이브러리만 사용하므로 추가 패키지 설치가 필요하지 않습니다. 프로파일링 모드가 아니면 측정하지 않습니다.
+    """
+    ensure_common_on_path()
+    import stage_profiler
+    return stage_profiler
+
+def profile_stage(name):
+    # 보고서 단계(fetch, transform, render, publish, crawl) 측정 구간, --profile-stages 옵션 또는 QA_REPORT_PROFILE 환경변수를 사용할 때만 측정합니다.
+    return load_stage_profiler().stage(name)
+
 def load_config(CONFIG_PATH):
     """confluence_config.json 데이터 로드
     CONFIG_PATH에 저장된 JSON 데이터를 세팅하고 리턴합니다.
@@ -82,6 +292,7 @@ def initialize_confluence_client(config):
         API_USERNAME = config['auth']['username']
         API_TOKEN = config['auth']['api_token']
 
+        from atlassian import Confluence
         confluence = Confluence(
             url=BASE_URL,
             username=API_USERNAME,
@@ -127,6 +338,240 @@ def create_confluence_page(confluence_client, space_key, parent_id, title, conte
         print(f"페이지 작성 실패. 오류: {e}")
         return False
 
+def compute_content_hash(content):
+    """페이지 본문의 해시값을 계산하는 함수
+    실행할 때마다 달라지는 "작성된 시간" 문단과 들여쓰기를 제외하고, 본문 내용만으로 SHA-256 해시값을 계산합니다.
+
+    Args:
+        content: 페이지 본문 (storage format)
+
+    Returns:
+        해시값(hex 문자열)을 리턴합니다.
+    """
+    normalized = re.sub(r"<p>작성된 시간:[^<]*</p>", "", content)
+    normalized = "\n".join(line.strip() for line in normalized.strip().splitlines() if line.strip())
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+def compute_file_hash(filename):
+    """첨부파일의 해시값을 계산하는 함수
+
+    Args:
+        filename: 해시값을 계산할 파일 경로
+
+    Returns:
+        해시값(hex 문자열)을 리턴합니다.
+    """
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def load_report_hash(confluence_client, page_id):
+    """페이지에 저장된 보고서 해시값을 조회하는 함수
+    이전 실행에서 페이지 속성(content property)으로 저장한 본문/첨부파일 해시값을 조회합니다.
+
+    Args:
+        confluence_client: 페이지 조회에 필요한 Confluence 데이터
+        page_id: 조회할 페이지 아이디
+
+    Returns:
+        stored_hash: {"body": 본문 해시, "attachments": {파일명: 해시}} 형태의 딕셔너리 (없으면 빈 딕셔너리)
+        version_number: 페이지 속성의 버전 번호 (없으면 None)
+    """
+    try:
+        page_property = confluence_client.get_page_property(page_id, REPORT_HASH_PROPERTY_KEY)
+    except Exception:
+        return {}, None
+
+    if not isinstance(page_property, dict):
+        return {}, None
+    return page_property.get('value') or {}, page_property.get('version', {}).get('number')
+
+def save_report_hash(confluence_client, page_id, stored_hash, version_number):
+    """페이지에 보고서 해시값을 저장하는 함수
+
+    Args:
+        confluence_client: 페이지 수정에 필요한 Confluence 데이터
+        page_id: 해시값을 저장할 페이지 아이디
+        stored_hash: {"body": 본문 해시, "attachments": {파일명: 해시}} 형태의 딕셔너리
+        version_number: 기존 페이지 속성의 버전 번호 (처음 저장하는 경우 None)
+    """
+    data = {"key": REPORT_HASH_PROPERTY_KEY, "value": stored_hash}
+    try:
+        if version_number is None:
+            confluence_client.set_page_property(page_id, data)
+        else:
+            data["version"] = {"number": version_number + 1, "minorEdit": True}
+            confluence_client.update_page_property(page_id, data)
+    except Exception as e:
+        print(f"보고서 해시 저장 실패 (다음 실행에서 다시 업데이트됩니다): {e}")
+
+def publish_confluence_page(confluence_client, space_key, parent_id, title, content, attachments=None):
+    """Confluence 페이지 작성 또는 수정 (Upsert)
+    같은 제목의 페이지가 있으면 변경된 내용만 반영하고, 없으면 새로 작성합니다.
+
+    Args:
+        confluence_client: 페이지 작성에 필요한 Confluence 데이터
+        space_key: 작성할 페이지의 컨플루언스 스페이스 아이디
+        parent_id: 작성되는 페이지의 상위 페이지 아이디
+        title: 작성할 페이지의 제목
+        content: 작성될 페이지의 본문
+        attachments: 페이지에 첨부할 파일 경로 리스트, Default 첨부 파일 없음
+
+    Returns:
+        page_id: 페이지 작성(또는 수정)에 성공하면, 페이지 아이디를 리턴합니다.
+
+    Notes:
+        # 1. 본문과 첨부파일의 해시값을 페이지 속성에 저장하고, 다음 실행에서 해시값이 같으면 update/attach API를 호출하지 않습니다.
+        # 2. 첨부하지 않은 로컬 파일도 attach_csv_to_page()와 동일하게 삭제됩니다.
+        # 3. 같은 보고서를 여러 번 실행해도 페이지가 중복 작성되지 않습니다.
+    """
+    attachments = attachments or []
+    body_hash = compute_content_hash(content)
+
+    try:
+        page = confluence_client.get_page_by_title(space=space_key, title=title)
+    except Exception as e:
+        print(f"기존 페이지 조회 실패. 오류: {e}")
+        return False
+
+    stored_hash, version_number = {}, None
+    if not page:
+        page_id = create_confluence_page(confluence_client, space_key, parent_id, title, content)
+        if not page_id:
+            return False
+    else:
+        page_id = page['id']
+        stored_hash, version_number = load_report_hash(confluence_client, page_id)
+
+        if stored_hash.get('body') == body_hash:
+            print(f"\n'{title}' 페이지 본문 변경 없음. 업데이트를 건너뜁니다.")
+        else:
+            print(f"\n'{title}' 페이지 업데이트 시작...")
+            try:
+                confluence_client.update_page(
+                    page_id=page_id,
+                    title=title,
+                    body=content,
+                    parent_id=parent_id if parent_id else None,
+                    representation='storage',
+                    minor_edit=True
+                )
+                print(f"페이지 업데이트 성공! 제목: **{title}**")
+            except Exception as e:
+                print(f"페이지 업데이트 실패. 오류: {e}")
+                return False
+
+    new_hash = {"body": body_hash, "attachments": dict(stored_hash.get('attachments', {}))}
+
+    for filename in attachments:
+        name = os.path.basename(filename)
+        file_hash = compute_file_hash(filename)
+
+        if new_hash['attachments'].get(name) == file_hash:
+            print(f"첨부파일 변경 없음. 첨부를 건너뜁니다: {name}")
+            os.remove(filename)
+            continue
+
+        if attach_csv_to_page(confluence_client, page_id, filename):
+            new_hash['attachments'][name] = file_hash
+        else:
+            new_hash['attachments'].pop(name, None)
+
+    if new_hash != stored_hash:
+        save_report_hash(confluence_client, page_id, new_hash, version_number)
+    return page_id
+
+def publish_child_pages_async(config, space_key, parent_id, child_pages):
+    """하위 페이지 동시 작성 또는 수정 (Upsert)
+    publish_confluence_page()와 같은 방식(제목으로 조회, 본문 해시 비교)으로 여러 하위 페이지를 하나의 이벤트 루프에서 동시에 작성합니다.
+
+    Args:
+        config: "confluence_config.json" 파일의 데이터 ("http"의 "max_concurrency", "per_host_limit" 사용)
+        space_key: 작성할 페이지의 컨플루언스 스페이스 아이디
+        parent_id: 하위 페이지를 작성할 상위 페이지 아이디
+        child_pages: (제목, 본문) 튜플 리스트
+
+    Returns:
+        page_ids: child_pages와 같은 순서의 페이지 아이디 리스트 (실패한 페이지는 False)
+
+    Notes:
+        # 1. common/async_client.py(httpx)를 사용합니다. "http"의 "backend"가 "async"인 경우에만 호출됩니다.
+    """
+    ensure_common_on_path()
+    import async_client
+
+    base_url = config['confluence']['base_url']
+    auth = (config['auth']['username'], config['auth']['api_token'])
+    http_conf = config.get('http', {})
+    client_options = {key: http_conf[key] for key in ("max_concurrency", "per_host_limit") if key in http_conf}
+
+    async def upsert(client, title, content):
+        body_hash = compute_content_hash(content)
+        page = await client.get_page_by_title(base_url, auth, space_key, title)
+        if not page:
+            page = await client.create_page(base_url, auth, space_key, parent_id, title, content)
+            stored_hash, version_number = {}, None
+        else:
+            page_property = await client.get_page_property(base_url, auth, page['id'], REPORT_HASH_PROPERTY_KEY)
+            stored_hash = (page_property or {}).get('value') or {}
+            version_number = page_property.get('version', {}).get('number') if page_property else None
+            if stored_hash.get('body') == body_hash:
+                return page['id']
+            await client.update_page(base_url, auth, page['id'], title, content, page['version']['number'] + 1, parent_id)
+
+        await client.set_page_property(base_url, auth, page['id'], REPORT_HASH_PROPERTY_KEY, dict(stored_hash, body=body_hash), version_number)
+        return page['id']
+
+    results = async_client.gather_with_client(upsert, [((title, content), {}) for title, content in child_pages], client_options)
+
+    page_ids = []
+    for (title, _), result in zip(child_pages, results):
+        if isinstance(result, Exception):
+            print(f"'{title}' 하위 페이지 작성 실패. 오류: {result}")
+            page_ids.append(False)
+        else:
+            page_ids.append(result)
+    print(f"하위 페이지 {sum(1 for page_id in page_ids if page_id)}/{len(child_pages)}개 작성(또는 변경 없음) 완료")
+    return page_ids
+
+def remove_stale_child_pages(confluence_client, parent_id, page_title, child_titles):
+    """이번 실행에서 작성하지 않은 리뷰 하위 페이지를 삭제하는 함수
+    리뷰 수가 줄어 구간 수가 줄었을 때, 이전 실행에서 작성한 뒤쪽 구간의 하위 페이지가 남지 않도록 합니다.
+
+    Args:
+        confluence_client: 페이지 조회와 삭제에 필요한 Confluence 데이터
+        parent_id: 리뷰 페이지 아이디
+        page_title: 리뷰 페이지 제목 (하위 페이지 제목은 "{page_title} (구간 번호)" 형식)
+        child_titles: 이번 실행에서 작성한 하위 페이지 제목 리스트
+
+    Returns:
+        removed_count: 삭제한 하위 페이지 수
+
+    Notes:
+        # 1. 제목이 리뷰 하위 페이지 형식인 페이지만 삭제하고, 직접 추가한 다른 하위 페이지는 그대로 둡니다.
+    """
+    try:
+        children = confluence_client.get_child_pages(parent_id)
+    except Exception as e:
+        print(f"하위 페이지 조회 실패. 오류: {e}")
+        return 0
+
+    title_pattern = re.compile(re.escape(page_title) + r" \(\d+(?:/\d+)?\)")
+    removed_count = 0
+    for child in children or []:
+        title = child.get('title', '')
+        if title in child_titles or not title_pattern.fullmatch(title):
+            continue
+        try:
+            confluence_client.remove_page(child['id'])
+            print(f"이전 실행의 하위 페이지 삭제: {title}")
+            removed_count += 1
+        except Exception as e:
+            print(f"'{title}' 하위 페이지 삭제 실패. 오류: {e}")
+    return removed_count
+
 def get_last_month_range():
     """스토어 리뷰 기준일자를 리턴하는 함수
     스크립트 실행일을 기준으로 지난달의 시작일과 종료일을 계산합니다.
@@ -177,13 +622,14 @@ def attach_csv_to_page(confluence_client, page_id, filename):
     Notes:
         # 1. 이 함수는 페이지 아이디가 필요하기 때문에, 페이지가 작성된 이후에 바로 호출됩니다.
         # 2. 첨부된 파일은 페이지의 세부정보에서 확인해주세요.
+        # 3. gzip으로 압축된 CSV 파일(.csv.gz)은 application/gzip 형식으로 첨부됩니다.
     """
     try:
         print(f"CSV 파일 첨부 시도: {filename}")
         confluence_client.attach_file(
             filename=filename,
             name=os.path.basename(filename), # 컨플루언스에 표시될 이름
-            content_type='text/csv',
+            content_type='application/gzip' if filename.endswith('.gz') else 'text/csv',
             page_id=page_id,
         )
         print(f"CSV 파일 첨부 완료: {filename}")
@@ -197,42 +643,435 @@ def attach_csv_to_page(confluence_client, page_id, filename):
         print(f"파일 첨부 실패: {e}")
         return False
 
-def scrape_app_store_reviews(app_id, app_name, country_code, start_date):
-    """앱 스토어 리뷰를 수집하는 함수
-    "confluence_config.json"에 있는 정보를 바탕으로 앱 스토어에서 리뷰를 수집합니다.
+def fetch_app_store_review_page(session, feed_url, app_id, country_code, page):
+    """앱 스토어 리뷰 피드 한 페이지를 요청하는 함수
+    앱 스토어 고객 리뷰 RSS(JSON) 피드의 한 페이지(최대 50건, 최신순)를 요청합니다.
 
     Args:
+        session: HTTP 요청에 사용할 requests.Session 객체
+        feed_url: 피드 URL 형식 문자열 ("{country}", "{page}", "{app_id}" 포함)
         app_id: 앱 스토어에 등록된 앱아이디
-        app_name: 앱 스토어에 등록된 앱이름
         country_code: 수집할 리뷰의 국가코드
+        page: 페이지 번호 (1부터 APP_STORE_MAX_PAGES까지)
+
+    Returns:
+        entries: 피드의 entry 리스트, 요청에 실패하면 None을 리턴합니다.
+    """
+    url = feed_url.format(country=country_code, page=page, app_id=app_id)
+    try:
+        resp = session.get(url, timeout=HTTP_TIMEOUT)
+        if resp.status_code == 429:
+            time.sleep(float(resp.headers.get("Retry-After") or 1))
+            resp = session.get(url, timeout=HTTP_TIMEOUT)
+        resp.raise_for_status()
+        entries = resp.json().get("feed", {}).get("entry", [])
+    except Exception as e:
+        print(f"App Store 리뷰 피드 요청 실패 ({country_code}, {page}페이지): {e}")
+        return None
+    # 리뷰가 1건이면 entry가 리스트가 아닌 딕셔너리로 옵니다.
+    return [entries] if isinstance(entries, dict) else entries
+
+def iter_app_store_reviews(entries, start_date):
+    """앱 스토어 리뷰 피드 entry를 Google Play와 같은 행 형태로 하나씩 변환하는 함수
+
+    Args:
+        entries: fetch_app_store_review_page()의 결과
         start_date: 수집할 리뷰의 시작 일자
 
     Returns:
-        app_store_reviews: 앱 스토어 리뷰를 리스트 형태로 리턴합니다.
+        (score, content, date, "App Store") 리스트를 하나씩 생성합니다. start_date 이전 리뷰에 도달하면 종료합니다.
+
+    Notes:
+        # 1. 리뷰 작성 시각은 Google Play 리뷰, get_last_month_range()와 같은 기준(실행 환경의 로컬 시각, timezone 정보 없음)으로 변환합니다.
+        # 2. 평점이 없는 entry(앱 정보)는 건너뜁니다.
     """
-    app = AppStore(country=country_code, app_id=app_id, app_name=app_name)
+    for entry in entries:
+        if "im:rating" not in entry:
+            continue
+        review_date = datetime.fromisoformat(entry["updated"]["label"]).astimezone().replace(tzinfo=None)
+        if review_date < start_date:
+            return
+        yield [int(entry["im:rating"]["label"]), entry.get("content", {}).get("label", ""), review_date, 'App Store']
+
+def scrape_app_store_reviews(app_id, country_codes, start_date, feed_url=None, workers=APP_STORE_WORKERS):
+    """앱 스토어 리뷰를 수집하는 함수
+    "confluence_config.json"에 있는 정보를 바탕으로 국가별 앱 스토어 리뷰 피드를 동시에 요청하여 지난달 리뷰를 수집합니다.
+
+    Args:
+        app_id: 앱 스토어에 등록된 앱아이디
+        country_codes: 수집할 리뷰의 국가코드 리스트
+        start_date: 수집할 리뷰의 시작 일자
+        feed_url: 피드 URL 형식 문자열, Default None (APP_STORE_FEED_URL)
+        workers: 동시에 요청할 최대 페이지 수, Default APP_STORE_WORKERS
+
+    Returns:
+        app_store_reviews: 앱 스토어 리뷰를 [score, content, date, 'App Store'] 리스트 형태로 리턴합니다.
+        failed_countries: 요청에 실패해서 수집이 중단된 국가코드와 실패한 페이지 번호 딕셔너리 ({국가코드: 페이지})
+
+    Notes:
+        # 1. 피드는 국가별로 최신순 최대 10페이지(500건)까지만 제공됩니다.
+        # 2. 국가별로 APP_STORE_PAGES_PER_WAVE 페이지씩 동시에 요청하고, start_date 이전 리뷰가 나온 국가는 다음 페이지를 요청하지 않습니다.
+            # 빈 페이지(리뷰 없음)는 수집 완료로, 요청 실패(None)는 수집 실패로 구분합니다. 실패한 국가는 그 페이지까지만 수집됩니다.
+        # 3. app_store_scraper 라이브러리(전체 리뷰를 순서대로 요청)를 사용하지 않으므로 추가 패키지 설치가 필요하지 않습니다.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    import requests
+
+    feed_url = feed_url or APP_STORE_FEED_URL
+    session = requests.Session()
+    session.headers.update({"User-Agent": HTTP_USER_AGENT})
     app_store_reviews = []
+    failed_countries = {}
+    next_page = {country_code: 1 for country_code in country_codes}
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while next_page:
+            requests_in_wave = [
+                (country_code, page)
+                for country_code, first_page in next_page.items()
+                for page in range(first_page, min(first_page + APP_STORE_PAGES_PER_WAVE, APP_STORE_MAX_PAGES + 1))
+            ]
+            pages = executor.map(lambda request: fetch_app_store_review_page(session, feed_url, app_id, *request), requests_in_wave)
+
+            finished = set()
+            for (country_code, page), entries in zip(requests_in_wave, pages):
+                if country_code in finished:
+                    continue
+                if entries is None:
+                    failed_countries[country_code] = page
+                    finished.add(country_code)
+                    continue
+                if not entries:
+                    finished.add(country_code)
+                    continue
+                rows = list(iter_app_store_reviews(entries, start_date))
+                app_store_reviews.extend(rows)
+                if len(rows) < sum(1 for entry in entries if "im:rating" in entry) or page == APP_STORE_MAX_PAGES:
+                    finished.add(country_code)
+            next_page = {
+                country_code: first_page + APP_STORE_PAGES_PER_WAVE
+                for country_code, first_page in next_page.items()
+                if country_code not in finished and first_page + APP_STORE_PAGES_PER_WAVE <= APP_STORE_MAX_PAGES
+            }
+
+    print(f"App Store 리뷰 수집 완료: {len(app_store_reviews)}건 ({', '.join(country_codes)})")
+    if failed_countries:
+        print(f"⚠️ App Store 리뷰 수집 실패 국가: {', '.join(f'{country_code}({page}페이지)' for country_code, page in failed_countries.items())}")
+    return app_store_reviews, failed_countries
+
+def get_review_string_dtype():
+    # pyarrow가 설치되어 있으면 Arrow 기반 문자열, 없으면 pandas 기본(python) 문자열 dtype을 사용합니다.
+    import pandas as pd
 
     try:
-        app.review()
-    except Exception as e:
-        print(f"App Store 리뷰 수집 중 라이브러리 오류 발생: {e}. 수집을 건너뜁니다.")
-        return []
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return pd.StringDtype("python")
+    return pd.StringDtype("pyarrow")
 
-    if not app.reviews:
-        return []
+def build_review_frame(rows, end_date=None):
+    """리뷰 행 리스트를 타입이 지정된 리뷰 DataFrame으로 변환하는 함수
+    스토어 수집 결과(한 페이지 단위)를 바로 작은 DataFrame으로 변환해서, 전체 리뷰를 파이썬 리스트로 모아두지 않도록 합니다.
 
-    for review in app.reviews:
-        review_date = review['date']
+    Args:
+        rows: [score, content, date, source] 리스트의 리스트
+        end_date: 이 시각 이후의 리뷰는 제외합니다, Default None (제외하지 않음)
 
-        if review_date >= start_date:
-            temp_list = [review['rating'], review['review'], review_date, 'App Store']
-            app_store_reviews.append(temp_list)
-        else:
-            print("App Store: 지난달 시작일 이전 리뷰 도달, 수집 중단.")
-            return app_store_reviews
+    Returns:
+        review_df: REVIEW_COLUMNS 컬럼을 가진 DataFrame을 리턴합니다.
+
+    Notes:
+        # 1. score는 int8, content는 문자열(pyarrow가 있으면 Arrow 기반), date는 datetime64[ns], source는 category로 저장합니다.
+        # 2. 페이지별 DataFrame은 source의 category가 같으므로 pd.concat() 후에도 category로 유지됩니다.
+    """
+    import pandas as pd
+
+    review_df = pd.DataFrame({
+        'score': pd.array([row[0] for row in rows], dtype='int8'),
+        'content': pd.array([row[1] for row in rows], dtype=get_review_string_dtype()),
+        'date': pd.to_datetime([row[2] for row in rows]).as_unit('ns'),
+        'source': pd.Categorical([row[3] for row in rows], categories=REVIEW_SOURCES)
+    }, columns=REVIEW_COLUMNS)
+    if end_date is not None:
+        review_df = review_df[review_df['date'] <= end_date]
+    return review_df
+
+def write_review_csv(review_df, csv_filename, compression=None, chunk_rows=REVIEW_CSV_CHUNK_ROWS):
+    """리뷰 DataFrame을 CSV 파일로 나누어 저장하는 함수
+
+    Args:
+        review_df: 저장할 리뷰 DataFrame
+        csv_filename: CSV 파일명
+        compression: "gzip"이면 gzip으로 압축해서 저장합니다. (파일명에 ".gz"가 붙습니다.), Default None
+        chunk_rows: 한 번에 쓰는 행 수, Default REVIEW_CSV_CHUNK_ROWS
+
+    Returns:
+        csv_filename: 실제로 저장된 파일명을 리턴합니다.
+
+    Notes:
+        # 1. 전체 CSV 문자열을 한 번에 만들지 않고 chunk_rows 행씩 같은 파일에 이어서 씁니다.
+        # 2. gzip 헤더의 시각(mtime)을 0으로 고정해서, 내용이 같으면 파일 해시도 같도록 합니다. (변경 없는 첨부 건너뛰기)
+        # 3. 날짜는 모든 조각에서 같은 형식(REVIEW_CSV_DATE_FORMAT)으로 씁니다. (조각마다 pandas가 형식을 따로 고르지 않도록 합니다.)
+    """
+    import gzip
+    import io
+
+    if compression == 'gzip':
+        csv_filename = csv_filename if csv_filename.endswith('.gz') else f"{csv_filename}.gz"
+        csv_file = io.TextIOWrapper(gzip.GzipFile(csv_filename, 'wb', mtime=0), encoding='utf-8', newline='')
+    else:
+        csv_file = open(csv_filename, 'w', encoding='utf-8', newline='')
+
+    with csv_file:
+        if review_df.empty:
+            review_df.to_csv(csv_file, index=True, date_format=REVIEW_CSV_DATE_FORMAT)
+        for start in range(0, len(review_df), chunk_rows):
+            review_df.iloc[start:start + chunk_rows].to_csv(csv_file, header=start == 0, index=True, date_format=REVIEW_CSV_DATE_FORMAT)
+    return csv_filename
+
+def sanitize_review_text(content_series):
+    """리뷰 본문 정리 함수
+    Confluence storage format(XHTML)에 사용할 수 없는 제어문자를 제거합니다.
+
+    Args:
+        content_series: 리뷰 본문 Series
+
+    Returns:
+        제어문자가 제거된 리뷰 본문 Series를 리턴합니다.
+
+    Notes:
+        # 1. HTML 특수문자(<, >, &)는 to_html(escape=True)에서 이스케이프됩니다.
+    """
+    return content_series.fillna("").astype(str).str.replace(r"[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]", "", regex=True)
+
+def build_score_summary(review_df):
+    """평점별 요약 테이블을 작성하는 함수
+    리뷰 DataFrame에서 평점별 리뷰 수, 비율, 평균 본문 길이, 스토어별 리뷰 수를 계산합니다.
+
+    Args:
+        review_df: ['score', 'content', 'date', 'source'] 컬럼을 가진 리뷰 DataFrame
+
+    Returns:
+        summary_df: 평점(5~1점)을 인덱스로 하는 요약 DataFrame을 리턴합니다.
+    """
+    import pandas as pd
+
+    lengths = review_df['content'].str.len()
+    summary_df = (
+        review_df.assign(length=lengths)
+        .groupby('score')
+        .agg(리뷰수=('length', 'size'), 평균길이=('length', 'mean'))
+    )
+    summary_df['비율(%)'] = (summary_df['리뷰수'] / summary_df['리뷰수'].sum() * 100).round(1)
+    summary_df['평균길이'] = summary_df['평균길이'].round(1)
+    summary_df = summary_df.join(pd.crosstab(review_df['score'], review_df['source']))
+
+    summary_df = summary_df.reindex(range(5, 0, -1), fill_value=0)
+    summary_df.index.name = '평점'
+    return summary_df[['리뷰수', '비율(%)', '평균길이'] + [c for c in summary_df.columns if c not in ('리뷰수', '비율(%)', '평균길이')]]
+
+def build_daily_volume(review_df):
+    """일별 리뷰 수 테이블을 작성하는 함수
+
+    Args:
+        review_df: ['score', 'content', 'date', 'source'] 컬럼을 가진 리뷰 DataFrame
+
+    Returns:
+        daily_df: 날짜별 리뷰 수, 평균 평점, 저평점(1~2점) 리뷰 수를 담은 DataFrame을 리턴합니다.
+    """
+    daily_df = (
+        review_df.assign(day=review_df['date'].dt.strftime('%Y-%m-%d'), low=review_df['score'] <= 2)
+        .groupby('day')
+        .agg(리뷰수=('score', 'size'), 평균평점=('score', 'mean'), 저평점=('low', 'sum'))
+    )
+    daily_df['평균평점'] = daily_df['평균평점'].round(2)
+    daily_df.index.name = '날짜'
+    return daily_df
+
+def extract_top_keywords(review_df, top_n=20):
+    """리뷰 본문에서 자주 나오는 키워드를 추출하는 함수
+    정규식 토크나이저로 한글(2자 이상)과 영문(3자 이상) 단어를 추출하고, 한글 단어 끝의 조사는 제거합니다.
+
+    Args:
+        review_df: ['score', 'content', 'date', 'source'] 컬럼을 가진 리뷰 DataFrame
+        top_n: 추출할 키워드 개수, Default 20개
+
+    Returns:
+        keyword_df: 키워드별 전체 빈도와 저평점(1~2점) 리뷰에서의 빈도를 담은 DataFrame을 리턴합니다.
+    """
+    import pandas as pd
+
+    contents = review_df['content'].str.lower()
+    tokens = pd.concat([
+        contents.str.findall(REVIEW_KOREAN_TOKEN_PATTERN).explode(),
+        contents.str.findall(REVIEW_LATIN_TOKEN_PATTERN).explode()
+    ]).dropna()
+    tokens = tokens[~tokens.isin(REVIEW_STOPWORDS)]
+
+    if tokens.empty:
+        return pd.DataFrame(columns=['빈도', '저평점 빈도'])
+
+    # explode()는 원래 행의 인덱스를 유지하므로 인덱스로 평점을 바로 매칭합니다.
+    low_tokens = tokens[review_df['score'].reindex(tokens.index).to_numpy() <= 2]
+    keyword_df = pd.DataFrame({
+        '빈도': tokens.value_counts(),
+        '저평점 빈도': low_tokens.value_counts()
+    }).fillna(0).astype(int)
+    keyword_df = keyword_df.sort_values(['빈도', '저평점 빈도'], ascending=False).head(top_n)
+    keyword_df.index.name = '키워드'
+    return keyword_df
+
+def load_review_archive(archive_path):
+    # 월별 리뷰 요약 아카이브({"YYYY-MM": 지표 딕셔너리})를 불러옵니다. 파일이 없거나 읽을 수 없으면 빈 딕셔너리를 리턴합니다.
+    archive = {}
+    if os.path.exists(archive_path):
+        try:
+            with open(archive_path, 'r', encoding='utf-8') as f:
+                archive = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"리뷰 아카이브 로드 오류 (새로 작성합니다): {e}")
+    return archive
+
+def compare_review_archive(archive_path, month_key, review_df):
+    """월별 리뷰 요약 아카이브와 비교하는 함수
+    이번 보고서의 월별 지표를 계산하고, 아카이브(JSON)에서 직전 월의 지표를 찾아 리턴합니다.
+
+    Args:
+        archive_path: 아카이브 파일 경로
+        month_key: 보고서 기준 월 ("YYYY-MM")
+        review_df: 보고서 기준 월의 리뷰 DataFrame
+
+    Returns:
+        current: 이번 달 지표 딕셔너리
+        previous: 직전 월 지표 딕셔너리 (아카이브에 없으면 None)
+
+    Notes:
+        # 1. 아카이브 파일은 변경하지 않습니다. 페이지 게시에 성공한 다음 save_review_archive()로 저장합니다.
+    """
+    archive = load_review_archive(archive_path)
+
+    scores = review_df['score']
+    current = {
+        "리뷰수": int(len(review_df)),
+        "평균평점": round(float(scores.mean()), 2),
+        "저평점 비율(%)": round(float((scores <= 2).mean() * 100), 1),
+        "5점 비율(%)": round(float((scores == 5).mean() * 100), 1)
+    }
+
+    previous_keys = sorted(key for key in archive if key < month_key)
+    previous = archive[previous_keys[-1]] if previous_keys else None
+    return current, previous
+
+def save_review_archive(archive_path, month_key, current):
+    """월별 리뷰 요약 아카이브에 이번 보고서의 지표를 저장하는 함수
+
+    Args:
+        archive_path: 아카이브 파일 경로
+        month_key: 보고서 기준 월 ("YYYY-MM")
+        current: compare_review_archive()가 계산한 이번 달 지표 딕셔너리
+
+    Returns:
+        Boolean(True/False): 저장 여부에 따라 리턴합니다.
+    """
+    archive = load_review_archive(archive_path)
+    archive[month_key] = current
+    try:
+        with open(archive_path, 'w', encoding='utf-8') as f:
+            json.dump(archive, f, ensure_ascii=False, indent=2, sort_keys=True)
+    except OSError as e:
+        print(f"리뷰 아카이브 저장 오류: {e}")
+        return False
+    return True
+
+def build_review_analytics_html(review_df, month_key, archive_path):
+    """리뷰 페이지 상단의 요약 통계 HTML을 작성하는 함수
+    평점 분포, 전월 대비 증감, 일별 리뷰 수, 주요 키워드를 각각 작은 테이블로 작성합니다.
+
+    Args:
+        review_df: 보고서 기준 월의 리뷰 DataFrame
+        month_key: 보고서 기준 월 ("YYYY-MM")
+        archive_path: 월별 리뷰 요약 아카이브 파일 경로
 
-    return app_store_reviews
+    Returns:
+        analytics_html: 페이지 본문에 들어갈 HTML을 리턴합니다.
+        current: 이번 달 지표 딕셔너리 (페이지 게시에 성공하면 save_review_archive()로 저장합니다.)
+
+    Notes:
+        # 1. 모든 지표는 DataFrame 단위의 벡터 연산으로 계산되므로, 리뷰 10만 건 기준 1초 이내에 계산됩니다.
+    """
+    import pandas as pd
+
+    current, previous = compare_review_archive(archive_path, month_key, review_df)
+
+    if previous:
+        delta_df = pd.DataFrame({'이번 달': current, '전월': previous}).reindex(list(current))
+        delta_df['증감'] = (delta_df['이번 달'] - delta_df['전월']).round(2)
+    else:
+        delta_df = pd.DataFrame({'이번 달': current})
+    delta_df.index.name = '지표'
+
+    sections = [
+        ("평점별 요약", build_score_summary(review_df)),
+        ("전월 대비 지표", delta_df),
+        ("주요 키워드", extract_top_keywords(review_df)),
+        ("일별 리뷰 수", build_daily_volume(review_df))
+    ]
+    analytics_html = "\n".join(
+        f"<h3>{title}</h3>\n{table_df.to_html(classes='confluenceTable', escape=True)}"
+        for title, table_df in sections
+    )
+    return analytics_html, current
+
+def render_review_tables(review_df, page_title, render_mode="sections", rows_per_section=500):
+    """리뷰 목록 HTML 작성 함수
+    리뷰 수에 따라 하나의 테이블 또는 여러 구간으로 나눈 테이블을 작성합니다.
+
+    Args:
+        review_df: 페이지에 작성할 리뷰 DataFrame
+        page_title: 리뷰 페이지 제목 (하위 페이지 제목에 사용됩니다.)
+        render_mode: 구간 작성 방식, Default "sections"
+            - "single": 기존처럼 하나의 테이블로 작성합니다.
+            - "sections": 구간마다 접기(expand) 매크로로 감싸서 본문에 작성합니다.
+            - "child_pages": 구간마다 하위 페이지를 작성하고, 본문에는 하위 페이지 목록을 표시합니다.
+        rows_per_section: 구간당 리뷰 수, Default 500
+
+    Returns:
+        body_html: 리뷰 페이지 본문에 들어갈 HTML을 리턴합니다.
+        child_pages: [(하위 페이지 제목, 본문)] 리스트를 리턴합니다. (child_pages 모드가 아니면 빈 리스트)
+    """
+    row_count = len(review_df)
+    if render_mode == "single" or row_count <= rows_per_section:
+        return review_df.to_html(index=False, classes="confluenceTable", escape=True), []
+
+    sections = []
+    for start in range(0, row_count, rows_per_section):
+        chunk_df = review_df.iloc[start:start + rows_per_section]
+        dates = chunk_df['date']
+        label = f"리뷰 {start + 1}~{start + len(chunk_df)} ({dates.min():%Y-%m-%d} ~ {dates.max():%Y-%m-%d})"
+        sections.append((label, chunk_df.to_html(index=False, classes="confluenceTable", escape=True)))
+
+    if render_mode == "child_pages":
+        # 구간 수가 바뀌어도 같은 구간은 같은 제목(같은 페이지)으로 수정되도록 전체 구간 수는 제목에 넣지 않습니다.
+        width = max(REVIEW_CHILD_PAGE_DIGITS, len(str(len(sections))))
+        child_pages = [
+            (f"{page_title} ({i:0{width}d})", f"<h3>{label}</h3>\n{table_html}")
+            for i, (label, table_html) in enumerate(sections, start=1)
+        ]
+        body_html = (
+            f"<p>리뷰 목록은 {len(sections)}개의 하위 페이지에 {rows_per_section}건씩 나누어 작성되었습니다.</p>"
+            '<ac:structured-macro ac:name="children"><ac:parameter ac:name="sort">title</ac:parameter></ac:structured-macro>'
+        )
+        return body_html, child_pages
+
+    body_html = "".join(
+        '<ac:structured-macro ac:name="expand">'
+        f'<ac:parameter ac:name="title">{label}</ac:parameter>'
+        f'<ac:rich-text-body>{table_html}</ac:rich-text-body>'
+        '</ac:structured-macro>'
+        for label, table_html in sections
+    )
+    return body_html, []
 
 def scrape_reviews_store(config, confluence_client):
     """플레이 스토어와 앱스토어 리뷰를 수집하여 페이지를 작성하는 함수
@@ -245,105 +1084,341 @@ def scrape_reviews_store(config, confluence_client):
     Notes:
         # 1. 이 함수가 실행되면, 각 스토어의 등록된 앱 리뷰를 수집해서 페이지가 작성됩니다.
         # 2. 페이지 작성이 완료되면, CSV 파일을 첨부합니다.
+        # 3. 리뷰 수가 "rows_per_section"보다 많으면 "render_mode"에 따라 접기 섹션(sections) 또는 하위 페이지(child_pages)로 나누어 작성합니다.
+        # 4. 리뷰는 수집한 페이지 단위로 타입이 지정된 DataFrame(int8 평점, category 스토어, datetime64 날짜, 문자열 본문)으로 변환해서 메모리 사용량을 줄입니다.
+        # 5. 월별 리뷰 지표는 페이지 게시에 성공한 경우에만 아카이브("archive_path")에 저장합니다.
     """
+    import pandas as pd
+    from google_play_scraper import Sort, reviews
+
     # 설정 정보 로드
     GP_APP_ID = config.get('review_config', {}).get('gp_app_id')
     AS_APP_ID = config.get('review_config', {}).get('as_app_id')
-    AS_APP_NAME = config.get('review_config', {}).get('as_app_name')
-    AS_COUNTRY = config.get('review_config', {}).get('as_country_code', 'kr')
+    AS_COUNTRIES = config.get('review_config', {}).get('as_country_codes') or [config.get('review_config', {}).get('as_country_code', 'kr')]
+    AS_FEED_URL = config.get('review_config', {}).get('as_feed_url') or APP_STORE_FEED_URL
 
     review_space_key = config['review_config']['space_key']
     review_parent_id = config['review_config']['parent_page_id']
+    RENDER_MODE = config['review_config'].get('render_mode', 'sections')
+    ROWS_PER_SECTION = int(config['review_config'].get('rows_per_section', 500))
+    ARCHIVE_PATH = config['review_config'].get('archive_path') or DEFAULT_REVIEW_ARCHIVE_PATH
+    CSV_COMPRESSION = config['review_config'].get('csv_compression') or None
+    CSV_CHUNK_ROWS = int(config['review_config'].get('csv_chunk_rows', REVIEW_CSV_CHUNK_ROWS))
 
     START_DATE, END_DATE = get_last_month_range()
 
-    all_reviews = []
-
-    # Google Play 리뷰 수집
-    if GP_APP_ID:
-        gp_reviews = []
-        token = None
-        keep_scraping = True
-        # print(f"--- Google Play ({START_DATE.strftime('%Y년 %m월')}) 리뷰 수집 시작 ---")
-
-        while keep_scraping:
-            result, continuation_token = reviews(GP_APP_ID, lang='ko', country='kr', continuation_token=token, sort=Sort.NEWEST, count=1000, filter_score_with=None)
-            if not result: break
-            token = continuation_token
-
-            for review in result:
-                review_date = review['at']
-                if review_date >= START_DATE:
-                    # 'score', 'content', 'date', 'source' 순서에 맞춤
-                    gp_reviews.append([review['score'], review['content'], review_date,'Google Play'])
-                else:
-                    keep_scraping = False
-                    break
-            if not keep_scraping and not token: break
-
-        all_reviews.extend(gp_reviews)
-    else:
-        print("Google Play 앱 ID가 없어 수집을 건너뜁니다.")
+    # 스토어 페이지마다 타입이 지정된 작은 DataFrame으로 변환해서 모읍니다. (build_review_frame 참고)
+    review_chunks = []
+    as_failed_countries = {}
+
+    # --profile-stages 옵션 또는 QA_REPORT_PROFILE 환경변수를 사용하면 수집(fetch), 변환(transform), 작성(render), 게시(publish) 단계별로 프로파일링합니다.
+    with profile_stage("fetch"):
+        # Google Play 리뷰 수집
+        if GP_APP_ID:
+            token = None
+            keep_scraping = True
+            # print(f"--- Google Play ({START_DATE.strftime('%Y년 %m월')}) 리뷰 수집 시작 ---")
+
+            while keep_scraping:
+                result, continuation_token = reviews(GP_APP_ID, lang='ko', country='kr', continuation_token=token, sort=Sort.NEWEST, count=1000, filter_score_with=None)
+                if not result: break
+                token = continuation_token
+
+                page_reviews = []
+                for review in result:
+                    review_date = review['at']
+                    if review_date >= START_DATE:
+                        # 'score', 'content', 'date', 'source' 순서에 맞춤
+                        page_reviews.append([review['score'], review['content'], review_date,'Google Play'])
+                    else:
+                        keep_scraping = False
+                        break
+                review_chunks.append(build_review_frame(page_reviews, END_DATE))
+                if not keep_scraping and not token: break
+        else:
+            print("Google Play 앱 ID가 없어 수집을 건너뜁니다.")
 
 
-    # # App Store 리뷰 수집
-    # if AS_APP_ID and AS_APP_NAME:
-    #     as_reviews = scrape_app_store_reviews(AS_APP_ID, AS_APP_NAME, AS_COUNTRY, START_DATE)
-    #     all_reviews.extend(as_reviews)
-    # else:
-    #     print("App Store ID 또는 App Name이 없어 수집을 건너뜁니다.")
+        # App Store 리뷰 수집
+        if AS_APP_ID:
+            as_reviews, as_failed_countries = scrape_app_store_reviews(AS_APP_ID, AS_COUNTRIES, START_DATE, feed_url=AS_FEED_URL)
+            review_chunks.append(build_review_frame(as_reviews, END_DATE))
+        else:
+            print("App Store ID가 없어 수집을 건너뜁니다.")
+
+
+    with profile_stage("transform"):
+        # 데이터 통합 (기간 필터링은 페이지별로 이미 적용되어 있으므로 전체 DataFrame을 다시 복사하지 않습니다.)
+        # DataFrame 컬럼 통일: ['score', 'content', 'date', 'source']
+        filtered_df = pd.concat(review_chunks, ignore_index=True) if review_chunks else build_review_frame([])
+        del review_chunks
+
+        filtered_count = len(filtered_df)
+
+        # print(f"{START_DATE.strftime('%Y년 %m월')} 최종 통합 리뷰 수: {filtered_count}")
+
+        if filtered_df.empty:
+            print("수집된 리뷰가 없어 페이지 작성을 건너뜁니다.")
+            return
+
+        # CSV 파일 작성 (CSV_CHUNK_ROWS 행씩 나누어 쓰고, "csv_compression"이 "gzip"이면 .csv.gz로 압축)
+        csv_filename = write_review_csv(filtered_df, f"reviews_{START_DATE.strftime('%Y%m')}.csv", CSV_COMPRESSION, CSV_CHUNK_ROWS)
+        # print(f"CSV 파일 작성 완료: {csv_filename}")
+
+    with profile_stage("render"):
+        # 컨플루언스 내용 구성
+        page_title = f"[App Review] {START_DATE.strftime('%Y-%m')}"
+
+        # HTML 변환 (리뷰 본문은 이스케이프하고, 행 수가 많으면 구간별로 나누어 작성)
+        display_df = filtered_df.assign(content=sanitize_review_text(filtered_df['content']))
+        # 요청에 실패한 App Store 국가는 일부 리뷰가 빠져 있으므로 본문에 표시합니다.
+        failed_html = ""
+        if as_failed_countries:
+            failed_html = f"<p>⚠️ App Store 수집 실패 국가 (일부 리뷰 누락): {html.escape(', '.join(f'{country_code} ({page}페이지)' for country_code, page in as_failed_countries.items()))}</p>"
+        summary_html, review_metrics = build_review_analytics_html(display_df, START_DATE.strftime('%Y-%m'), ARCHIVE_PATH)
+        html_table, child_pages = render_review_tables(display_df, page_title, RENDER_MODE, ROWS_PER_SECTION)
+
+        storage_format_content = f"""
+        <h2>{START_DATE.strftime('%Y년 %m월')} 통합 앱 리뷰 보고서입니다. </h2>
+        <p>수집 플랫폼: {', '.join(filtered_df['source'].unique())}</p>
+        <p>수집 기간: {START_DATE.strftime('%Y-%m-%d')} ~ {END_DATE.strftime('%Y-%m-%d')}</p>
+        <p>작성된 시간: {strftime('%Y-%m-%d %H:%M:%S')}</p>
+        {failed_html}
+
+        {summary_html}
+
+        <h3>지난달 리뷰 목록 (총 {filtered_count}건)</h3>
+
+        {html_table}
+        """
+
+    with profile_stage("publish"):
+        # 페이지 작성 호출 (작성 또는 수정 후 CSV 파일 첨부, 로컬 파일 삭제)
+        page_id = publish_confluence_page(confluence_client, review_space_key, review_parent_id, page_title, storage_format_content, attachments=[csv_filename])
+
+        # 게시에 실패하면 다음 실행의 전월 대비 비교가 틀어지지 않도록 월별 지표를 아카이브에 저장하지 않습니다.
+        if page_id:
+            save_review_archive(ARCHIVE_PATH, START_DATE.strftime('%Y-%m'), review_metrics)
+
+        # 하위 페이지 모드: 리뷰 목록을 구간별 하위 페이지로 작성하고, 이번 실행에 없는 구간의 이전 하위 페이지는 삭제
+        if page_id and RENDER_MODE == 'child_pages':
+            remove_stale_child_pages(confluence_client, page_id, page_title, [child_title for child_title, _ in child_pages])
+        if page_id and child_pages:
+            if config.get('http', {}).get('backend') == 'async':
+                publish_child_pages_async(config, review_space_key, page_id, child_pages)
+            else:
+                for child_title, child_content in child_pages:
+                    publish_confluence_page(confluence_client, review_space_key, page_id, child_title, child_content)
+    return
 
+class StatsSnapshotParser(HTMLParser):
+    """점유율 페이지 HTML 파서
+    브라우저 없이 받아온 HTML에서 '.stats-snapshot' 테이블과 '#embed-code' 값을 추출합니다.
 
-    # 데이터 통합 및 최종 필터링
-    # DataFrame 컬럼 통일: ['score', 'content', 'date', 'source']
-    review_df = pd.DataFrame(all_reviews, columns=['score', 'content', 'date', 'source'])
-    filtered_df = review_df[review_df['date'] <= END_DATE]
+    Notes:
+        # 1. Selenium으로 추출하던 항목(tfoot 캡션, tbody의 th 텍스트, td > span.count 값)과 동일한 항목을 추출합니다.
+        # 2. 표준 라이브러리 html.parser만 사용하므로 추가 패키지 설치가 필요하지 않습니다.
+    """
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.caption = ""
+        self.rows = []
+        self.embed_code = None
+        self._table_depth = 0
+        self._section = None
+        self._row = None
+        self._cell = None
+        self._buffer = []
+        self._in_embed_textarea = False
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        class_names = (attrs.get('class') or "").split()
+
+        if tag in ('input', 'textarea') and attrs.get('id') == 'embed-code':
+            if tag == 'input':
+                self.embed_code = attrs.get('value') or ""
+            else:
+                self._in_embed_textarea = True
+                self.embed_code = ""
+            return
+
+        if tag == 'table':
+            if self._table_depth:
+                self._table_depth += 1
+            elif 'stats-snapshot' in class_names:
+                self._table_depth = 1
+            return
+
+        if not self._table_depth:
+            return
+
+        if tag in ('tfoot', 'tbody'):
+            self._section = tag
+        elif tag == 'tr' and self._section == 'tbody':
+            self._row = {'item': "", 'share': None}
+        elif tag == 'th' and self._row is not None:
+            self._cell = 'th'
+            self._buffer = []
+        elif tag == 'span' and self._row is not None and 'count' in class_names:
+            self._cell = 'count'
+            self._buffer = []
+
+    def handle_data(self, data):
+        if self._in_embed_textarea:
+            self.embed_code += data
+        elif self._table_depth and self._section == 'tfoot':
+            self.caption += data
+        elif self._cell:
+            self._buffer.append(data)
+
+    def handle_endtag(self, tag):
+        if tag == 'textarea' and self._in_embed_textarea:
+            self._in_embed_textarea = False
+            return
+
+        if not self._table_depth:
+            return
+
+        if tag == 'table':
+            self._table_depth -= 1
+            if not self._table_depth:
+                self._section = None
+        elif tag in ('tfoot', 'tbody'):
+            self._section = None
+        elif tag == 'th' and self._cell == 'th':
+            self._row['item'] = " ".join("".join(self._buffer).split())
+            self._cell = None
+        elif tag == 'span' and self._cell == 'count':
+            self._row['share'] = "".join(self._buffer).strip()
+            self._cell = None
+        elif tag == 'tr' and self._row is not None:
+            if self._row['item'] and self._row['share']:
+                self.rows.append((self._row['item'], self._row['share']))
+            self._row = None
+
+def parse_stats_snapshot(page_html):
+    """점유율 페이지 HTML을 파싱하는 함수
+    HTTP로 받아온 점유율 페이지 HTML에서 통계 테이블과 임베드 코드를 추출합니다.
 
-    filtered_count = len(filtered_df)
+    Args:
+        page_html: 점유율 페이지의 HTML 문자열
 
-    # print(f"{START_DATE.strftime('%Y년 %m월')} 최종 통합 리뷰 수: {filtered_count}")
+    Returns:
+        table_caption: 통계 테이블의 캡션(tfoot) 텍스트
+        temp_versions: 항목 이름 리스트
+        temp_shares: 항목별 점유율(float) 리스트
+        embed_code_value: '#embed-code'에 저장된 임베드 코드 (없으면 None)
 
-    if filtered_df.empty:
-        print("수집된 리뷰가 없어 페이지 작성을 건너뜁니다.")
-        return
+    Raises:
+        ValueError: 통계 테이블을 찾을 수 없는 경우 발생합니다.
+    """
+    parser = StatsSnapshotParser()
+    parser.feed(page_html)
+    parser.close()
 
-    # CSV 파일 작성
-    csv_filename = f"reviews_{START_DATE.strftime('%Y%m')}.csv"
-    filtered_df.to_csv(csv_filename, index=True, encoding='utf-8')
-    # print(f"CSV 파일 작성 완료: {csv_filename}")
+    if not parser.rows:
+        raise ValueError("stats-snapshot 테이블을 찾을 수 없습니다.")
 
-    # HTML 변환
-    html_table = filtered_df.to_html(index=False, classes="confluenceTable", escape=False)
+    temp_versions = [item for item, _ in parser.rows]
+    temp_shares = [float(share) for _, share in parser.rows]
+    table_caption = "\n".join(line.strip() for line in parser.caption.strip().splitlines() if line.strip())
+    return table_caption, temp_versions, temp_shares, parser.embed_code
 
-    # 컨플루언스 내용 구성
-    page_title = f"[App Review] {START_DATE.strftime('%Y-%m')}"
+def caption_matches_month(table_caption, yyyymm):
+    """통계 테이블의 캡션이 지정한 연월의 데이터인지 확인하는 함수
+    브라우저 없이 받아온 페이지는 URL의 '#monthly-...' 기간이 적용되지 않으므로, 캡션으로 기준 월을 검증합니다.
 
-    storage_format_content = f"""
-    <h2>{START_DATE.strftime('%Y년 %m월')} 통합 앱 리뷰 보고서입니다. </h2>
-    <p>수집 플랫폼: Google Play Store</p>
-    <p>수집 기간: {START_DATE.strftime('%Y-%m-%d')} ~ {END_DATE.strftime('%Y-%m-%d')}</p>
-    <p>작성된 시간: {strftime('%Y-%m-%d %H:%M:%S')}</p>
+    Args:
+        table_caption: 통계 테이블의 캡션 텍스트
+        yyyymm: 기준 연월 ("YYYYMM")
 
-    <h3>지난달 리뷰 목록 (총 {filtered_count}건)</h3>
+    Returns:
+        Boolean(True/False): 캡션에 기준 연도와 월 이름이 모두 포함되어 있으면 True를 리턴합니다.
+    """
+    year, month = yyyymm[:4], int(yyyymm[4:])
+    month_names = {calendar.month_name[month], calendar.month_abbr[month]}
+    if month == 9:
+        month_names.add("Sept")
+
+    if year not in table_caption:
+        return False
+    return any(re.search(rf"\b{name}\b", table_caption) for name in month_names)
 
-    {html_table}
+def fetch_stats_snapshot_http(session, url, last_month_yyyymm):
+    """점유율 데이터를 HTTP 요청으로 수집하는 함수
+    브라우저를 실행하지 않고 페이지 HTML을 요청하여 통계 테이블과 임베드 코드를 추출합니다.
+
+    Args:
+        session: HTTP 요청에 사용할 requests.Session 객체
+        url: 크롤링 대상 페이지 URL
+        last_month_yyyymm: 기준 연월 ("YYYYMM")
+
+    Returns:
+        parse_stats_snapshot()과 동일한 형태의 튜플을 리턴합니다.
+
+    Raises:
+        ValueError: 응답에 기준 월의 통계 테이블 또는 임베드 코드가 없는 경우 발생합니다.
     """
+    resp = session.get(url, timeout=HTTP_TIMEOUT)
+    resp.raise_for_status()
 
-    # 페이지 작성 호출
-    page_id = create_confluence_page(confluence_client, review_space_key, review_parent_id, page_title, storage_format_content)
+    table_caption, temp_versions, temp_shares, embed_code_value = parse_stats_snapshot(resp.text)
+    if not caption_matches_month(table_caption, last_month_yyyymm):
+        raise ValueError(f"기준 월({last_month_yyyymm})의 데이터가 아닙니다: {table_caption}")
+    if not embed_code_value:
+        raise ValueError("embed-code 값을 찾을 수 없습니다.")
 
-    if page_id:
-        # CSV 파일 첨부 및 로컬 파일 삭제
-        attach_csv_to_page(confluence_client, page_id, csv_filename)
-    return
+    # 기간이 지정되지 않은 페이지의 임베드 코드는 기본 차트 기준이므로, 브라우저에서 조회한 것과 같은 월간 막대 차트로 맞춥니다.
+    periode = f"{last_month_yyyymm}-{last_month_yyyymm}"
+    embed_code_value = re.sub(r"monthly-\d{6}-\d{6}-[a-z]+", f"monthly-{periode}-bar", embed_code_value)
+    return table_caption, temp_versions, temp_shares, embed_code_value
+
+def fetch_stats_snapshot_selenium(driver, url):
+    """점유율 데이터를 셀레니움으로 수집하는 함수
+    HTTP 수집에 실패한 경우 브라우저로 페이지에 진입하여 통계 테이블과 임베드 코드를 추출합니다.
+
+    Args:
+        driver: 셀레니움을 실행할 웹드라이버 객체
+        url: 크롤링 대상 페이지 URL
+
+    Returns:
+        parse_stats_snapshot()과 동일한 형태의 튜플을 리턴합니다.
+    """
+    from selenium.webdriver.common.by import By
+
+    driver.get(url)
+    time.sleep(3)
+
+    temp_versions = []
+    temp_shares = []
+
+    # 1. 통계 테이블 데이터 추출 (파싱)
+    stats_table_element = driver.find_element(By.CLASS_NAME, 'stats-snapshot')
+    table_caption = stats_table_element.find_element(By.TAG_NAME, 'tfoot').text
+    data_rows = stats_table_element.find_elements(By.XPATH, './/tbody/tr')
+
+    for row in data_rows:
+        item = row.find_element(By.TAG_NAME, 'th').text
+        share_span = row.find_element(By.CSS_SELECTOR, 'td > span.count')
+        temp_versions.append(item)
+        temp_shares.append(float(share_span.text))
+
+    # 2. 임베드 코드 추출
+    embed_code_value = driver.find_element(By.XPATH, '//*[@id="embed-code"]').get_attribute('value')
+    return table_caption, temp_versions, temp_shares, embed_code_value
 
-def crawl_data(driver, crawling_target_url):
+def crawl_data(get_driver, crawling_target_url, fetch_backend="auto"):
     """타겟 웹사이트에서 필요한 데이터를 크롤링하고 HTML로 전환하는 함수
     각 url에 진입하여 점유율 데이터를 크롤링하고, 페이지 작성을 위한 HTML과 테이블 아이디, CSV 파일이름을 리턴합니다.
 
     Args:
-        driver: 셀레니움을 실행할 웹드라이버 객체
+        get_driver: 셀레니움 웹드라이버를 리턴하는 함수 (HTTP 수집에 실패한 경우에만 호출됩니다.)
         crawling_target_url: "confluence_config.json"에 저장된 크롤링 대상이 되는 웹페이지
+        fetch_backend: 수집 방식, Default "auto"
+            - "auto": HTTP로 먼저 수집하고, 실패한 경로만 셀레니움으로 다시 수집합니다.
+            - "http": HTTP로만 수집합니다. (브라우저가 없는 환경)
+            - "selenium": 기존처럼 셀레니움으로만 수집합니다.
 
     Returns:
         full_report_html: 페이지에 첨부할 본문의 HTML을 리턴합니다.
@@ -376,39 +1451,36 @@ def crawl_data(driver, crawling_target_url):
     # CSV 저장을 위한 데이터 수집 리스트 초기화
     csv_data = []
 
+    session = None
+    if fetch_backend != "selenium":
+        import requests
+        session = requests.Session()
+        session.headers.update({"User-Agent": HTTP_USER_AGENT})
+
     for path in PATH_LIST:
         URL = f"{crawling_target_url}{path}south-korea/#monthly-{periode}-bar"
-        driver.get(URL)
-        time.sleep(3)
 
         current_table_id = f"stats-table-{path.split('/')[0]}"
         if first_table_id is None:
             first_table_id = current_table_id
 
-        data_success = False
-        temp_versions = []
-        temp_shares = []
-        table_caption = ""
-
         try:
-            # 1. 통계 테이블 데이터 추출 (파싱)
-            stats_table_element = driver.find_element(By.CLASS_NAME, 'stats-snapshot')
-            table_caption = stats_table_element.find_element(By.TAG_NAME, 'tfoot').text
-            data_rows = stats_table_element.find_elements(By.XPATH, './/tbody/tr')
-
-            for row in data_rows:
-                item = row.find_element(By.TAG_NAME, 'th').text
-                share_span = row.find_element(By.CSS_SELECTOR, 'td > span.count')
-                share_value = float(share_span.text)
-
-                temp_versions.append(item)
-                temp_shares.append(share_value)
-
-                data_source = path.split('/')[0]
-                for version, share_value in zip(temp_versions, temp_shares):
-                    csv_data.append([data_source, version, share_value])
-
-            data_success = True
+            snapshot = None
+            if session is not None:
+                try:
+                    snapshot = fetch_stats_snapshot_http(session, URL, last_month_yyyymm)
+                except Exception as e:
+                    if fetch_backend == "http":
+                        raise
+                    print(f"HTTP 수집 실패 ({path}): {e}. 셀레니움으로 다시 수집합니다.")
+
+            if snapshot is None:
+                driver = get_driver()
+                if driver is None:
+                    raise RuntimeError("WebDriver를 사용할 수 없습니다.")
+                snapshot = fetch_stats_snapshot_selenium(driver, URL)
+
+            table_caption, temp_versions, temp_shares, embed_code_value = snapshot
 
         except Exception as e:
             print(f"크롤링 실패 ({path}): {e}. 테이블 작성 스킵.")
@@ -416,33 +1488,35 @@ def crawl_data(driver, crawling_target_url):
             full_report_html += f"<p>데이터 로드 오류: {e}</p>"
             continue
 
-        if data_success:
-            # Others 항목 계산 및 추가 (100% 맞추기)
-            total_crawled_share = sum(temp_shares)
-            remaining_share = 100.0 - total_crawled_share
-            if remaining_share > 0:
-                others_share = round(remaining_share, 2)
-                temp_versions.append('기타(Others)')
-                temp_shares.append(others_share)
-
-            # 테이블 HTML 구성 (항목/점유율 행렬 변환)
-            item_cells = "".join([f"<td>{v}</td>" for v in temp_versions])
-            item_row = f"<tr><th>항목</th>{item_cells}</tr>"
-            share_cells = "".join([f"<td>{s:.2f}%</td>" for s in temp_shares])
-            share_row = f"<tr><th>점유율(%)</th>{share_cells}</tr>"
-            col_count = len(temp_versions) + 1
-
-            transposed_table_html = f"""<table id='{current_table_id}' class="confluenceTable" border="1" style="width:100%; text-align:center;">
-                <thead><tr><th colspan="{col_count}" style="text-align:left; background-color:#f0f0f0; padding: 10px;">{table_caption}</th></tr></thead>
-                <tbody>{item_row}{share_row}</tbody></table>"""
+        data_source = path.split('/')[0]
+        csv_data.extend([data_source, version, share_value] for version, share_value in zip(temp_versions, temp_shares))
 
-            full_report_html += f"<h2>{path.replace('-market-share/', '').replace('/', ' ').strip().upper()}</h2>"
-            full_report_html += transposed_table_html
+        # Others 항목 계산 및 추가 (100% 맞추기)
+        total_crawled_share = sum(temp_shares)
+        remaining_share = 100.0 - total_crawled_share
+        if remaining_share > 0:
+            others_share = round(remaining_share, 2)
+            temp_versions.append('기타(Others)')
+            temp_shares.append(others_share)
+
+        # 테이블 HTML 구성 (항목/점유율 행렬 변환)
+        item_cells = "".join([f"<td>{v}</td>" for v in temp_versions])
+        item_row = f"<tr><th>항목</th>{item_cells}</tr>"
+        share_cells = "".join([f"<td>{s:.2f}%</td>" for s in temp_shares])
+        share_row = f"<tr><th>점유율(%)</th>{share_cells}</tr>"
+        col_count = len(temp_versions) + 1
 
-            # 임베드 코드 추출 및 추가
-            embed_code_value = driver.find_element(By.XPATH, '//*[@id="embed-code"]').get_attribute('value')
-            full_report_html += f"<div style='margin-bottom: 30px; border: 1px solid #eee; padding: 5px;'>{html.unescape(embed_code_value)}</div>"
+        transposed_table_html = f"""<table id='{current_table_id}' class="confluenceTable" border="1" style="width:100%; text-align:center;">
+            <thead><tr><th colspan="{col_count}" style="text-align:left; background-color:#f0f0f0; padding: 10px;">{table_caption}</th></tr></thead>
+            <tbody>{item_row}{share_row}</tbody></table>"""
 
+        full_report_html += f"<h2>{path.replace('-market-share/', '').replace('/', ' ').strip().upper()}</h2>"
+        full_report_html += transposed_table_html
+
+        # 임베드 코드 추가
+        full_report_html += f"<div style='margin-bottom: 30px; border: 1px solid #eee; padding: 5px;'>{html.unescape(embed_code_value)}</div>"
+
+    import pandas as pd
     share_df = pd.DataFrame(csv_data, columns=['Source', 'Item', 'Share (%)'])
     csv_filename = f"market_share_{get_last_month_info()}.csv"
     share_df.to_csv(csv_filename, index=False, encoding='utf-8')
@@ -450,25 +1524,47 @@ def crawl_data(driver, crawling_target_url):
     # print(f"총 {len(PATH_LIST)}개 경로 크롤링 완료.")
     return full_report_html, first_table_id, csv_filename
 
-def crawl_market_share(driver, config):
+def crawl_market_share(config, confluence_client, driver=None, driver_provider=None):
     """웹페이지를 크롤링하여 점유율 페이지를 작성하는 함수
     "confluence_config.json"에 있는 정보를 바탕으로 해당 웹페이지에서 점유율 데이터를 수집하고 페이지를 작성합니다.
 
     Args:
         config: "confluence_config.json" 파일의 데이터
         confluence_client: 점유율 페이지 작성에 필요한 Confluence 데이터
+        driver: 셀레니움 웹드라이버 객체, Default None (HTTP 수집에 실패한 경우에만 새로 초기화합니다.)
+        driver_provider: 웹드라이버를 리턴하는 함수, Default None (스케줄러처럼 드라이버를 재사용하는 경우에 지정하며, 종료는 호출한 쪽에서 담당합니다.)
 
     Notes:
         # 1. 이 함수가 실행되면, 각 웹페이지에서 점유율을 크롤링해서 페이지가 작성됩니다.
         # 2. 페이지 작성이 완료되면, CSV 파일을 첨부합니다.
+        # 3. 수집 방식은 "market_share_config"의 "fetch_backend" 값으로 지정합니다. (auto/http/selenium, Default auto)
+        # 4. 프로파일링 모드에서는 크롤링(crawl, Selenium 포함)과 게시(publish) 단계를 나누어 측정합니다.
     """
 
     crawling_target_url = config['market_share_config']['target_url']
     share_space_key = config['market_share_config']['space_key']
     share_parent_id = config['market_share_config']['parent_page_id']
+    fetch_backend = config['market_share_config'].get('fetch_backend', 'auto')
+
+    # 웹드라이버는 HTTP 수집에 실패한 경로가 있을 때만 초기화합니다.
+    created_drivers = []
+    def get_driver():
+        if driver is not None:
+            return driver
+        if driver_provider is not None:
+            return driver_provider()
+        if not created_drivers:
+            created_drivers.append(web_driver_setting(config))
+        return created_drivers[0]
 
     # 크롤링 실행 및 데이터 받기
-    crawled_html_content, first_table_id, csv_filename = crawl_data(driver, crawling_target_url)
+    try:
+        with profile_stage("crawl"):
+            crawled_html_content, first_table_id, csv_filename = crawl_data(get_driver, crawling_target_url, fetch_backend)
+    finally:
+        if created_drivers and created_drivers[0]:
+            created_drivers[0].quit()
+            print("--- WebDriver 종료 ---")
 
     if not crawled_html_content or not first_table_id:
         print("점유율 크롤링된 내용이 없거나 테이블 ID를 찾을 수 없어 페이지 작성을 건너뜁니다.")
@@ -485,10 +1581,9 @@ def crawl_market_share(driver, config):
     {crawled_html_content}
     """
 
-    page_id = create_confluence_page(confluence_client, share_space_key, share_parent_id, page_title, storage_format_content)
-    if page_id:
-        # 파일 첨부 및 로컬 파일 삭제
-        attach_csv_to_page(confluence_client, page_id, csv_filename)
+    # 페이지 작성(또는 수정) 및 파일 첨부, 로컬 파일 삭제
+    with profile_stage("publish"):
+        publish_confluence_page(confluence_client, share_space_key, share_parent_id, page_title, storage_format_content, attachments=[csv_filename])
     return
 
 # ====================================================================
@@ -500,19 +1595,36 @@ if __name__ == "__main__":
     이 스크립트 파일이 실행될때 아래 순서대로 로직을 실행합니다.
 
     # 1. 실행된 스크립트 파일의 절대 경로를 script_dir에 저장하고, CONFIG_PATH 변수에 저장합니다.
-    # 2. 이 스크립트의 주요 로직이 아래 순서대로 실행됩니다.
-        # 2-1. load_config()
-        # 2-2. initialize_confluence_client()
-        # 2-3. web_driver_setting()
-        # 2-4. scrape_reviews_store()
-        # 2-5. crawl_market_share()
+    # 2. 하위 명령에 따라 작성할 보고서를 선택합니다. (하위 명령이 없으면 "all")
+        # reviews: 스토어 리뷰 보고서만 작성합니다. (Selenium/webdriver_manager를 로드하지 않습니다.)
+        # market-share: 점유율 보고서만 작성합니다. (google_play_scraper를 로드하지 않습니다.)
+        # all: 리뷰 보고서와 점유율 보고서를 순서대로 작성합니다.
+    # 3. 이 스크립트의 주요 로직이 아래 순서대로 실행됩니다.
+        # 3-1. load_config()
+        # 3-2. initialize_confluence_client()
+        # 3-3. scrape_reviews_store()
+        # 3-4. crawl_market_share() (HTTP 수집에 실패한 경우에만 web_driver_setting() 호출)
+    # 4. --profile-stages 옵션(또는 QA_REPORT_PROFILE 환경변수)을 사용하면 실행이 끝난 후 단계별 프로파일 결과를 저장하고 상위 함수 목록을 출력합니다.
     """
 
     script_dir = os.path.dirname(os.path.abspath(__file__)) # 이 스크립트 파일이 위치한 디렉토리의 절대경로
     CONFIG_PATH = os.path.join(script_dir, "confluence_config.json") # "{script_dir}\confluence_config.json"의 형태로 운영체제에 맞게 파일경로를 작성
 
+    parser = argparse.ArgumentParser(description="Confluence 월간 보고서 작성", allow_abbrev=False)  # 축약 옵션(--profile)을 허용하지 않습니다.
+    parser.add_argument("--config", default=CONFIG_PATH, help="설정 파일 경로 (기본 confluence_config.json)")
+    parser.add_argument("--profile-stages", nargs="?", const=True, default=None, metavar="DIR", help="단계별 성능 프로파일링 사용 (결과 디렉토리, 기본 ./profiles/<실행 시각>, 보고서 프로필과 무관)")
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.add_parser("reviews", help="스토어 리뷰 보고서만 작성")
+    subparsers.add_parser("market-share", help="점유율 보고서만 작성")
+    subparsers.add_parser("all", help="리뷰 보고서와 점유율 보고서를 모두 작성 (기본값)")
+    args = parser.parse_args()
+    command = args.command or "all"
+
+    if args.profile_stages:
+        load_stage_profiler().enable_profiling(args.profile_stages)
+
     # 설정 저장
-    config = load_config(CONFIG_PATH)
+    config = load_config(args.config)
 
     if config is None:
         exit()
@@ -523,21 +1635,13 @@ if __name__ == "__main__":
     if confluence_client is None:
         exit()
 
-    # 웹 드라이버 초기화 (점유율 크롤링에 필요)
-    driver = web_driver_setting()
-
     # 리뷰 보고서 작성 (통합 함수 호출)
-    page_id_review = scrape_reviews_store(config, confluence_client)
-    if page_id_review:
-        pass
+    if command in ("reviews", "all"):
+        page_id_review = scrape_reviews_store(config, confluence_client)
 
-    # 점유율 보고서 작성 (드라이버가 초기화된 경우에만 실행)
-    if driver:
-        result = crawl_market_share(driver, config)
-
-        driver.quit()
-        print("--- WebDriver 종료 ---")
-    else:
-        print("WebDriver 초기화 실패로 시장 점유율 보고서 작성을 건너뜁니다.")
+    # 점유율 보고서 작성 (웹드라이버는 필요한 경우에만 초기화됩니다.)
+    if command in ("market-share", "all"):
+        result = crawl_market_share(config, confluence_client)
 
     print("\n\n=== 모든 보고서 작성 프로세스 완료 ===")
+    load_stage_profiler().finish_profiling()
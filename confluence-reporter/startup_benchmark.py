@@ -0,0 +1,79 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+"""confluence_report.py의 시작(import) 시간을 "python -X importtime"으로 측정하고, 기준을 넘으면 실패합니다.
+
+Notes:
+    # 1. 모듈을 import하는 것만으로 pandas, selenium 등 무거운 라이브러리가 로드되지 않는지 확인합니다.
+    # 2. 여러 번 측정한 누적 import 시간의 중앙값이 "--budget-ms"를 넘으면 종료 코드 1을 리턴합니다. (CI 또는 배포 전 점검용)
+    # 3. 무거운 라이브러리는 각 보고서 함수 안에서 import되므로, 하위 명령(reviews, market-share)을 실행할 때에만 로드됩니다.
+"""
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+TARGET_MODULE = "confluence_report"
+DEFAULT_BUDGET_MS = 150  # 모듈 import 누적 시간 기준 (무거운 라이브러리 없이 측정 시 수십 ms)
+DEFAULT_REPEAT = 5
+
+# 모듈 import 시점에 로드되면 안 되는 라이브러리 (각 보고서 경로에서만 로드)
+LAZY_MODULES = ["pandas", "numpy", "selenium", "webdriver_manager", "google_play_scraper", "app_store_scraper", "atlassian", "requests"]
+
+def measure_import(module_name=TARGET_MODULE):
+    """모듈을 새 인터프리터에서 한 번 import하고, -X importtime 출력을 파싱합니다.
+
+    Returns:
+        (total_us, imports): 대상 모듈의 누적 import 시간(us)과 {모듈명: (self_us, cumulative_us)} 딕셔너리를 리턴합니다.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        cwd=script_dir, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{module_name} import 실패:\n{result.stderr[-2000:]}")
+
+    imports = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        imports[name.strip()] = (int(self_us), int(cumulative_us))
+    return imports[module_name][1], imports
+
+def run_benchmark(repeat=DEFAULT_REPEAT, budget_ms=DEFAULT_BUDGET_MS, top_n=10):
+    """import 시간을 여러 번 측정해서 결과를 출력하고, 기준 통과 여부를 리턴합니다."""
+    totals = []
+    imports = {}
+    for _ in range(repeat):
+        total_us, imports = measure_import()
+        totals.append(total_us)
+
+    median_ms = statistics.median(totals) / 1000
+    print(f"{TARGET_MODULE} import 시간 (중앙값, {repeat}회): {median_ms:.1f} ms (기준 {budget_ms} ms)")
+
+    print(f"\n 누적 import 시간 상위 {top_n}개 (마지막 측정 기준)")
+    dependencies = {name: times for name, times in imports.items() if name != TARGET_MODULE}
+    for name, (self_us, cumulative_us) in sorted(dependencies.items(), key=lambda item: -item[1][1])[:top_n]:
+        print(f"  {name:<40} {cumulative_us / 1000:>8.1f} ms")
+
+    passed = True
+    loaded = [name for name in LAZY_MODULES if name in imports]
+    if loaded:
+        print(f"\n❌ import 시점에 로드되면 안 되는 라이브러리가 로드되었습니다: {', '.join(loaded)}")
+        passed = False
+    if median_ms > budget_ms:
+        print(f"\n❌ import 시간이 기준을 초과했습니다: {median_ms:.1f} ms > {budget_ms} ms")
+        passed = False
+    if passed:
+        print("\n✅ 시작 시간 기준 통과")
+    return passed
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="confluence_report.py 시작 시간 측정 (python -X importtime)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help=f"측정 횟수 (기본 {DEFAULT_REPEAT})")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help=f"허용 import 시간 ms (기본 {DEFAULT_BUDGET_MS})")
+    args = parser.parse_args()
+
+    if not run_benchmark(args.repeat, args.budget_ms):
+        sys.exit(1)
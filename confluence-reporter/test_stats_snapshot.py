@@ -0,0 +1,96 @@
+"""
+test_stats_snapshot.py
+- 저장된 StatCounter 페이지(fixtures/)로 점유율 HTTP 수집 파서와 셀레니움 대체 동작을 확인합니다.
+- 실행: python -m pytest confluence-reporter 또는 python -m unittest (requests, pandas 필요)
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPT_DIR)
+import confluence_report
+
+FIXTURE_PATH = os.path.join(SCRIPT_DIR, "fixtures", "statcounter_android_version_2026_09.html")
+FIXTURE_MONTH = "202609"
+
+def load_fixture():
+    with open(FIXTURE_PATH, "r", encoding="utf-8") as f:
+        return f.read()
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+    def raise_for_status(self):
+        pass
+
+class StatsSnapshotParserTest(unittest.TestCase):
+
+    def test_parse_fixture(self):
+        table_caption, versions, shares, embed_code = confluence_report.parse_stats_snapshot(load_fixture())
+        self.assertEqual(table_caption, "Mobile Android Version Market Share South Korea\n- Sept 2026")
+        self.assertEqual(versions, ["15.0", "14.0", "13.0", "16.0", "12.0", "Other"])
+        self.assertEqual(shares, [41.87, 27.35, 12.08, 9.6, 4.51, 4.59])
+        self.assertTrue(embed_code.startswith('<iframe src="https://gs.statcounter.com/android-version-market-share/'))
+        self.assertIn("#monthly-202510-202609-line", embed_code)
+
+    def test_parse_without_table(self):
+        with self.assertRaises(ValueError):
+            confluence_report.parse_stats_snapshot("<html><body><p>blocked</p></body></html>")
+
+    def test_caption_matches_month(self):
+        table_caption = confluence_report.parse_stats_snapshot(load_fixture())[0]
+        self.assertTrue(confluence_report.caption_matches_month(table_caption, FIXTURE_MONTH))
+        self.assertFalse(confluence_report.caption_matches_month(table_caption, "202608"))
+        self.assertFalse(confluence_report.caption_matches_month(table_caption, "202509"))
+
+    def test_http_snapshot_uses_monthly_bar_embed(self):
+        session = mock.Mock(get=mock.Mock(return_value=FakeResponse(load_fixture())))
+        snapshot = confluence_report.fetch_stats_snapshot_http(session, "https://example.com/", FIXTURE_MONTH)
+        self.assertIn("#monthly-202609-202609-bar", snapshot[3])
+
+        with self.assertRaises(ValueError):
+            confluence_report.fetch_stats_snapshot_http(session, "https://example.com/", "202608")
+
+class CrawlFallbackTest(unittest.TestCase):
+    # 캡션의 기준 월이 다르면 auto 모드는 셀레니움으로 다시 수집하고, http 모드는 오류 구간으로 작성합니다.
+
+    def crawl(self, last_month, fetch_backend):
+        selenium_snapshot = ("Selenium caption", ["A"], [60.0], "<iframe></iframe>")
+        get_driver = mock.Mock(return_value=object())
+        current_dir = os.getcwd()
+        with tempfile.TemporaryDirectory() as workdir, \
+                mock.patch("requests.Session.get", return_value=FakeResponse(load_fixture())), \
+                mock.patch.object(confluence_report, "get_last_month_info", return_value=last_month), \
+                mock.patch.object(confluence_report, "fetch_stats_snapshot_selenium", return_value=selenium_snapshot) as selenium:
+            os.chdir(workdir)
+            try:
+                full_report_html, _, _ = confluence_report.crawl_data(get_driver, "https://example.com/", fetch_backend)
+            finally:
+                os.chdir(current_dir)
+        return full_report_html, get_driver, selenium
+
+    def test_matching_month_does_not_start_browser(self):
+        full_report_html, get_driver, selenium = self.crawl(FIXTURE_MONTH, "auto")
+        get_driver.assert_not_called()
+        selenium.assert_not_called()
+        self.assertIn("<td>41.87%</td>", full_report_html)
+
+    def test_caption_mismatch_falls_back_to_selenium(self):
+        full_report_html, get_driver, selenium = self.crawl("202610", "auto")
+        self.assertEqual(selenium.call_count, 10)
+        self.assertIn("Selenium caption", full_report_html)
+        self.assertNotIn("41.87%", full_report_html)
+
+    def test_caption_mismatch_http_only(self):
+        full_report_html, get_driver, selenium = self.crawl("202610", "http")
+        get_driver.assert_not_called()
+        selenium.assert_not_called()
+        self.assertIn("데이터 로드 오류", full_report_html)
+
+if __name__ == "__main__":
+    unittest.main()
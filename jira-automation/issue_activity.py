@@ -0,0 +1,194 @@
+"""
+issue_activity.py
+- 이슈별 "마지막 실제 활동" 시각 계산 (봇 계정/자동 동기화 필드 변경 제외)
+- 변경 이력은 POST /rest/api/3/changelog/bulkfetch로 한 번에 최대 1000개 이슈씩 조회
+- 배치는 스레드 풀로 병렬 조회, 결과는 이슈별로 캐시 (이슈의 updated 값이 같으면 다시 조회하지 않음)
+- 마지막 활동 = 사람이 작성한 변경 이력, 사람이 작성/수정한 코멘트 중 가장 최근 시각 (없으면 생성 시각)
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import requests
+
+BULK_CHANGELOG_MAX_ISSUES = 1000  # bulkfetch 요청 하나에 넣을 수 있는 최대 이슈 수
+RATE_LIMIT_RETRIES = 3
+
+DEFAULT_ACTIVITY_CONFIG = {
+    "bot_account_ids": [],            # 활동에서 제외할 계정 accountId (자동화 계정, 연동 봇 등)
+    "bot_account_types": ["app"],     # 활동에서 제외할 계정 유형 (Jira Cloud의 앱/연동 계정은 "app")
+    "ignored_fields": ["Rank", "Sprint", "RemoteIssueLink", "Link", "timeestimate", "timespent", "WorklogId"],  # 변경되어도 활동으로 보지 않는 필드 (field 또는 fieldId)
+    "batch_size": BULK_CHANGELOG_MAX_ISSUES,
+    "workers": 4,
+    "cache_path": "issue_activity_cache.json"
+}
+
+JIRA_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
+
+# 같은 프로세스에서 동시에 실행되는 보고서 프로필이 캐시 파일을 읽고 병합해서 저장하는 구간을 하나씩 실행합니다.
+ACTIVITY_CACHE_LOCK = threading.Lock()
+
+def parse_jira_time(value):
+    # "2024-01-02T10:00:00.000+0900" 형식의 Jira 시각을 timezone 정보가 있는 datetime으로 변환합니다.
+    return datetime.strptime(value, JIRA_TIME_FORMAT) if value else None
+
+# =====================================
+# 캐시
+# =====================================
+def load_activity_cache(cache_path):
+    # {이슈 키: {"updated": 이슈 updated 값, "last_activity": 마지막 활동 시각}} 형식입니다.
+    if not cache_path or not os.path.exists(cache_path):
+        return {}
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"활동 캐시 로드 실패 (새로 계산합니다): {e}")
+        return {}
+
+def save_activity_cache(cache_path, entries):
+    # 이번 실행에서 계산한 항목(entries)을 저장 시점의 캐시 파일에 병합해서 저장합니다.
+    # 다른 프로필이 먼저 저장한 항목이 처음 불러온 캐시로 덮어써지지 않도록, 잠금 안에서 파일을 다시 읽습니다.
+    if not cache_path or not entries:
+        return
+    with ACTIVITY_CACHE_LOCK:
+        cache = load_activity_cache(cache_path)
+        cache.update(entries)
+        temp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp" # 다른 프로세스와 임시 파일이 겹치지 않도록 합니다.
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, ensure_ascii=False)
+        os.replace(temp_path, cache_path)
+
+# =====================================
+# 활동 판정
+# =====================================
+def is_bot_author(author, activity_conf):
+    # 작성자 정보가 없으면(시스템 변경) 봇으로 봅니다.
+    if not author:
+        return True
+    return (
+        author.get("accountId") in activity_conf["bot_account_ids"]
+        or author.get("accountType") in activity_conf["bot_account_types"]
+    )
+
+def is_meaningful_history(history, activity_conf):
+    # 사람이 작성했고, 무시할 필드 외의 변경 항목이 하나라도 있는 이력인지 확인합니다.
+    if is_bot_author(history.get("author"), activity_conf):
+        return False
+    ignored = set(activity_conf["ignored_fields"])
+    return any(item.get("field") not in ignored and item.get("fieldId") not in ignored for item in history.get("items", []))
+
+def compute_last_activity(issue, histories, activity_conf):
+    """이슈 하나의 마지막 실제 활동 시각을 계산합니다.
+
+    Args:
+        issue: /search/jql 응답의 이슈 (fields에 created, comment 포함)
+        histories: 이슈의 변경 이력 리스트 (bulkfetch 응답의 changeHistories)
+        activity_conf: DEFAULT_ACTIVITY_CONFIG와 같은 키를 가진 설정
+
+    Returns:
+        last_activity: timezone 정보가 있는 datetime (변경 이력/코멘트가 모두 봇이면 생성 시각)
+    """
+    fields = issue.get("fields", {})
+    candidates = [parse_jira_time(history.get("created")) for history in histories if is_meaningful_history(history, activity_conf)]
+    for comment in fields.get("comment", {}).get("comments", []):
+        if not is_bot_author(comment.get("updateAuthor") or comment.get("author"), activity_conf):
+            candidates.append(parse_jira_time(comment.get("updated") or comment.get("created")))
+    candidates = [candidate for candidate in candidates if candidate]
+    return max(candidates) if candidates else parse_jira_time(fields.get("created"))
+
+# =====================================
+# 변경 이력 일괄 조회
+# =====================================
+def fetch_changelogs(session, jira_conf, issue_ids):
+    """bulkfetch API로 여러 이슈의 변경 이력을 조회합니다.
+
+    Args:
+        session: requests.Session 객체
+        jira_conf: 설정 파일의 "jira" 데이터
+        issue_ids: 이슈 아이디(또는 키) 리스트 (최대 1000개)
+
+    Returns:
+        changelogs: {이슈 아이디: 변경 이력 리스트}, 조회에 실패하면 None
+    """
+    url = f"{jira_conf['base_url']}/rest/api/3/changelog/bulkfetch"
+    auth = (jira_conf["email"], jira_conf["api_token"])
+    payload = {"issueIdsOrKeys": list(issue_ids), "maxResults": 1000}
+    changelogs = {}
+
+    while True:
+        resp = session.post(url, auth=auth, json=payload)
+        for _ in range(RATE_LIMIT_RETRIES):
+            if resp.status_code != 429:
+                break
+            time.sleep(float(resp.headers.get("Retry-After") or 1))
+            resp = session.post(url, auth=auth, json=payload)
+        if resp.status_code != 200:
+            print(f"변경 이력 조회 실패: {resp.status_code}\n{resp.text[:500]}")
+            return None
+
+        data = resp.json()
+        for changelog in data.get("issueChangeLogs", []):
+            changelogs.setdefault(str(changelog.get("issueId")), []).extend(changelog.get("changeHistories", []))
+        if not data.get("nextPageToken"):
+            return changelogs
+        payload["nextPageToken"] = data["nextPageToken"]
+
+def resolve_last_activity(issues, jira_conf, activity_conf=None, session=None):
+    """여러 이슈의 마지막 실제 활동 시각을 한 번에 계산합니다.
+
+    Args:
+        issues: /search/jql 응답의 이슈 리스트 (id, key, fields.updated, fields.created, fields.comment 필요)
+        jira_conf: 설정 파일의 "jira" 데이터
+        activity_conf: 설정 파일의 "activity" 데이터, Default None (DEFAULT_ACTIVITY_CONFIG 사용)
+        session: requests.Session 객체, Default None (새 세션 사용)
+
+    Returns:
+        activities: {이슈 키: 마지막 활동 datetime}
+
+    Notes:
+        # 1. 캐시에 같은 updated 값으로 저장된 이슈는 변경 이력을 다시 조회하지 않습니다. (updated가 바뀌지 않았으면 활동도 바뀌지 않음)
+        # 2. 변경 이력 조회에 실패한 배치의 이슈는 결과에서 제외되므로, 호출한 쪽에서 updated 값으로 대체할 수 있습니다.
+        # 3. 새로 계산한 항목만 저장 시점의 캐시 파일에 병합하므로, 여러 프로필이 동시에 실행되어도 서로의 캐시를 지우지 않습니다.
+    """
+    activity_conf = dict(DEFAULT_ACTIVITY_CONFIG, **(activity_conf or {}))
+    session = session or requests.Session()
+    cache_path = activity_conf["cache_path"]
+    cache = load_activity_cache(cache_path)
+
+    activities = {}
+    computed = {} # 이번 실행에서 새로 계산한 캐시 항목
+    pending = []
+    for issue in issues:
+        cached = cache.get(issue["key"])
+        if cached and cached.get("updated") == issue["fields"].get("updated"):
+            activities[issue["key"]] = parse_jira_time(cached["last_activity"])
+        else:
+            pending.append(issue)
+
+    batch_size = max(1, min(int(activity_conf["batch_size"]), BULK_CHANGELOG_MAX_ISSUES))
+    batches = [pending[start:start + batch_size] for start in range(0, len(pending), batch_size)]
+    print(f"활동 계산: 캐시 사용 {len(activities)}건, 변경 이력 조회 {len(pending)}건 ({len(batches)}개 배치)")
+
+    with ThreadPoolExecutor(max_workers=max(1, int(activity_conf["workers"]))) as executor:
+        results = executor.map(lambda batch: fetch_changelogs(session, jira_conf, [issue["id"] for issue in batch]), batches)
+        for batch, changelogs in zip(batches, results):
+            if changelogs is None:
+                continue
+            for issue in batch:
+                last_activity = compute_last_activity(issue, changelogs.get(str(issue["id"]), []), activity_conf)
+                activities[issue["key"]] = last_activity
+                computed[issue["key"]] = {
+                    "updated": issue["fields"].get("updated"),
+                    "last_activity": last_activity.strftime(JIRA_TIME_FORMAT) if last_activity else None
+                }
+
+    try:
+        save_activity_cache(cache_path, computed)
+    except OSError as e:
+        print(f"활동 캐시 저장 실패: {e}")
+    return activities
@@ -0,0 +1,107 @@
+"""
+issue_analytics.py
+- jira_report.py의 조회 결과(이슈 딕셔너리 리스트)를 timezone 정보가 있는 datetime64 컬럼의 DataFrame으로 변환
+- 경과 일수(age) 백분위수, 담당자별/우선순위별 경과 구간 분포, 우선순위별 SLA 초과 건수를 벡터 연산으로 계산
+- 결과는 이메일 본문(HTML)과 CSV 첨부 파일로 출력 (이슈 10만 건 기준 1초 미만)
+- pandas, numpy 필요 (jira_report.py에서는 "analytics" 설정을 사용할 때만 import)
+"""
+
+import numpy as np
+import pandas as pd
+
+JIRA_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
+
+DEFAULT_ANALYTICS_CONFIG = {
+    "percentiles": [0.5, 0.75, 0.9, 0.95, 0.99],
+    "age_bins": [0, 7, 14, 21, 28, 60, 90],  # 경과 일수 구간 경계 (마지막 경계 이후는 "90일 이상")
+    "sla_days": {"Highest": 3, "High": 7, "Medium": 14, "Low": 30, "Lowest": 60},  # 우선순위별 허용 미업데이트 일수
+    "top_assignees": 15  # 담당자별 분포에 표시할 최대 담당자 수 (미업데이트 이슈가 많은 순)
+}
+
+def build_issue_frame(report, now=None):
+    """이슈 리스트를 분석용 DataFrame으로 변환합니다.
+
+    Args:
+        report: jira_report.parse_jira_issues()의 결과 (updated_at, latest_comment_at에 Jira 원본 시각 포함), 구분선 행은 제외
+        now: 경과 일수 기준 시각, Default None (현재 UTC 시각)
+
+    Returns:
+        frame: key, priority, status, assignee(category), updated, latest_comment(datetime64[ns, UTC]), age_days, comment_age_days(float) 컬럼의 DataFrame
+
+    Notes:
+        # 1. 딕셔너리 리스트를 DataFrame으로 바로 만들지 않고 컬럼별 리스트로 만든 뒤, 시각은 형식을 지정해서 한 번에 파싱합니다.
+        # 2. 코멘트가 없는 이슈의 latest_comment는 NaT, comment_age_days는 NaN입니다.
+    """
+    now = pd.Timestamp(now) if now is not None else pd.Timestamp.now(tz="UTC")
+    frame = pd.DataFrame({
+        "key": [r["key"] for r in report],
+        "priority": pd.Categorical([r["priority"] for r in report]),
+        "status": pd.Categorical([r["status"] for r in report]),
+        "assignee": pd.Categorical([r["assignee"] for r in report]),
+        "updated": pd.to_datetime([r.get("updated_at") or None for r in report], format=JIRA_TIME_FORMAT, utc=True),
+        "latest_comment": pd.to_datetime([r.get("latest_comment_at") or None for r in report], format=JIRA_TIME_FORMAT, utc=True)
+    })
+    one_day = np.timedelta64(1, "D")
+    frame["age_days"] = (now - frame["updated"]) / one_day
+    frame["comment_age_days"] = (now - frame["latest_comment"]) / one_day
+    return frame
+
+def compute_aging(frame, analytics_conf=None):
+    """경과 일수 통계를 계산합니다.
+
+    Args:
+        frame: build_issue_frame()의 결과
+        analytics_conf: 설정 파일의 "analytics" 데이터, Default None (DEFAULT_ANALYTICS_CONFIG 사용)
+
+    Returns:
+        aging: {"percentiles": 백분위수 Series, "by_priority": 우선순위 × 경과 구간 DataFrame,
+                "by_assignee": 담당자 × 경과 구간 DataFrame, "sla": 우선순위별 이슈 수/SLA 초과 수 DataFrame}
+    """
+    analytics_conf = dict(DEFAULT_ANALYTICS_CONFIG, **(analytics_conf or {}))
+    bins = list(analytics_conf["age_bins"])
+    labels = [f"{low}~{high}일" for low, high in zip(bins, bins[1:])] + [f"{bins[-1]}일 이상"]
+    age_bucket = pd.cut(frame["age_days"], bins=bins + [np.inf], labels=labels, right=False)
+
+    percentiles = frame["age_days"].quantile(analytics_conf["percentiles"]).round(1)
+    percentiles.index = [f"p{round(q * 100)}" for q in percentiles.index]
+
+    by_priority = pd.crosstab(frame["priority"], age_bucket, dropna=False)
+    by_assignee = pd.crosstab(frame["assignee"], age_bucket, dropna=False)
+    by_assignee = by_assignee.loc[by_assignee.sum(axis=1).sort_values(ascending=False).index[:analytics_conf["top_assignees"]]]
+
+    # 우선순위별 SLA 일수를 벡터로 매핑하고, SLA가 정의되지 않은 우선순위는 초과 판정에서 제외합니다.
+    sla_days = frame["priority"].astype(object).map(analytics_conf["sla_days"]).astype(float)
+    breached = frame["age_days"] > sla_days
+    sla = pd.DataFrame({
+        "issues": frame.groupby("priority", observed=True).size(),
+        "sla_days": pd.Series(analytics_conf["sla_days"], dtype=float),
+        "breached": breached.groupby(frame["priority"], observed=True).sum()
+    }).dropna(subset=["issues"]).fillna({"breached": 0}).astype({"issues": int, "breached": int})
+    sla["breach_rate"] = (sla["breached"] / sla["issues"] * 100).round(1)
+
+    return {"percentiles": percentiles, "by_priority": by_priority, "by_assignee": by_assignee, "sla": sla}
+
+def format_aging_html(aging, issue_count):
+    """경과 일수 통계를 이메일 본문 HTML로 작성합니다."""
+    if issue_count == 0:
+        return ""
+    percentile_text = ", ".join(f"{name} {value}일" for name, value in aging["percentiles"].items())
+    table_style = 'border="1" style="border-collapse: collapse; text-align: right;"'
+    html = f'<h2>📊 미업데이트 경과 일수 분석 ({issue_count}개 이슈)</h2>'
+    html += f'<p>경과 일수 백분위수: {percentile_text}</p>'
+    html += '<h3>우선순위별 SLA 초과</h3>' + aging["sla"].rename(columns={
+        "issues": "이슈 수", "sla_days": "SLA(일)", "breached": "SLA 초과", "breach_rate": "초과 비율(%)"
+    }).to_html(border=0).replace('border="0"', table_style, 1)
+    html += '<h3>우선순위별 경과 구간</h3>' + aging["by_priority"].to_html(border=0).replace('border="0"', table_style, 1)
+    html += '<h3>담당자별 경과 구간</h3>' + aging["by_assignee"].to_html(border=0).replace('border="0"', table_style, 1)
+    return html
+
+def write_aging_csv(aging, csv_file_path):
+    """경과 일수 통계를 CSV 파일 하나에 표 단위로 이어서 저장합니다. (표 사이에 빈 줄과 표 이름 행)"""
+    with open(csv_file_path, "w", newline="", encoding="utf-8-sig") as f:
+        f.write("# percentiles\n")
+        aging["percentiles"].rename("age_days").to_csv(f, index_label="percentile")
+        for name in ("sla", "by_priority", "by_assignee"):
+            f.write(f"\n# {name}\n")
+            aging[name].to_csv(f)
+    return csv_file_path
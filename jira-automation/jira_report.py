@@ -1,4 +1,5 @@
 import requests
+import argparse
 import json
 from datetime import datetime, timedelta, timezone
 import os
@@ -9,6 +10,12 @@ from email.mime.base import MIMEBase
 from email import encoders
 from email.header import Header
 import csv
+import sqlite3
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 """JIRA REST API를 요청하여 이슈를 조회합니다. 조회된 결과는 슬랙 메세지와 csv파일이 첨부된 이메일로 전송됩니다.
 
@@ -17,19 +24,106 @@ Notes:
     # 2. Window OS의 Task Scheduler 또는 Mac OS의 Crontab, Launchd 등을 활용하여 특정 주기마다 이 스크립트를 실행시킬 수 있습니다.
 """
 
+# 기본 보고서 프로필 ("profiles"가 없는 설정 파일, 또는 프로필에서 생략한 값에 사용합니다.)
+DEFAULT_BASE_JQL = '''project IN (TUYA, QA) AND type IN (Bug, Improvement) AND status NOT IN ("완료 (Done)", "QA 완료", "이슈 아님")'''
+DEFAULT_SORT_JQL = '''ORDER BY priority DESC''' # jql 조회 결과를 우선순위 순서대로 정렬합니다.
+DEFAULT_DESCRIPTION = """
+    <p>현재 TUYA와 QA 프로젝트에 등록되어있는 이슈들입니다. 각 티켓의 담당자는 현재 진행상태를 업데이트해주세요!</p>
+    <p>티켓의 상태가 완료('완료 (Done)', 'QA 완료', '이슈 아님')인 이슈는 모두 제외되었습니다.</p>
+"""
+DEFAULT_TIERS = [
+    {"title": "😮 1주 이상 ~ 2주 미만 미업데이트 이슈", "min_weeks": 1, "max_weeks": 2},
+    {"title": "😲 2주 이상 ~ 3주 미만 미업데이트 이슈", "min_weeks": 2, "max_weeks": 3},
+    {"title": "😢 3주 이상 ~ 4주 미만 미업데이트 이슈", "min_weeks": 3, "max_weeks": 4},
+    {"title": "😭 장기 미업데이트 이슈 (4주 초과)", "min_weeks": 4, "max_weeks": None}
+]
+DEFAULT_PROFILE_WORKERS = 8  # 동시에 실행할 프로필 수
+
+# 프로필 실행 중인 스레드의 설정 (run_profile()이 스레드별로 지정하고, load_config()가 CONFIG_PATH 대신 사용합니다.)
+PROFILE_CONTEXT = threading.local()
+
+# Jira 사이트별 HTTP 세션 (사이트별 연결 풀과 요청 속도 제한, 스케줄러로 반복 실행할 때 연결을 재사용합니다.)
+JIRA_SESSIONS = {}
+JIRA_SESSIONS_LOCK = threading.Lock()
+
+# 공용 모듈(async_client, slack_dispatcher, stage_profiler) 디렉토리
+COMMON_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "common")
+
+
+def ensure_common_on_path():
+    # 공용 모듈을 import할 수 있도록 COMMON_DIR을 sys.path에 한 번만 추가합니다. (반복 호출해도 sys.path가 늘어나지 않습니다.)
+    if COMMON_DIR not in sys.path:
+        sys.path.insert(0, COMMON_DIR)
+
+
+def load_config():
+    """설정 로드
+    프로필 실행 중이면 해당 프로필의 설정을, 아니면 CONFIG_PATH에 저장된 JSON 데이터를 리턴합니다.
+    """
+    profile_config = getattr(PROFILE_CONTEXT, "config", None)
+    if profile_config is not None:
+        return profile_config
+    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class RateLimitedSession(requests.Session):
+    """요청 속도 제한 HTTP 세션
+    rate_limit(초당 요청 수)보다 빠르게 요청하지 않도록, 여러 스레드가 공유하는 다음 요청 시각을 기준으로 기다린 뒤 요청합니다.
+    """
+
+    def __init__(self, rate_limit=0, pool_size=10):
+        super().__init__()
+        self.interval = 1 / rate_limit if rate_limit else 0
+        self.next_request_at = 0.0
+        self.rate_lock = threading.Lock()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    def request(self, *args, **kwargs):
+        if self.interval:
+            with self.rate_lock:
+                now = time.monotonic()
+                wait = self.next_request_at - now
+                self.next_request_at = max(now, self.next_request_at) + self.interval
+            if wait > 0:
+                time.sleep(wait)
+        return super().request(*args, **kwargs)
+
+
+def get_jira_session(jira_conf):
+    """Jira 사이트별 HTTP 세션
+    "jira" 설정의 base_url별로 세션을 한 번만 생성하고, 같은 사이트를 사용하는 프로필끼리 연결 풀과 속도 제한을 공유합니다.
+
+    Args:
+        jira_conf: 설정 파일의 "jira" 데이터 ("rate_limit": 초당 최대 요청 수, Default 0 (제한 없음), "pool_size": 최대 연결 수, Default 10)
+
+    Returns:
+        session: RateLimitedSession 객체
+    """
+    site = jira_conf["base_url"].rstrip("/")
+    with JIRA_SESSIONS_LOCK:
+        if site not in JIRA_SESSIONS:
+            JIRA_SESSIONS[site] = RateLimitedSession(float(jira_conf.get("rate_limit", 0)), int(jira_conf.get("pool_size", 10)))
+        return JIRA_SESSIONS[site]
+
+# Slack 웹훅 전송 큐 (get_slack_dispatcher()에서 처음 사용할 때 생성합니다.)
+SLACK_DISPATCHER = None
+SLACK_DISPATCHER_LOCK = threading.Lock()
+
 def fetch_jira_issues(jql, max_results=1000):
     """Jira 이슈 조회
-    CONFIG_PATH에 저장된 JSON 데이터를 세팅하고, JIRA REST API(/search/jql)를 요청하고 응답값을 저장합니다.
+    load_config()로 설정을 불러오고, JIRA REST API(/search/jql)를 요청하고 응답값을 저장합니다.
 
     Args:
         jql: 검색에 필요한 jql 쿼리
         max_results: jql로 가져올 검색 결과의 최대 개수 제한, Default 1000개
 
     Returns:
-        report: jql로 조회한 각 티켓의 데이터를 리스트로 저장해서 리턴합니다.
+        report: jql로 조회한 각 티켓의 데이터를 리스트로 저장해서 리턴합니다. 조회에 실패하면 None을 리턴합니다.
     """
-    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-        config = json.load(f)
+    config = load_config()
     jira_conf = config["jira"]
 
     url = f"{jira_conf['base_url']}/rest/api/3/search/jql"
@@ -41,12 +135,25 @@ def fetch_jira_issues(jql, max_results=1000):
         "fields": ["key", "summary", "status", "assignee", "updated", "priority", "comment"] # 조회에 필요한 필드를 정의합니다.
     }
 
-    resp = requests.post(url, auth=auth, headers=headers, json=payload)
+    resp = get_jira_session(jira_conf).post(url, auth=auth, headers=headers, json=payload)
     if resp.status_code != 200:
         print(f"Jira API 오류: {resp.status_code}\n{resp.text}")
-        return []
+        return None
+
+    return parse_jira_issues(resp.json()["issues"], jira_conf['base_url'])
 
-    data = resp.json()["issues"]
+
+def parse_jira_issues(data, base_url):
+    """Jira 검색 결과 변환
+    /search/jql 응답의 issues 리스트를 보고서에 사용하는 딕셔너리 리스트로 변환합니다.
+
+    Args:
+        data: /search/jql 응답의 issues 리스트
+        base_url: 티켓 링크에 사용할 Jira 주소
+
+    Returns:
+        report: 각 티켓의 데이터를 리스트로 저장해서 리턴합니다.
+    """
     report = []
     for issue in data:
         # payload에 요청했던 fields를 각 변수에 저장합니다.
@@ -58,32 +165,168 @@ def fetch_jira_issues(jql, max_results=1000):
 
         comments_data = f.get("comment", {}).get("comments", [])
         latest_comment_date = "없음"
+        raw_date = ""
 
         if comments_data:
             # Jira API는 기본적으로 오래된 순으로 정렬하므로 [-1]이 최신입니다.
-            # 날짜 파싱 오류를 방지하기 위해 단순히 문자열 앞부분(YYYY-MM-DD)만 가져옵니다.
+            # 날짜 파싱 오류를 방지하기 위해 단순히 문자열 앞부분(YYYY-MM-DD)만 가져옵니다. (시각/timezone이 필요한 분석은 latest_comment_at 사용)
             raw_date = comments_data[-1].get("updated", "")
             if raw_date:
                 latest_comment_date = raw_date[:10]
 
         report.append({
             "key": issue["key"],
-            "url": f"{jira_conf['base_url']}/browse/{issue['key']}",
+            "url": f"{base_url}/browse/{issue['key']}",
             "priority": priority_name,
             "summary": f.get("summary", ""),
             "status": f.get("status", {}).get("name", ""),
             "assignee": assignee_obj.get("displayName") if assignee_obj else "Unassigned",
             "updated": f.get("updated", "")[:10],
             "latest_comment_date": latest_comment_date,
-            "assignee_id": assignee_id
+            "assignee_id": assignee_id,
+            "updated_at": f.get("updated", ""),
+            "latest_comment_at": raw_date
         })
 
     return report
 
 
+def fetch_jira_issues_async(jql_list, max_results=1000):
+    """Jira 이슈 동시 조회
+    load_config()의 "http" 설정으로 여러 jql을 하나의 이벤트 루프에서 동시에 조회합니다. (common/async_client.py, httpx 필요)
+
+    Args:
+        jql_list: 검색에 필요한 jql 쿼리 리스트
+        max_results: jql별로 가져올 검색 결과의 최대 개수 제한, Default 1000개
+
+    Returns:
+        reports: jql_list와 같은 순서로, 각 jql의 조회 결과(fetch_jira_issues와 같은 형태)를 리스트로 리턴합니다.
+
+    Notes:
+        # 1. 조회에 실패한 jql은 fetch_jira_issues()와 동일하게 None으로 처리됩니다.
+    """
+    config = load_config()
+    jira_conf = config["jira"]
+    http_conf = config.get("http", {})
+
+    ensure_common_on_path()
+    import async_client
+
+    client_options = {key: http_conf[key] for key in ("max_concurrency", "per_host_limit") if key in http_conf}
+    results = async_client.search_many_sync(
+        jira_conf["base_url"], (jira_conf["email"], jira_conf["api_token"]), jql_list,
+        client_options=client_options, max_results=max_results, method="POST",
+        fields=["key", "summary", "status", "assignee", "updated", "priority", "comment"],
+        headers={"Content-Type": "application/json"}
+    )
+
+    reports = []
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"Jira API 오류: {result}")
+            reports.append(None)
+        else:
+            reports.append(parse_jira_issues(result, jira_conf["base_url"]))
+    return reports
+
+
+def fetch_raw_jira_issues(jql, fields, max_results=None):
+    """Jira 이슈 원본 전체 조회
+    load_config()로 설정을 불러오고, JIRA REST API(/search/jql)를 마지막 페이지까지 요청합니다.
+
+    Args:
+        jql: 검색에 필요한 jql 쿼리
+        fields: 조회할 필드 리스트
+        max_results: 가져올 검색 결과의 최대 개수 제한, Default None (제한 없음)
+
+    Returns:
+        issues: /search/jql 응답의 issues를 모두 합친 리스트, 조회에 실패하면 None을 리턴합니다.
+
+    Notes:
+        # 1. 응답에 nextPageToken이 있으면 토큰으로, 없으면 startAt/isLast로 다음 페이지를 요청합니다.
+        # 2. 페이지가 많으므로 429 응답은 Retry-After 만큼 기다린 뒤 최대 3번 다시 요청합니다.
+    """
+    config = load_config()
+    jira_conf = config["jira"]
+
+    url = f"{jira_conf['base_url']}/rest/api/3/search/jql"
+    auth = (jira_conf["email"], jira_conf["api_token"])
+    headers = {"Content-Type": "application/json"}
+    payload = {"jql": jql, "maxResults": 100, "fields": fields}
+    issues = []
+
+    while max_results is None or len(issues) < max_results:
+        resp = get_jira_session(jira_conf).post(url, auth=auth, headers=headers, json=payload)
+        for _ in range(3):
+            # 429(요청 한도 초과) 응답은 Retry-After 만큼 기다린 뒤 같은 페이지를 다시 요청합니다.
+            if resp.status_code != 429:
+                break
+            time.sleep(float(resp.headers.get("Retry-After") or 1))
+            resp = get_jira_session(jira_conf).post(url, auth=auth, headers=headers, json=payload)
+        if resp.status_code != 200:
+            print(f"Jira API 오류: {resp.status_code}\n{resp.text}")
+            return None
+
+        data = resp.json()
+        page = data.get("issues", [])
+        issues.extend(page)
+        if data.get("nextPageToken"):
+            payload["nextPageToken"] = data["nextPageToken"]
+        elif page and not data.get("isLast", True):
+            payload["startAt"] = data.get("startAt", 0) + len(page)
+        else:
+            break
+
+    return issues if max_results is None else issues[:max_results]
+
+
+def fetch_jira_issues_by_activity(jql, week_ranges):
+    """마지막 실제 활동 기준 Jira 이슈 분류
+    jql로 조회한 이슈의 마지막 실제 활동 시각(봇 계정/무시할 필드 변경 제외)을 계산하고, 미활동 기간(주)별로 나눕니다. (issue_activity.py)
+
+    Args:
+        jql: 분류할 전체 이슈를 조회하는 jql 쿼리 (미활동 기간 조건 없이)
+        week_ranges: (최소 주, 최대 주) 튜플 리스트, 최대 주가 None이면 상한 없음
+
+    Returns:
+        reports: week_ranges와 같은 순서로, 각 구간에 해당하는 이슈 리스트(fetch_jira_issues와 같은 형태)를 리스트로 리턴합니다.
+                 전체 이슈 조회에 실패하면 모든 구간이 None입니다.
+
+    Notes:
+        # 1. 각 이슈에는 "last_activity"(YYYY-MM-DD)가 추가됩니다.
+        # 2. 변경 이력 조회에 실패한 이슈는 updated 시각을 마지막 활동으로 사용합니다.
+        # 3. 구간 안에서의 순서는 jql의 정렬 순서를 그대로 따릅니다.
+    """
+    import issue_activity
+
+    config = load_config()
+    jira_conf = config["jira"]
+    activity_conf = dict(config.get("activity", {}))
+    activity_conf["cache_path"] = os.path.join(script_dir, activity_conf.get("cache_path", issue_activity.DEFAULT_ACTIVITY_CONFIG["cache_path"]))
+
+    issues = fetch_raw_jira_issues(jql, ["key", "summary", "status", "assignee", "created", "updated", "priority", "comment"])
+    if issues is None:
+        return [None for _ in week_ranges]
+    reports = [[] for _ in week_ranges]
+    if not issues:
+        return reports
+
+    activities = issue_activity.resolve_last_activity(issues, jira_conf, activity_conf, session=get_jira_session(jira_conf))
+    now = datetime.now(timezone.utc)
+    for issue, row in zip(issues, parse_jira_issues(issues, jira_conf["base_url"])):
+        last_activity = activities.get(issue["key"]) or issue_activity.parse_jira_time(issue["fields"].get("updated"))
+        row["last_activity"] = last_activity.strftime("%Y-%m-%d")
+        idle_weeks = (now - last_activity) / timedelta(weeks=1)
+        for report, (min_weeks, max_weeks) in zip(reports, week_ranges):
+            if idle_weeks >= min_weeks and (max_weeks is None or idle_weeks < max_weeks):
+                report.append(row)
+                break
+    return reports
+
+
 def add_comment_to_issue(issue_key, assignee_id, comment_text):
     """Jira 코멘트 추가
-    CONFIG_PATH에 저장된 JSON 데이터를 세팅하고, JIRA REST API(/issue/{issue_key}/comment)를 요청하고 코멘트를 추가합니다.
+    load_config()로 설정을 불러오고, JIRA REST API(/issue/{issue_key}/comment)를 요청하고 코멘트를 추가합니다.
 
     Args:
         issue_key: 코멘트를 추가할 티켓의 키 값
@@ -94,8 +337,7 @@ def add_comment_to_issue(issue_key, assignee_id, comment_text):
         # 1. 코멘트를 추가하는 계정은 "jira_config.json"에 정의된 계정으로 코멘트를 추가하게 됩니다.
         # 2. 이 함수가 실행되면, 각 티켓에 바로 코멘트가 추가됩니다.
     """
-    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-        config = json.load(f)
+    config = load_config()
     jira_conf = config["jira"]
 
     url = f"{jira_conf['base_url']}/rest/api/3/issue/{issue_key}/comment"
@@ -128,7 +370,7 @@ def add_comment_to_issue(issue_key, assignee_id, comment_text):
         }
     }
 
-    resp = requests.post(url, auth=auth, headers=headers, json=payload)
+    resp = get_jira_session(jira_conf).post(url, auth=auth, headers=headers, json=payload)
     if resp.status_code == 201:
         print(f"코멘트 추가 성공: {issue_key}")
     else:
@@ -136,49 +378,84 @@ def add_comment_to_issue(issue_key, assignee_id, comment_text):
         print(resp.text)
 
 
-def build_slack_message(report, title):
+def load_stage_profiler():
+    """단계별 프로파일러 모듈(common/stage_profiler.py)을 import해서 리턴합니다. (표준 라이브러리만 사용)"""
+    ensure_common_on_path()
+    import stage_profiler
+    return stage_profiler
+
+
+def profile_stage(name):
+    # 보고서 단계(fetch, transform, render, publish) 측정 구간, --profile-stages 옵션 또는 QA_REPORT_PROFILE 환경변수를 사용할 때만 측정합니다.
+    return load_stage_profiler().stage(name)
+
+
+def get_slack_dispatcher(slack_conf):
+    """Slack 전송 큐 생성
+    "slack" 설정의 전송 간격으로 전송 큐(common/slack_dispatcher.py)를 한 번만 생성하고, 이후에는 재사용합니다.
+
+    Args:
+        slack_conf: 설정 파일의 "slack" 데이터 ("min_interval": 같은 웹훅으로 보내는 메세지 간격(초), Default 1.0)
+
+    Returns:
+        SLACK_DISPATCHER: 백그라운드 스레드에서 메세지를 전송하는 SlackDispatcher 객체
+    """
+    global SLACK_DISPATCHER
+    with SLACK_DISPATCHER_LOCK:
+        if SLACK_DISPATCHER is None:
+            ensure_common_on_path()
+            import slack_dispatcher
+
+            SLACK_DISPATCHER = slack_dispatcher.SlackDispatcher(min_interval=float(slack_conf.get("min_interval", slack_dispatcher.DEFAULT_MIN_INTERVAL)))
+    return SLACK_DISPATCHER
+
+
+def build_slack_message(report, title, max_messages=0):
     """Slack 메세지 생성
-    Slack 메세지를 작성합니다. send_slack_message 함수 내부에서 실행됩니다.
+    Slack Block Kit 메세지를 작성합니다. send_slack_message 함수 내부에서 실행됩니다.
 
     Args:
         report: jql로 조회된 각 티켓의 데이터 리스트
         title: jql을 설명하는 제목, jql_queries 딕셔너리 안에 저장된 키
+        max_messages: 보고서 하나를 나누어 보낼 최대 메세지 수, Default 0 (제한 없음)
 
     Returns:
-        "\n".join(lines): 반복문으로 작성된 문자열을 줄바꿈하여 하나의 문자열로 리턴합니다.
+        payloads: 웹훅으로 보낼 메세지 리스트를 리턴합니다. 이슈가 많으면 자르지 않고 여러 메세지로 나눕니다.
     """
     if not report:
-        return f"{title}: 🎉 해당 조건의 Jira 이슈가 없습니다!"
+        return [{"text": f"{title}: 🎉 해당 조건의 Jira 이슈가 없습니다!"}]
 
-    lines = [f"*{title}*"]
-    for r in report[:15]: # Slack 메세지로 작성할 이슈의 개수를 최대 15개로 제한합니다.
+    ensure_common_on_path()
+    import slack_dispatcher
+
+    lines = []
+    for r in report:
         comment_info = f"[최근 코멘트 등록일자: {r['latest_comment_date']}]"
-        lines.append(f"• <{r['url']}|{r['key']}> - {r['status']}, {r['summary']}, {r['assignee']} - {comment_info}")
-    lines.append(f"\n*총 {len(report)}개 이슈* — {datetime.now().strftime('%Y-%m-%d %H:%M')} 기준")
-    return "\n".join(lines)
+        if r.get("last_activity"):
+            comment_info += f" [최근 활동일자: {r['last_activity']}]"
+        summary = slack_dispatcher.escape_mrkdwn(f"{r['status']}, {r['summary']}, {r['assignee']}")
+        lines.append(f"• <{r['url']}|{r['key']}> - {summary} - {comment_info}")
+    footer = f"*총 {len(report)}개 이슈* — {datetime.now().strftime('%Y-%m-%d %H:%M')} 기준"
+    return slack_dispatcher.build_block_messages(title, lines, footer=footer, max_messages=max_messages)
 
 
 def send_slack_message(report, title):
-    """Slack 메세지 생성
-    CONFIG_PATH에 저장된 JSON 데이터를 세팅하고, Slack 웹훅으로 메세지를 전송합니다.
+    """Slack 메세지 전송
+    load_config()로 설정을 불러오고, Slack 웹훅 전송 큐에 메세지를 넣습니다.
 
     Args:
         report: jql로 조회된 각 티켓의 데이터 리스트
         title: jql을 설명하는 제목, jql_queries 딕셔너리 안에 저장된 키
 
     Notes:
-        # 1. 이 함수가 실행되면, 설정된 웹훅으로 바로 Slack 메세지가 전송됩니다.
+        # 1. 메세지는 백그라운드 스레드에서 전송되므로 이 함수는 바로 리턴합니다. 전송 완료를 기다리려면 SLACK_DISPATCHER.flush()를 호출합니다.
+        # 2. "slack"의 "max_messages"로 보고서 하나를 나누어 보낼 최대 메세지 수를 제한할 수 있습니다. (Default 0, 제한 없음)
     """
-    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-        config = json.load(f)
-    webhook_url = config["slack"]["webhook_url"]
-    message = build_slack_message(report, title) #줄바꿈이 적용된 문자열을 저장합니다.
-    payload = {"text": message}
-    resp = requests.post(webhook_url, json=payload)
-    if resp.status_code == 200:
-        print(f"Slack 메시지 전송 완료: {title}")
-    else:
-        print(f"Slack 전송 실패: {resp.status_code}, {resp.text}")
+    config = load_config()
+    slack_conf = config["slack"]
+    dispatcher = get_slack_dispatcher(slack_conf)
+    payloads = build_slack_message(report, title, max_messages=int(slack_conf.get("max_messages", 0)))
+    dispatcher.submit_many(slack_conf["webhook_url"], payloads, label=title)
 
 
 def format_report_html(report, title):
@@ -200,7 +477,8 @@ def format_report_html(report, title):
     html += '<ul style="list-style-type: none; padding-left: 20px;">'  # HTML 리스트
 
     for r in report:
-        comment_label = f'<span style="color: #666;">(최근 댓글 등록일: {r["latest_comment_date"]})</span>'
+        activity_text = f', 최근 활동일: {r["last_activity"]}' if r.get("last_activity") else ""
+        comment_label = f'<span style="color: #666;">(최근 댓글 등록일: {r["latest_comment_date"]}{activity_text})</span>'
         # HTML <a> 태그 사용
         item_html = (
             f'<li>• <a href="{r["url"]}" style="text-decoration:none;">{r["key"]}</a> - '
@@ -214,15 +492,14 @@ def format_report_html(report, title):
 
 def send_report_email(subject, body, email_attachments=None):
     """Gmail 전송 함수
-    이메일 제목, HTML, 첨부 파일 경로를 받아서 CONFIG_PATH에 저장된 이메일로 전송합니다.
+    이메일 제목, HTML, 첨부 파일 경로를 받아서 load_config()의 "gmail" 설정으로 전송합니다.
 
     Args:
         subject: Jira 보고서 이메일의 제목
         body: 이메일 본문에 작성할 HTML
         email_attachments: 이메일에 첨부할 파일 경로,  Default 첨부 파일 없음
     """
-    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-        config = json.load(f)
+    config = load_config()
     gmail_conf = config["gmail"]
 
     sender_email = gmail_conf["sender_email"]
@@ -272,7 +549,8 @@ def send_report_email(subject, body, email_attachments=None):
     try:
         # 3. SMTP 서버 연결 및 로그인
         server = smtplib.SMTP(gmail_conf["smtp_server"], gmail_conf["smtp_port"])
-        server.starttls()  # 보안 연결 설정
+        if gmail_conf.get("starttls", True):
+            server.starttls()  # 보안 연결 설정 (로컬 테스트용 SMTP 서버처럼 TLS를 지원하지 않는 경우 "starttls": false)
         server.login(sender_email, app_password)
 
         # 4. 이메일 전송
@@ -285,6 +563,102 @@ def send_report_email(subject, body, email_attachments=None):
         print(f"이메일 전송 실패: {e}")
 
 
+def record_report_history(tier_keys):
+    """미업데이트 이슈 기록 저장
+    load_config()의 "history" 설정으로 이번 실행의 구간별 이슈 키를 SQLite 파일에 저장하고, 직전 실행과 비교합니다. (report_history.py)
+
+    Args:
+        tier_keys: 구간 순서대로, 각 구간의 이슈 키 리스트
+
+    Returns:
+        delta: report_history.compute_delta()의 결과, "history"의 "enabled"가 false이거나 직전 기록이 없으면 None을 리턴합니다.
+
+    Notes:
+        # 1. 기록 파일은 "history"의 "db_path"(Default "jira_report_history.db", script_dir 기준)에 저장됩니다.
+        # 2. 기록 저장에 실패해도 보고서 전송은 계속 진행합니다.
+    """
+    config = load_config()
+    history_conf = config.get("history", {})
+    if not history_conf.get("enabled"):
+        return None
+
+    import report_history
+
+    profile_name = config.get("profile", {}).get("name") or report_history.DEFAULT_PROFILE
+    db_path = os.path.join(script_dir, history_conf.get("db_path") or report_history.DEFAULT_DB_PATH)
+    try:
+        conn = report_history.open_history(db_path)
+        try:
+            delta = report_history.compute_delta(report_history.load_latest_snapshot(conn, profile_name), tier_keys)
+            report_history.save_snapshot(conn, profile_name, tier_keys)
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        print(f"미업데이트 이슈 기록 저장 실패: {e}")
+        return None
+    print(f"미업데이트 이슈 기록 저장 완료: {db_path}")
+    return delta
+
+
+def format_delta_lines(delta, titles, base_url, link_format):
+    """직전 실행 대비 변화 요약 줄 생성
+    Slack 메세지와 이메일 HTML에서 함께 사용하는 변화 요약 줄을 작성합니다.
+
+    Args:
+        delta: record_report_history()의 결과
+        titles: 구간 제목 리스트 (구간 번호 순서)
+        base_url: 티켓 링크에 사용할 Jira 주소
+        link_format: 이슈 링크 형식 문자열 ("{url}", "{key}" 포함)
+
+    Returns:
+        lines: 변화 요약 줄 리스트
+    """
+    def links(keys):
+        shown = ", ".join(link_format.format(url=f"{base_url}/browse/{key}", key=key) for key in keys[:30])
+        return shown + (f" 외 {len(keys) - 30}건" if len(keys) > 30 else "")
+
+    lines = [
+        f"🆕 새로 미업데이트 구간에 들어온 이슈: {len(delta['new'])}건" + (f" — {links(delta['new'])}" if delta["new"] else ""),
+        f"✅ 구간에서 빠져나간 이슈 (완료/업데이트): {len(delta['resolved'])}건" + (f" — {links(delta['resolved'])}" if delta["resolved"] else ""),
+        f"⬆️ 더 오래된 구간으로 이동한 이슈: {len(delta['moved_up'])}건"
+    ]
+    moved = {}
+    for key, _, tier in delta["moved_up"]:
+        moved.setdefault(tier, []).append(key)
+    for tier, keys in sorted(moved.items()):
+        lines.append(f"    → {titles[tier]}: {links(keys)}")
+    return lines
+
+
+def build_aging_analytics(issues, csv_filename):
+    """미업데이트 경과 일수 분석
+    load_config()의 "analytics" 설정으로 조회된 이슈의 경과 일수 백분위수, 우선순위/담당자별 분포, SLA 초과 건수를 계산합니다. (issue_analytics.py, pandas 필요)
+
+    Args:
+        issues: 모든 구간의 이슈 리스트 (구분선 행 제외)
+        csv_filename: 분석 결과 CSV 파일 이름
+
+    Returns:
+        (aging_html, csv_path): 이메일 본문에 추가할 HTML과 분석 결과 CSV 파일 경로, 분석을 사용하지 않거나 실패하면 ("", None)을 리턴합니다.
+    """
+    analytics_conf = load_config().get("analytics", {})
+    if not analytics_conf.get("enabled") or not issues:
+        return "", None
+    try:
+        import issue_analytics
+    except ImportError as e:
+        print(f"경과 일수 분석을 건너뜁니다. (pandas/numpy 필요: {e})")
+        return "", None
+
+    started = time.perf_counter()
+    frame = issue_analytics.build_issue_frame(issues)
+    aging = issue_analytics.compute_aging(frame, analytics_conf)
+    aging_html = issue_analytics.format_aging_html(aging, len(frame))
+    csv_path = issue_analytics.write_aging_csv(aging, os.path.join(script_dir, csv_filename))
+    print(f"경과 일수 분석 완료: {len(frame)}건, {time.perf_counter() - started:.3f}s")
+    return aging_html, csv_path
+
+
 def create_csv_file(report, filename="report_data.csv"):
     """CSV 파일 생성 함수
     이메일에 첨부할 csv 파일을 생성합니다.
@@ -314,7 +688,10 @@ def create_csv_file(report, filename="report_data.csv"):
         "assignee",
         "updated",
         "latest_comment_date",
-        "assignee_id"
+        "last_activity",
+        "assignee_id",
+        "updated_at",
+        "latest_comment_at"
     ]
 
     try:
@@ -337,42 +714,69 @@ def job():
     python jira_report.py 스크립트가 직접 실행될때, 동작하는 로직을 실행합니다.
 
     Notes:
-        # 1. 미리 정의된 각 jql에 대해서 조회 결과를 report 리스트에 저장합니다.
+        # 1. 프로필(load_config()의 "profile")의 base_jql과 tiers로 구간별 jql을 만들고, 각 jql의 조회 결과를 report 리스트에 저장합니다.
+            # 프로필이 없으면 DEFAULT_BASE_JQL, DEFAULT_TIERS를 사용합니다.
             # 1.1 report = fetch_jira_issues(jql)
 
         # 2. for 반복문이 실행되어 각 jql 조회 결과를 Slack 메세지로 전송하고 동시에 HTML 보고서 파일을 취합하여 작성합니다.
-            # 2.1 send_slack_message(report, title)
-            # 2.2 message = build_slack_message(report, title)
+            # 2.1 send_slack_message(report, title) - Slack 전송 큐에 넣고 바로 다음 jql로 넘어갑니다.
+            # 2.2 payloads = build_slack_message(report, title)
             # 2.3 report_html_block = format_report_html(report, title)
 
-        # 3. for 반복문이 종료되면, 취합된 jql 조회 결과를 현재 디렉토리 위치에 CSV 파일을 생성합니다.
-            # 3.1 csv_path = create_csv_file(full_issue_report, csv_filename)
+        # 3. for 반복문이 종료되면, 구간별 이슈 키를 기록하고 직전 실행 대비 변화를 Slack 메세지와 이메일 본문에 추가합니다. ("history" 설정)
+            # 조회에 실패한 구간이 있으면 빈 구간이 해결된 것으로 기록되지 않도록 이번 실행은 기록하지 않습니다.
+            # 3.1 delta = record_report_history(tier_keys)
+            # 3.2 취합된 jql 조회 결과로 현재 디렉토리 위치에 CSV 파일을 생성합니다. csv_path = create_csv_file(full_issue_report, csv_filename)
 
         # 4. 이메일 제목과 취합된 HTML 보고서, 생성된 CSV 파일을 첨부하여 이메일을 전송합니다.
             # 4.1 send_report_email(email_subject, full_report_body_html, email_attachments=[csv_path])
 
         # 5. 생성된 CSV 파일을 삭제합니다.
+
+        # 6. 백그라운드에서 전송 중인 Slack 메세지가 모두 전송될 때까지 기다립니다.
+
+        # 7. 프로파일링 모드(--profile-stages 또는 QA_REPORT_PROFILE 환경변수)에서는 조회(fetch), 가공(transform), 작성(render), 전송(publish) 단계를 나누어 측정합니다.
+
+    Returns:
+        issue_count: 보고서에 포함된 이슈 수
     """
-    base_jql = '''project IN (TUYA, QA) AND type IN (Bug, Improvement) AND status NOT IN ("완료 (Done)", "QA 완료", "이슈 아님")'''
-    sort_jql = '''ORDER BY priority DESC''' # jql 조회 결과를 우선순위 순서대로 정렬합니다.
-
-    jql_queries = {
-        "😮 1주 이상 ~ 2주 미만 미업데이트 이슈": f"{base_jql} AND updated <= -1w AND updated > -2w {sort_jql}",
-        "😲 2주 이상 ~ 3주 미만 미업데이트 이슈": f"{base_jql} AND updated <= -2w AND updated > -3w {sort_jql}",
-        "😢 3주 이상 ~ 4주 미만 미업데이트 이슈": f"{base_jql} AND updated <= -3w AND updated > -4w {sort_jql}",
-        "😭 장기 미업데이트 이슈 (4주 초과)": f"{base_jql} AND updated <= -4w {sort_jql}"
-    }
+    config = load_config()
+    profile_conf = config.get("profile", {})
+    profile_name = profile_conf.get("name", "")
+    base_jql = profile_conf.get("base_jql", DEFAULT_BASE_JQL)
+    sort_jql = profile_conf.get("sort_jql", DEFAULT_SORT_JQL)
+    tiers = profile_conf.get("tiers", DEFAULT_TIERS)
+
+    # 각 구간의 미업데이트 기간 (주), "activity" 설정을 사용할 때 마지막 실제 활동 기준으로 같은 구간을 나눕니다.
+    week_ranges = [(tier["min_weeks"], tier.get("max_weeks")) for tier in tiers]
+    jql_queries = {}
+    for tier, (min_weeks, max_weeks) in zip(tiers, week_ranges):
+        updated_jql = f"updated <= -{min_weeks}w" + (f" AND updated > -{max_weeks}w" if max_weeks else "")
+        jql_queries[tier["title"]] = f"{base_jql} AND {updated_jql} {sort_jql}"
 
     # 검색 결과 취합을 위한 변수 초기화
     full_issue_report = []
 
+    # "activity"의 "enabled"가 true이면 updated 대신 마지막 실제 활동(봇 변경 제외) 기준으로 전체 이슈를 한 번에 조회하여 나눕니다.
+    # "http"의 "backend"가 "async"이면 모든 jql을 먼저 동시에 조회합니다. (Slack 메세지 순서는 그대로 유지됩니다.)
+    http_backend = config.get("http", {}).get("backend", "requests")
+    prefetched_reports = None
+    with profile_stage("fetch"):
+        if config.get("activity", {}).get("enabled"):
+            prefetched_reports = dict(zip(jql_queries.values(), fetch_jira_issues_by_activity(f"{base_jql} {sort_jql}", week_ranges)))
+        elif http_backend == "async":
+            prefetched_reports = dict(zip(jql_queries.values(), fetch_jira_issues_async(list(jql_queries.values()))))
+
     # 이메일 본문 취합용
-    full_report_body_html = """
-    <h1>Jira 미업데이트 이슈 데일리 보고서</h1>
-    <p>현재 TUYA와 QA 프로젝트에 등록되어있는 이슈들입니다. 각 티켓의 담당자는 현재 진행상태를 업데이트해주세요!</p>
-    <p>티켓의 상태가 완료('완료 (Done)', 'QA 완료', '이슈 아님')인 이슈는 모두 제외되었습니다.</p>
+    report_name = f"[{profile_name}] Jira 미업데이트 이슈 데일리 보고서" if profile_name else "Jira 미업데이트 이슈 데일리 보고서"
+    report_header_html = f"""
+    <h1>{report_name}</h1>
+    {profile_conf.get("description", DEFAULT_DESCRIPTION)}
     <br><hr><br>
     """
+    full_report_body_html = ""
+    tier_keys = [] # 기록 저장과 직전 실행 비교에 사용할 구간별 이슈 키
+    fetch_failed = False # 조회에 실패한 구간이 있으면 기록을 저장하지 않습니다.
     total_issue_count = 0
 
     print(f"[{datetime.now()}] 🔍 Jira 검색 실행 및 보고서 취합 중...")
@@ -380,7 +784,11 @@ def job():
     for title, (jql) in jql_queries.items():
         print(f"\n[{datetime.now()}] -> {title} 검색 시작...")
 
-        report = fetch_jira_issues(jql)
+        with profile_stage("fetch"):
+            report = prefetched_reports[jql] if prefetched_reports is not None else fetch_jira_issues(jql)
+        if report is None:
+            fetch_failed = True
+            report = []
 
         # 생성되는 CSV 파일에 구분선 역할을 할 딕셔너리 생성
         separator_row = {
@@ -392,43 +800,89 @@ def job():
             "assignee": "",
             "updated": "",
             "latest_comment_date": "",
-            "assignee_id": ""
+            "last_activity": "",
+            "assignee_id": "",
+            "updated_at": "",
+            "latest_comment_at": ""
         }
         # 전체 리포트에 구분선 추가
         full_issue_report.append(separator_row)
         full_issue_report.extend(report)
 
-        # SLACK: 개별 메시지로 즉시 전송 (반복문 안에서 실행됩니다.)
-        send_slack_message(report, title)
+        # SLACK: 개별 메시지를 전송 큐에 추가 (백그라운드에서 순서대로 전송됩니다.)
+        with profile_stage("publish"):
+            send_slack_message(report, title)
 
         # EMAIL: HTML 블록 생성 및 취합
-        report_html_block = format_report_html(report, title)  # HTML 포맷 함수 호출
+        with profile_stage("render"):
+            report_html_block = format_report_html(report, title)  # HTML 포맷 함수 호출
         full_report_body_html += report_html_block + "<br><hr><br>"
         total_issue_count += len(report)
+        tier_keys.append([r["key"] for r in report])
 
         # (옵션) 코멘트 추가 로직은 여기에 위치
 
+    # HISTORY: 구간별 이슈 키를 기록하고, 직전 실행 대비 변화를 Slack 메세지와 이메일 본문 맨 위에 추가합니다.
+    with profile_stage("transform"):
+        if fetch_failed:
+            print("⚠️ 조회에 실패한 구간이 있어 미업데이트 이슈 기록을 저장하지 않습니다.")
+            delta = None
+        else:
+            delta = record_report_history(tier_keys)
+        delta_html = ""
+        if delta is not None:
+            titles = list(jql_queries.keys())
+            base_url = config["jira"]["base_url"]
+            delta_title = f"📈 지난 실행 대비 변화 ({profile_name})" if profile_name else "📈 지난 실행 대비 변화"
+            slack_lines = format_delta_lines(delta, titles, base_url, "<{url}|{key}>")
+            dispatcher = get_slack_dispatcher(config["slack"])
+            ensure_common_on_path()
+            import slack_dispatcher
+            dispatcher.submit_many(config["slack"]["webhook_url"], slack_dispatcher.build_block_messages(delta_title, slack_lines), label=delta_title)
+            html_lines = format_delta_lines(delta, titles, base_url, '<a href="{url}" style="text-decoration:none;">{key}</a>')
+            delta_html = f"<h2>{delta_title}</h2><ul style=\"list-style-type: none; padding-left: 20px;\">" + "".join(f"<li>{line}</li>" for line in html_lines) + "</ul><br><hr><br>"
+    full_report_body_html = report_header_html + delta_html + full_report_body_html
+
     # GMAIL: 모든 보고서가 취합된 후, 최종적으로 1회만 전송 (반복문 밖에서 1번 실행)
     total_issue_count = len(full_issue_report)
 
-    # CSV 파일 생성
-    csv_filename = f"jira_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-    csv_path = create_csv_file(full_issue_report, csv_filename)
+    with profile_stage("transform"):
+        # CSV 파일 생성
+        csv_prefix = f"jira_report_{re.sub(r'[^0-9A-Za-z_-]+', '_', profile_name)}" if profile_name else "jira_report" # 프로필을 동시에 실행해도 파일 이름이 겹치지 않도록 합니다.
+        csv_filename = f"{csv_prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        csv_path = create_csv_file(full_issue_report, csv_filename)
+
+        # ANALYTICS: 모든 구간의 이슈로 경과 일수 분석 결과를 이메일 본문에 추가하고, CSV 파일로 첨부합니다. ("analytics" 설정)
+        aging_html, aging_csv_path = build_aging_analytics(
+            [row for row in full_issue_report if row["url"]],
+            f"{csv_prefix}_aging_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        )
+        full_report_body_html += aging_html
 
     # 이메일 제목 구성
-    email_subject = f"Jira 미업데이트 이슈 데일리 보고서 (총 {total_issue_count}건) - {datetime.now().strftime('%Y-%m-%d')}"
+    email_subject = f"{report_name} (총 {total_issue_count}건) - {datetime.now().strftime('%Y-%m-%d')}"
 
-    # Gmail 전송
-    if total_issue_count > 0 and csv_path:
-        # CSV 파일 경로를 리스트로 전달합니다.
-        send_report_email(email_subject, full_report_body_html, email_attachments=[csv_path])
-    elif total_issue_count == 0:
-        send_report_email(email_subject, "모든 조건에서 미업데이트 이슈가 발견되지 않았습니다. 🎉", email_attachments=None)
+    with profile_stage("publish"):
+        # Gmail 전송
+        if total_issue_count > 0 and csv_path:
+            # CSV 파일 경로를 리스트로 전달합니다.
+            send_report_email(email_subject, full_report_body_html, email_attachments=[path for path in (csv_path, aging_csv_path) if path])
+        elif total_issue_count == 0:
+            send_report_email(email_subject, "모든 조건에서 미업데이트 이슈가 발견되지 않았습니다. 🎉", email_attachments=None)
 
     # 7. 생성된 CSV 파일 삭제 (스크립트 실행 후 파일을 남기지 않으려면)
-    if csv_path and os.path.exists(csv_path):
-        os.remove(csv_path)
-        print(f"🗑️ 생성된 CSV 파일 삭제: {csv_path}")
+    for path in (csv_path, aging_csv_path):
+        if path and os.path.exists(path):
+            os.remove(path)
+            print(f"🗑️ 생성된 CSV 파일 삭제: {path}")
+
+    # 8. 전송 큐에 남은 Slack 메세지가 모두 전송될 때까지 기다립니다. (스크립트가 먼저 종료되면 남은 메세지가 전송되지 않습니다.)
+    # 다른 프로필이 동시에 실행 중일 수 있으므로, 이 보고서의 웹훅 메세지만 기다립니다.
+    if SLACK_DISPATCHER is not None:
+        with profile_stage("publish"):
+            SLACK_DISPATCHER.flush(webhook_url=config["slack"]["webhook_url"])
+
+    return sum(1 for row in full_issue_report if row["url"]) # 구분선 행을 제외한 이슈 수
 
     # if report:
     #     print("💬 미업데이트 티켓에 코멘트 추가 중...")
@@ -447,17 +901,128 @@ def job():
     #         add_comment_to_issue(issue["key"], assignee_id, comment_text)
 
 
+def build_profile_config(config, profile):
+    """프로필 설정 생성
+    설정 파일의 공통 설정("sites", "http", "activity", "slack", "gmail")에 프로필 설정을 덮어써서, 프로필 하나를 실행할 설정을 만듭니다.
+
+    Args:
+        config: 설정 파일 전체 데이터
+        profile: "profiles" 리스트의 항목 ("name", "site", "base_jql", "sort_jql", "tiers", "description", "slack", "gmail", "activity")
+
+    Returns:
+        profile_config: job()이 load_config()로 사용하는 설정 (프로필 값은 "profile"에 저장됩니다.)
+
+    Notes:
+        # 1. "site"가 없으면 "jira" 설정을 사이트로 사용합니다.
+        # 2. "slack", "gmail", "activity"는 공통 설정과 합쳐지므로, 프로필에는 다른 값(webhook_url, recipient_emails 등)만 지정합니다.
+    """
+    profile_config = dict(config)
+    profile_config["jira"] = config["sites"][profile["site"]] if profile.get("site") else config["jira"]
+    for key in ("slack", "gmail", "activity"):
+        if key in profile:
+            profile_config[key] = dict(config.get(key, {}), **profile[key])
+    profile_config["profile"] = profile
+    return profile_config
+
+
+def run_profile(profile_config):
+    """프로필 하나 실행
+    현재 스레드의 설정을 profile_config로 지정하고 job()을 실행합니다.
+
+    Returns:
+        result: {"name", "site", "issue_count", "elapsed_s", "error"} 딕셔너리
+    """
+    profile = profile_config.get("profile", {})
+    PROFILE_CONTEXT.config = profile_config
+    started = time.perf_counter()
+    issue_count, error = 0, None
+    try:
+        issue_count = job()
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        print(f"⚠️ 프로필 실행 실패: {profile.get('name')} ({error})")
+    finally:
+        PROFILE_CONTEXT.config = None
+    return {
+        "name": profile.get("name", ""),
+        "site": profile_config["jira"]["base_url"],
+        "issue_count": issue_count,
+        "elapsed_s": round(time.perf_counter() - started, 3),
+        "error": error
+    }
+
+
+def run_all_profiles():
+    """모든 프로필 실행
+    설정 파일의 "profiles"를 스레드 풀에서 동시에 실행하고, 실행 시간 요약을 출력한 뒤 "summary_path" 파일(JSON)로 저장합니다.
+
+    Returns:
+        results: 프로필별 실행 결과 리스트 (run_profile() 참고), "profiles"가 없으면 job()만 실행하고 None을 리턴합니다.
+
+    Notes:
+        # 1. 동시에 실행할 프로필 수는 "profile_workers"(Default 8)로 지정합니다.
+        # 2. 같은 사이트의 프로필은 하나의 HTTP 세션(연결 풀, rate_limit)을 공유하므로, 프로필이 많아도 사이트별 요청 속도는 설정값을 넘지 않습니다.
+        # 3. 보고서 생성은 대부분 Jira 응답을 기다리는 시간이므로 프로세스 대신 스레드를 사용합니다.
+    """
+    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    profiles = config.get("profiles")
+    if not profiles:
+        job()
+        return None
+
+    profile_configs = [build_profile_config(config, profile) for profile in profiles]
+    workers = max(1, min(int(config.get("profile_workers", DEFAULT_PROFILE_WORKERS)), len(profile_configs)))
+    print(f"[{datetime.now()}] 📋 보고서 프로필 {len(profile_configs)}개 실행 (동시 {workers}개)")
+
+    started_at = datetime.now() # 요약의 시작 시각 (풀 실행 전에 기록)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(run_profile, profile_configs))
+    elapsed = time.perf_counter() - started
+
+    print(f"\n{'프로필':<24} {'이슈':>6} {'소요(s)':>9}  사이트")
+    for result in results:
+        status = f"  ⚠️ {result['error']}" if result["error"] else ""
+        print(f"{result['name']:<24} {result['issue_count']:>6} {result['elapsed_s']:>9.2f}  {result['site']}{status}")
+    serial = sum(result["elapsed_s"] for result in results)
+    print(f"전체 {elapsed:.2f}s (프로필 실행 시간 합계 {serial:.2f}s), 실패 {sum(1 for result in results if result['error'])}개")
+
+    summary = {
+        "started_at": started_at.isoformat(timespec="seconds"),
+        "workers": workers,
+        "elapsed_s": round(elapsed, 3),
+        "profiles": results
+    }
+    summary_path = os.path.join(script_dir, config.get("summary_path") or "jira_report_summary.json")
+    try:
+        with open(summary_path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+        print(f"실행 요약 저장 완료: {summary_path}")
+    except OSError as e:
+        print(f"실행 요약 저장 실패: {e}")
+    return results
+
+
 if __name__ == "__main__":
     """메인 함수 실행
     이 스크립트 파일이 실행될때 아래 순서대로 로직을 실행합니다.
 
     # 1. 실행된 스크립트 파일의 절대 경로를 script_dir에 저장하고, CONFIG_PATH 변수에 저장합니다.
     # 2. 이 스크립트의 주요 로직이 포함된 함수가 실행됩니다.
-        # 2-1. job()
+        # 2-1. run_all_profiles() - 설정 파일에 "profiles"가 있으면 모든 프로필을 동시에 실행하고, 없으면 job()을 실행합니다.
+    # 3. --profile-stages 옵션(또는 QA_REPORT_PROFILE 환경변수)을 사용하면 실행이 끝난 후 단계별 프로파일 결과를 저장하고 상위 함수 목록을 출력합니다.
     """
 
     script_dir = os.path.dirname(os.path.abspath(__file__)) # 이 스크립트 파일이 위치한 디렉토리의 절대경로
     CONFIG_PATH = os.path.join(script_dir, "jira_config.json") # "{script_dir}\jira_config.json"의 형태로 운영체제에 맞게 파일경로를 생성
 
+    parser = argparse.ArgumentParser(description="Jira 미업데이트 이슈 보고서 전송", allow_abbrev=False)  # --profile 같은 축약 옵션이 --profile-stages로 해석되지 않도록 합니다.
+    parser.add_argument("--profile-stages", nargs="?", const=True, default=None, metavar="DIR", help="단계별 성능 프로파일링 사용 (결과 디렉토리, 기본 ./profiles/<실행 시각>, 보고서 프로필과 무관)")
+    args = parser.parse_args()
+    if args.profile_stages:
+        load_stage_profiler().enable_profiling(args.profile_stages)
+
     print("🤖 Jira → Slack & Email 자동 보고 봇 실행 중 (Ctrl+C로 종료)")
-    job()
\ No newline at end of file
+    run_all_profiles()
+    load_stage_profiler().finish_profiling()
\ No newline at end of file
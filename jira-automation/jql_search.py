@@ -5,13 +5,21 @@ jql_search.py
 - pdcleaner API로 JQL 자동 변환
 - X-Atlassian-Force-Account-Id 헤더 추가
 - GET 요청 사용 (안정성 우선)
+- HTTP_BACKEND = "async"이면 common/async_client.py(httpx)로 나머지 페이지를 동시에 조회
+- 샤딩 모드: JQL을 겹치지 않는 created 구간으로 나누어 병렬 조회 후 하나의 순서로 병합 (대량 export용)
+- 키 목록 모드: 이슈 키 목록(파일)을 POST /rest/api/3/issue/bulkfetch로 100개씩 나누어 병렬 조회 (입력 순서 유지, 없는 키 보고)
 """
 
 import requests
 from requests.auth import HTTPBasicAuth
 import json
 import csv
+import os
+import re
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 
 # ======================
 # Jira 계정 정보 수정
@@ -21,12 +29,30 @@ JIRA_EMAIL = "email@company.com"
 JIRA_API_TOKEN = "your-api-token"
 
 PAGE_SIZE = 100  # 한 번에 가져올 이슈 수
+HTTP_BACKEND = "requests"  # "async"로 지정하면 페이지를 동시에 요청합니다. (httpx 필요)
+ASYNC_CLIENT_OPTIONS = {"max_concurrency": 200, "per_host_limit": 50}
+
+SHARD_TARGET_SIZE = 5000  # 샤드 하나에 들어갈 목표 이슈 수 (이보다 많으면 구간을 반으로 나눕니다.)
+SHARD_WORKERS = 8         # 동시에 조회할 샤드 수
+SHARD_RETRIES = 2         # 실패한 샤드만 다시 조회하는 횟수
+SHARD_RETRY_BACKOFF = 1.0 # 다시 조회하기 전 대기 시간 (초), 재시도마다 2배로 늘어납니다.
+RATE_LIMIT_RETRIES = 3    # 429 응답을 받은 페이지를 Retry-After만큼 기다린 후 다시 요청하는 횟수
+JQL_DATE_FORMAT = "%Y/%m/%d %H:%M"  # JQL 날짜 조건은 분 단위까지 지정할 수 있습니다.
+COMMON_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "common")  # 공용 모듈(async_client) 디렉토리
+BULK_FETCH_SIZE = 100     # bulkfetch 요청 하나에 넣을 이슈 키 수 (API 최대값)
+BULK_FETCH_WORKERS = 8    # 동시에 조회할 키 묶음 수
+ISSUE_KEY_PATTERN = re.compile(r"\b[A-Z][A-Z0-9_]+-\d+\b")
 HEADERS = {
     "Accept": "application/json",
     "Content-Type": "application/json",
     "X-Atlassian-Force-Account-Id": "true"  # GDPR 모드 강제
 }
 
+def ensure_common_on_path():
+    # async_client import 전에 호출합니다. 이미 추가되어 있으면 sys.path를 변경하지 않습니다.
+    if COMMON_DIR not in sys.path:
+        sys.path.insert(0, COMMON_DIR)
+
 # =====================================
 # JQL 변환 함수 (User Privacy 대응)
 # =====================================
@@ -58,14 +84,20 @@ def clean_jql_with_pdcleaner(jql_query):
 # =====================================
 # JQL로 이슈 조회 (GET 방식)
 # =====================================
-def fetch_issues_with_jql(jql_query, max_results=1000, fields="key,summary,status,assignee,created"):
+def fetch_issues_with_jql(jql_query, max_results=1000, fields="key,summary,status,assignee,created", verbose=True):
     """
     GET /rest/api/3/search/jql?jql=... 방식으로 이슈 조회 (페이징 자동)
+    max_results가 0 또는 None이면 전체 조회, verbose=False이면 페이지별 진행 로그를 출력하지 않습니다.
+    응답에 nextPageToken이 있으면 토큰으로, 없으면 startAt과 isLast(또는 total)로 다음 페이지를 요청합니다. (Jira Cloud의 /search/jql은 total을 주지 않습니다.)
     """
+    if HTTP_BACKEND == "async":
+        return fetch_issues_with_jql_async(jql_query, max_results, fields)
+
     auth = HTTPBasicAuth(JIRA_EMAIL, JIRA_API_TOKEN)
     url = f"{JIRA_BASE_URL}/rest/api/3/search/jql"
 
     start_at = 0
+    next_page_token = None
     all_issues = []
 
     while True:
@@ -75,8 +107,22 @@ def fetch_issues_with_jql(jql_query, max_results=1000, fields="key,summary,statu
             "maxResults": min(PAGE_SIZE, max_results - len(all_issues)) if max_results else PAGE_SIZE,
             "fields": fields
         }
-
-        resp = requests.get(url, headers=HEADERS, auth=auth, params=params)
+        if next_page_token:
+            params["nextPageToken"] = next_page_token
+
+        try:
+            resp = requests.get(url, headers=HEADERS, auth=auth, params=params)
+
+            # 요청 제한(429)은 같은 페이지를 Retry-After만큼 기다린 후 다시 요청합니다. (샤딩 모드처럼 동시에 요청할 때 자주 발생)
+            for _ in range(RATE_LIMIT_RETRIES):
+                if resp.status_code != 429:
+                    break
+                time.sleep(float(resp.headers.get("Retry-After") or 1))
+                resp = requests.get(url, headers=HEADERS, auth=auth, params=params)
+        except requests.RequestException as e:
+            # 연결 오류/타임아웃도 실패(None)로 리턴해서, 샤딩 모드에서는 해당 샤드만 다시 조회합니다.
+            print(f"요청 실패 ({e})")
+            return None
 
         if resp.status_code != 200:
             print(f"요청 실패 ({resp.status_code})")
@@ -88,20 +134,276 @@ def fetch_issues_with_jql(jql_query, max_results=1000, fields="key,summary,statu
 
         data = resp.json()
         issues = data.get("issues", [])
-        total = data.get("total", 0)
 
         all_issues.extend(issues)
         fetched = len(issues)
-        print(f"[INFO] startAt={start_at} fetched={fetched} total_so_far={len(all_issues)} / {total}")
+        if verbose:
+            print(f"[INFO] startAt={start_at} fetched={fetched} total_so_far={len(all_issues)} / {data.get('total', '?')}")
 
-        if fetched == 0 or len(all_issues) >= total or (max_results and len(all_issues) >= max_results):
+        if fetched == 0 or (max_results and len(all_issues) >= max_results):
             break
-
+        next_page_token = data.get("nextPageToken")
+        if not next_page_token:
+            # 토큰이 없으면 isLast로, isLast도 없으면 total로 마지막 페이지인지 판단합니다.
+            is_last = data["isLast"] if "isLast" in data else "total" not in data or len(all_issues) >= data["total"]
+            if is_last:
+                break
         start_at += fetched
 
     return all_issues
 
 
+def fetch_issues_with_jql_async(jql_query, max_results=1000, fields="key,summary,status,assignee,created"):
+    """
+    fetch_issues_with_jql()의 비동기 버전 (첫 페이지의 total로 나머지 페이지를 동시에 조회, 결과 순서는 동일)
+    """
+    ensure_common_on_path()
+    import async_client
+
+    try:
+        issues = async_client.search_jql_sync(
+            JIRA_BASE_URL, (JIRA_EMAIL, JIRA_API_TOKEN), jql_query,
+            client_options=ASYNC_CLIENT_OPTIONS, fields=fields, max_results=max_results or 10 ** 9,
+            page_size=PAGE_SIZE, method="GET", headers=HEADERS
+        )
+    except Exception as e:
+        print(f"요청 실패 ({e})")
+        return None
+
+    print(f"[INFO] fetched={len(issues)} (async)")
+    return issues
+
+
+# =====================================
+# 샤딩 조회 (created 구간 분할)
+# =====================================
+def split_order_by(jql_query):
+    """
+    JQL을 (조건, ORDER BY 절)로 나눕니다. ORDER BY가 없으면 빈 문자열을 리턴합니다.
+    """
+    match = re.search(r"(?:^|\s+)ORDER\s+BY\s+.*$", jql_query, re.IGNORECASE | re.DOTALL)
+    if not match:
+        return jql_query.strip(), ""
+    return jql_query[:match.start()].strip(), match.group(0).strip()
+
+def build_window_jql(condition, window_start, window_end, order_by="ORDER BY created ASC, key ASC"):
+    """
+    조건에 created 구간 [window_start, window_end)을 추가한 JQL을 만듭니다.
+    """
+    window = f'created >= "{window_start.strftime(JQL_DATE_FORMAT)}" AND created < "{window_end.strftime(JQL_DATE_FORMAT)}"'
+    return f"({condition}) AND {window} {order_by}" if condition else f"{window} {order_by}"
+
+def count_issues(jql_query, retries=SHARD_RETRIES):
+    """
+    POST /rest/api/3/search/approximate-count로 JQL에 해당하는 이슈 수만 조회합니다. retries번 다시 시도해도 실패하면 None을 리턴합니다.
+    다시 시도하기 전에는 SHARD_RETRY_BACKOFF초부터 2배씩 늘어나는 시간(429 응답은 Retry-After)만큼 기다립니다.
+    응답에 count가 없으면 0으로 보지 않고 None을 리턴합니다. (빈 구간으로 처리되어 샤드가 빠지지 않도록 합니다.)
+    """
+    auth = HTTPBasicAuth(JIRA_EMAIL, JIRA_API_TOKEN)
+    payload = {"jql": jql_query}
+    for attempt in range(retries + 1):
+        wait = SHARD_RETRY_BACKOFF * 2 ** attempt
+        try:
+            resp = requests.post(f"{JIRA_BASE_URL}/rest/api/3/search/approximate-count", headers=HEADERS, auth=auth, json=payload)
+        except requests.RequestException as e:
+            print(f"⚠️ 이슈 수 조회 중 오류 발생: {e}")
+        else:
+            if resp.status_code == 200:
+                count = resp.json().get("count")
+                if count is None:
+                    print(f"⚠️ 이슈 수 조회 응답에 count가 없습니다: {resp.text[:200]}")
+                    return None
+                return int(count)
+            print(f"⚠️ 이슈 수 조회 실패 ({resp.status_code})")
+            if resp.status_code == 429:
+                wait = float(resp.headers.get("Retry-After") or wait)
+        if attempt < retries:
+            time.sleep(wait)
+    return None
+
+def get_created_bounds(condition):
+    """
+    조건에 해당하는 이슈 중 가장 오래된/최신 created 시각을 (분 단위 datetime) 튜플로 리턴합니다. 이슈가 없으면 None을 리턴합니다.
+    """
+    bounds = []
+    for direction in ("ASC", "DESC"):
+        issues = fetch_issues_with_jql(f"{condition} ORDER BY created {direction}" if condition else f"ORDER BY created {direction}", max_results=1, fields="created", verbose=False)
+        if not issues:
+            return None
+        # 응답의 시각은 계정 시간대 기준이며, JQL 날짜 조건도 같은 시간대로 해석되므로 오프셋은 제외합니다.
+        bounds.append(datetime.strptime(issues[0]["fields"]["created"][:16], "%Y-%m-%dT%H:%M"))
+    return bounds[0], bounds[1] + timedelta(minutes=1)
+
+def plan_shards(condition, target_size=SHARD_TARGET_SIZE, workers=SHARD_WORKERS):
+    """
+    created 구간을 이슈 수에 맞춰 나눕니다.
+    전체 구간에서 시작해서, 이슈 수가 target_size보다 많은 구간은 반으로 나누는 과정을 반복합니다. (같은 단계의 구간은 병렬로 이슈 수 조회)
+
+    Returns:
+        shards: [(구간 시작, 구간 끝, 이슈 수), ...] 시간 순서 리스트, 실패하면 None
+    """
+    bounds = get_created_bounds(condition)
+    if bounds is None:
+        return []
+
+    pending = [bounds]
+    shards = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while pending:
+            counts = list(executor.map(lambda window: count_issues(build_window_jql(condition, *window, order_by="")), pending))
+            next_pending = []
+            for (window_start, window_end), count in zip(pending, counts):
+                if count is None:
+                    return None
+                if count == 0:
+                    continue
+                # 1분보다 짧게는 나눌 수 없으므로, 1분 구간은 이슈 수와 관계없이 그대로 사용합니다.
+                if count > target_size and window_end - window_start > timedelta(minutes=1):
+                    middle = window_start + (window_end - window_start) / 2
+                    middle = middle.replace(second=0, microsecond=0)
+                    if middle <= window_start:
+                        middle = window_start + timedelta(minutes=1)
+                    next_pending.extend([(window_start, middle), (middle, window_end)])
+                else:
+                    shards.append((window_start, window_end, count))
+            pending = next_pending
+    return sorted(shards)
+
+def fetch_issues_sharded(jql_query, fields="key,summary,status,assignee,created", target_size=SHARD_TARGET_SIZE, workers=SHARD_WORKERS, retries=SHARD_RETRIES):
+    """
+    JQL을 created 구간 샤드로 나누어 병렬 조회하고, 하나의 리스트로 병합합니다.
+
+    Returns:
+        issues: created 오름차순(같으면 샤드 내 key 순서)으로 병합되고 key 기준으로 중복이 제거된 이슈 리스트
+        failed_shards: 재시도 후에도 실패한 샤드의 JQL 리스트 (해당 JQL만 따로 다시 조회할 수 있습니다.)
+
+    Notes:
+        # 1. 원래 JQL의 ORDER BY 절은 샤드 병합 순서(created 오름차순)로 대체됩니다.
+        # 2. 샤드 하나가 실패해도(연결 오류/타임아웃 포함) 다른 샤드는 다시 조회하지 않고, 실패한 샤드만 retries번까지 다시 조회합니다.
+    """
+    condition, order_by = split_order_by(jql_query)
+    if order_by:
+        print(f"샤딩 모드에서는 '{order_by}' 대신 created 오름차순으로 병합합니다.")
+    if "created" not in fields.split(","):
+        fields += ",created"
+
+    shards = plan_shards(condition, target_size, workers)
+    if shards is None:
+        print("샤드 계획 중 이슈 수 조회에 실패했습니다.")
+        return None, []
+    print(f"[INFO] {len(shards)}개 샤드, 예상 이슈 수 {sum(count for _, _, count in shards)}")
+
+    shard_jqls = [build_window_jql(condition, window_start, window_end) for window_start, window_end, _ in shards]
+    results = [None] * len(shard_jqls)
+    remaining = list(range(len(shard_jqls)))
+
+    for attempt in range(retries + 1):
+        if attempt:
+            time.sleep(SHARD_RETRY_BACKOFF * 2 ** (attempt - 1))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            fetched = list(executor.map(lambda index: fetch_issues_with_jql(shard_jqls[index], max_results=0, fields=fields, verbose=False), remaining))
+        for index, issues in zip(remaining, fetched):
+            results[index] = issues
+        remaining = [index for index in remaining if results[index] is None]
+        done = len(shard_jqls) - len(remaining)
+        print(f"[INFO] 샤드 {done}/{len(shard_jqls)} 완료" + (f", 실패 {len(remaining)}개 재시도 ({attempt + 1}/{retries})" if remaining and attempt < retries else ""))
+        if not remaining:
+            break
+
+    merged = []
+    seen_keys = set()
+    for issues in results:
+        for issue in issues or []:
+            if issue.get("key") not in seen_keys:
+                seen_keys.add(issue.get("key"))
+                merged.append(issue)
+
+    failed_shards = [shard_jqls[index] for index in remaining]
+    for failed_jql in failed_shards:
+        print(f"⚠️ 샤드 조회 실패: {failed_jql}")
+    return merged, failed_shards
+
+
+# =====================================
+# 이슈 키 목록으로 조회 (POST bulkfetch)
+# =====================================
+def load_issue_keys(path):
+    """
+    파일에서 이슈 키(QA-123 형식)를 등장 순서대로 추출합니다. (한 줄에 하나씩 또는 테스트 결과 CSV 등 형식 무관)
+    """
+    with open(path, "r", encoding="utf-8-sig") as f:
+        return ISSUE_KEY_PATTERN.findall(f.read())
+
+def fetch_issue_batch(issue_keys, fields="key,summary,status,assignee,created"):
+    """
+    POST /rest/api/3/issue/bulkfetch로 이슈 키 묶음(최대 100개)을 한 번에 조회합니다.
+    실패하면 None을 리턴합니다. 없는 키나 권한이 없는 키는 응답에서 빠지기만 하고 요청 자체는 성공합니다.
+    """
+    auth = HTTPBasicAuth(JIRA_EMAIL, JIRA_API_TOKEN)
+    url = f"{JIRA_BASE_URL}/rest/api/3/issue/bulkfetch"
+    payload = {"issueIdsOrKeys": issue_keys, "fields": fields.split(",")}
+
+    try:
+        resp = requests.post(url, headers=HEADERS, auth=auth, json=payload)
+        for _ in range(RATE_LIMIT_RETRIES):
+            if resp.status_code != 429:
+                break
+            time.sleep(float(resp.headers.get("Retry-After") or 1))
+            resp = requests.post(url, headers=HEADERS, auth=auth, json=payload)
+    except requests.RequestException as e:
+        print(f"⚠️ bulkfetch 요청 중 오류 발생: {e}")
+        return None
+
+    if resp.status_code != 200:
+        print(f"bulkfetch 요청 실패 ({resp.status_code}): {resp.text[:300]}")
+        return None
+    return resp.json().get("issues", [])
+
+def fetch_issues_by_keys(issue_keys, fields="key,summary,status,assignee,created", batch_size=BULK_FETCH_SIZE, workers=BULK_FETCH_WORKERS, retries=SHARD_RETRIES):
+    """
+    이슈 키 목록을 batch_size개씩 나누어 병렬 조회하고, 입력 순서대로 정렬합니다.
+
+    Returns:
+        issues: 입력 순서대로 정렬된 이슈 리스트 (중복 키는 한 번만 포함)
+        missing_keys: 조회되지 않은 키 리스트 (존재하지 않거나 권한이 없는 키, 재시도 후에도 실패한 묶음의 키)
+
+    Notes:
+        # 1. 긴 "key in (...)" JQL은 GET 요청의 URL 길이 제한에 걸리므로, 키를 본문에 담는 bulkfetch를 사용합니다.
+        # 2. 실패한 묶음만 retries번까지 다시 조회합니다.
+        # 3. 다른 프로젝트로 이동되어 키가 바뀐 이슈는 새 키로 응답되므로 missing_keys에 포함됩니다.
+    """
+    ordered_keys = list(dict.fromkeys(key.strip().upper() for key in issue_keys if key.strip()))
+    batches = [ordered_keys[start:start + batch_size] for start in range(0, len(ordered_keys), batch_size)]
+    print(f"[INFO] 이슈 키 {len(ordered_keys)}개를 {len(batches)}개 묶음으로 조회")
+
+    found = {}
+    failed_keys = []
+    remaining = list(range(len(batches)))
+    for attempt in range(retries + 1):
+        if attempt:
+            time.sleep(SHARD_RETRY_BACKOFF * 2 ** (attempt - 1))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            fetched = list(executor.map(lambda index: fetch_issue_batch(batches[index], fields), remaining))
+        for index, issues in zip(remaining, fetched):
+            for issue in issues or []:
+                found[issue.get("key", "").upper()] = issue
+        remaining = [index for index, issues in zip(remaining, fetched) if issues is None]
+        if not remaining:
+            break
+        if attempt < retries:
+            print(f"[INFO] 실패한 묶음 {len(remaining)}개 재시도 ({attempt + 1}/{retries})")
+    for index in remaining:
+        failed_keys.extend(batches[index])
+
+    issues = [found[key] for key in ordered_keys if key in found]
+    missing_keys = [key for key in ordered_keys if key not in found]
+    if failed_keys:
+        print(f"⚠️ 조회 실패한 키 {len(failed_keys)}개 (요청 오류)")
+    if len(missing_keys) > len(failed_keys):
+        print(f"⚠️ 존재하지 않거나 권한이 없는 키 {len(missing_keys) - len(failed_keys)}개")
+    return issues, missing_keys
+
+
 # =====================================
 # 결과 출력 및 저장
 # =====================================
@@ -162,22 +464,39 @@ if __name__ == "__main__":
     print("Jira JQL 검색기 (v3, User Privacy 대응)")
     print('예시: project = QA AND status = "In Progress" ORDER BY created DESC')
     print("주의: assignee/reporter 조건은 accountId 기반으로 검색해야 합니다.")
-    print("   (예: assignee = 5f8e3b2c1234560071a1a1a1)\n")
+    print("   (예: assignee = 5f8e3b2c1234560071a1a1a1)")
+    print("이슈 키 목록 파일로 조회하려면 '@파일경로'를 입력하세요. (예: @failed_tests.csv)\n")
 
     jql_input = input("JQL 입력: ").strip()
     if not jql_input:
         print("JQL을 입력해야 합니다.")
         sys.exit(1)
 
-    # ① pdcleaner API로 JQL 자동 변환
-    jql_cleaned = clean_jql_with_pdcleaner(jql_input)
-
-    # ② 최대 이슈 수 입력
-    max_input = input("가져올 최대 이슈 수 (기본=1000): ").strip()
-    max_results = int(max_input) if max_input.isdigit() else 1000
-
-    # ③ 이슈 조회
-    issues = fetch_issues_with_jql(jql_cleaned, max_results=max_results)
+    # ① 키 목록 모드: 파일의 이슈 키를 bulkfetch로 조회 (JQL 변환 불필요)
+    if jql_input.startswith("@"):
+        key_path = jql_input[1:].strip()
+        if not os.path.exists(key_path):
+            print(f"키 목록 파일을 찾을 수 없습니다: {key_path}")
+            sys.exit(1)
+        issues, missing_keys = fetch_issues_by_keys(load_issue_keys(key_path))
+        if missing_keys:
+            print(f"조회되지 않은 키: {', '.join(missing_keys[:50])}" + (f" 외 {len(missing_keys) - 50}개" if len(missing_keys) > 50 else ""))
+
+    # ② pdcleaner API로 JQL 자동 변환 후 최대 이슈 수 입력 (샤딩 모드는 전체 이슈를 created 구간으로 나누어 병렬 조회)
+    elif input("샤딩 모드로 전체 이슈를 조회할까요? (대량 export용, y/N): ").strip().lower() == "y":
+        jql_cleaned = clean_jql_with_pdcleaner(jql_input)
+        workers_input = input(f"동시 조회 샤드 수 (기본={SHARD_WORKERS}): ").strip()
+        workers = int(workers_input) if workers_input.isdigit() else SHARD_WORKERS
+
+        # ③ 이슈 조회
+        issues, failed_shards = fetch_issues_sharded(jql_cleaned, workers=workers)
+    else:
+        jql_cleaned = clean_jql_with_pdcleaner(jql_input)
+        max_input = input("가져올 최대 이슈 수 (기본=1000): ").strip()
+        max_results = int(max_input) if max_input.isdigit() else 1000
+
+        # ③ 이슈 조회
+        issues = fetch_issues_with_jql(jql_cleaned, max_results=max_results)
     if not issues:
         sys.exit(1)
 
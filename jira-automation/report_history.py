@@ -0,0 +1,139 @@
+"""
+report_history.py
+- jira_report.job() 실행마다 구간(tier)별 이슈 키를 로컬 SQLite 파일에 저장 (이슈 키와 구간 번호만 저장)
+- 직전 실행과 비교해서 새로 미업데이트 구간에 들어온 이슈, 빠져나간(해결/업데이트된) 이슈, 더 오래된 구간으로 이동한 이슈를 계산
+- 주간 추이(실행별 구간 이슈 수)는 Jira를 다시 조회하지 않고 저장된 기록에서 바로 조회
+- 단독 실행: python report_history.py trend --profile TUYA-QA --weeks 4
+"""
+
+import argparse
+import os
+import sqlite3
+from datetime import datetime, timedelta
+
+DEFAULT_DB_PATH = "jira_report_history.db"
+DEFAULT_PROFILE = "default"  # 프로필 이름이 없는 보고서 ("profiles"가 없는 설정 파일)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    profile TEXT NOT NULL,
+    run_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_profile ON runs (profile, run_at);
+CREATE TABLE IF NOT EXISTS snapshots (
+    run_id INTEGER NOT NULL,
+    issue_key TEXT NOT NULL,
+    tier INTEGER NOT NULL,
+    PRIMARY KEY (run_id, issue_key)
+) WITHOUT ROWID;
+"""
+
+def open_history(db_path=DEFAULT_DB_PATH):
+    """기록 파일을 열고, 테이블이 없으면 생성합니다.
+
+    Notes:
+        # 1. 여러 보고서 프로필이 동시에 저장할 수 있도록 WAL 모드와 잠금 대기 시간(30초)을 사용합니다.
+    """
+    conn = sqlite3.connect(db_path, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+def save_snapshot(conn, profile, tier_keys, run_at=None):
+    """실행 한 번의 구간별 이슈 키를 저장합니다.
+
+    Args:
+        conn: open_history()로 연 연결
+        profile: 보고서 프로필 이름
+        tier_keys: 구간 순서(덜 오래된 구간 → 더 오래된 구간)대로, 각 구간의 이슈 키 리스트
+        run_at: 실행 시각, Default None (현재 시각)
+
+    Returns:
+        run_id: 저장된 실행 번호
+    """
+    run_at = (run_at or datetime.now()).isoformat(timespec="seconds")
+    with conn:
+        run_id = conn.execute("INSERT INTO runs (profile, run_at) VALUES (?, ?)", (profile, run_at)).lastrowid
+        conn.executemany(
+            "INSERT OR REPLACE INTO snapshots (run_id, issue_key, tier) VALUES (?, ?, ?)",
+            ((run_id, key, tier) for tier, keys in enumerate(tier_keys) for key in keys)
+        )
+    return run_id
+
+def load_latest_snapshot(conn, profile):
+    """프로필의 가장 최근 실행 기록을 {이슈 키: 구간 번호}로 리턴합니다. 기록이 없으면 None을 리턴합니다."""
+    row = conn.execute("SELECT run_id, run_at FROM runs WHERE profile = ? ORDER BY run_id DESC LIMIT 1", (profile,)).fetchone()
+    if row is None:
+        return None
+    return dict(conn.execute("SELECT issue_key, tier FROM snapshots WHERE run_id = ?", (row[0],)))
+
+def compute_delta(previous, tier_keys):
+    """직전 실행과 이번 실행의 구간별 이슈를 비교합니다.
+
+    Args:
+        previous: load_latest_snapshot()의 결과 ({이슈 키: 구간 번호}), 기록이 없으면 None
+        tier_keys: 이번 실행의 구간별 이슈 키 리스트
+
+    Returns:
+        delta: {"new": 새로 미업데이트 구간에 들어온 키, "resolved": 구간에서 빠져나간 키, "moved_up": (키, 이전 구간, 현재 구간) 리스트}
+               직전 실행 기록이 없으면 None을 리턴합니다.
+
+    Notes:
+        # 1. "resolved"는 완료되었거나, 업데이트되어 1주 미만 이슈가 된 경우를 모두 포함합니다.
+    """
+    if previous is None:
+        return None
+    current = {key: tier for tier, keys in enumerate(tier_keys) for key in keys}
+    return {
+        "new": [key for key in current if key not in previous],
+        "resolved": sorted(key for key in previous if key not in current),
+        "moved_up": [(key, previous[key], tier) for key, tier in current.items() if key in previous and tier > previous[key]]
+    }
+
+def query_trend(conn, profile, weeks=4):
+    """최근 weeks주 동안의 실행별 구간 이슈 수를 조회합니다.
+
+    Returns:
+        trend: [(실행 시각, {구간 번호: 이슈 수}), ...] 오래된 실행부터 정렬
+    """
+    since = (datetime.now() - timedelta(weeks=weeks)).isoformat(timespec="seconds")
+    rows = conn.execute(
+        """
+        SELECT r.run_id, r.run_at, s.tier, COUNT(s.issue_key)
+        FROM runs r LEFT JOIN snapshots s ON s.run_id = r.run_id
+        WHERE r.profile = ? AND r.run_at >= ?
+        GROUP BY r.run_id, s.tier
+        ORDER BY r.run_id
+        """,
+        (profile, since)
+    )
+    trend = {}
+    for run_id, run_at, tier, count in rows:
+        counts = trend.setdefault(run_id, (run_at, {}))[1]
+        if tier is not None:
+            counts[tier] = count
+    return list(trend.values())
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Jira 미업데이트 이슈 기록 조회")
+    parser.add_argument("--db", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), DEFAULT_DB_PATH), help="기록 파일 경로")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    trend_parser = subparsers.add_parser("trend", help="실행별 구간 이슈 수 추이")
+    trend_parser.add_argument("--profile", default=DEFAULT_PROFILE, help=f"보고서 프로필 이름 (기본 {DEFAULT_PROFILE})")
+    trend_parser.add_argument("--weeks", type=int, default=4, help="조회 기간 (주, 기본 4)")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"기록 파일이 없습니다: {args.db}")
+        raise SystemExit(1)
+
+    conn = open_history(args.db)
+    trend = query_trend(conn, args.profile, args.weeks)
+    if not trend:
+        print(f"'{args.profile}' 프로필의 최근 {args.weeks}주 기록이 없습니다.")
+    tier_count = max((max(counts, default=-1) + 1 for _, counts in trend), default=0)
+    for run_at, counts in trend:
+        columns = "  ".join(f"구간{tier + 1} {counts.get(tier, 0):>5}" for tier in range(tier_count))
+        print(f"{run_at}  합계 {sum(counts.values()):>6}  {columns}")
+    conn.close()
@@ -1,85 +1,643 @@
+import argparse
+import csv
+import hashlib
+import json
+import os
 import random
 import string
+import time
+from array import array
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 import yaml
 
-def get_random_item(my_list):
-    if not my_list:
-        return None  # 빈 리스트인 경우 None을 반환
-    return random.choice(my_list)
+try:
+    import numpy as np  # 대량 생성 시 사용 (설치되어 있지 않으면 random.choices로 생성)
+except ImportError:
+    np = None
+
+# 한국어와 일본어 특수문자 범위 설정
+KOREAN_CODEPOINTS = range(0xAC00, 0xD7A4)  # Hangul Syllables
+JAPANESE_CODEPOINTS = range(0x3040, 0x30A0)  # Hiragana & Katakana
+
+# =====================================
+# 문자셋 레지스트리
+# =====================================
+# codepoints: 단일 코드포인트 문자 (array('I')로 저장)
+# graphemes: 여러 코드포인트가 하나의 글자(grapheme cluster)를 이루는 문자열 (이모지 ZWJ 시퀀스, 결합 문자 등)
+# weight: 여러 문자셋을 섞어서 생성할 때의 기본 가중치
+Charset = namedtuple("Charset", ["name", "codepoints", "graphemes", "weight"])
+CHARSET_REGISTRY = {}
+
+def register_charset(name, ranges=(), chars="", graphemes=(), weight=1.0):
+    # ranges는 (시작, 끝) 코드포인트 쌍이며 끝 값을 포함합니다.
+    codepoints = array('I')
+    for start, end in ranges:
+        codepoints.extend(range(start, end + 1))
+    codepoints.extend(map(ord, chars))
+    CHARSET_REGISTRY[name] = Charset(name, codepoints, tuple(graphemes), float(weight))
+    get_charset_table.cache_clear()
+    return CHARSET_REGISTRY[name]
+
+# 결합 문자(Combining Marks)를 붙인 라틴 문자 (한 글자로 보이지만 코드포인트는 2개 이상)
+COMBINING_MARKS = "\u0300\u0301\u0302\u0303\u0308\u030A\u030C\u0323\u0327\u0331"
+COMBINING_GRAPHEMES = [base + mark for base in "aeiouAEnNcz" for mark in COMBINING_MARKS] + [
+    "a\u0308\u0323", "e\u0301\u0327", "o\u0302\u0303\u0323", "Z\u0336\u0353\u033D\u0310"
+]
+
+# 이모지 ZWJ 시퀀스, 피부색 수식어, 국기, 키캡 등 여러 코드포인트로 이루어진 이모지
+EMOJI_GRAPHEMES = [
+    "\U0001F468\u200D\U0001F469\u200D\U0001F467\u200D\U0001F466",  # 가족
+    "\U0001F469\u200D\U0001F4BB",  # 기술자
+    "\U0001F9D1\u200D\U0001F680",  # 우주비행사
+    "\U0001F3F3\uFE0F\u200D\U0001F308",  # 무지개 깃발
+    "\U0001F441\uFE0F\u200D\U0001F5E8\uFE0F",  # 말풍선 속 눈
+    "\u2764\uFE0F\u200D\U0001F525",  # 불타는 하트
+    "\U0001F44D\U0001F3FB", "\U0001F44D\U0001F3FD", "\U0001F44D\U0001F3FF",  # 피부색 수식어
+    "\U0001F469\U0001F3FE\u200D\U0001F52C",  # 피부색 + ZWJ
+    "\U0001F1F0\U0001F1F7", "\U0001F1EF\U0001F1F5", "\U0001F1FA\U0001F1F8", "\U0001F1F9\U0001F1ED",  # 국기
+    "1\uFE0F\u20E3", "#\uFE0F\u20E3",  # 키캡
+    "\u263A\uFE0F", "\u2600\uFE0F"  # 이모지 표시 선택자
+]
+
+# 태국어 자음 + 모음/성조 기호 조합 (한 글자)
+THAI_GRAPHEMES = [consonant + mark for consonant in "กขคงจซดตนบปมยรลวสห" for mark in "\u0E31\u0E34\u0E35\u0E36\u0E37\u0E38\u0E39\u0E48\u0E49\u0E4A\u0E4B"] + [
+    "\u0E19\u0E49\u0E33", "\u0E01\u0E33", "\u0E01\u0E34\u0E4A"
+]
+
+# 아랍어 자음 + 모음 부호(harakat) 조합
+ARABIC_GRAPHEMES = [letter + mark for letter in "\u0628\u062A\u0633\u0644\u0645\u0646\u0643" for mark in "\u064E\u064F\u0650\u0651\u0652"]
 
-def generate_random_string(length, use_korean=True, use_japanese=True, use_numbers=True, use_special_chars=True, prefix=""):
-    # 한국어와 일본어 특수문자 범위 설정
-    korean_chars = [chr(i) for i in range(0xAC00, 0xD7A4)]  # Hangul Syllables
-    japanese_chars = [chr(i) for i in range(0x3040, 0x30A0)]  # Hiragana & Katakana
+# 길이 측정 기준: 생성되는 단위(unit)는 항상 grapheme cluster 1개입니다.
+LENGTH_MEASURES = {
+    "graphemes": lambda unit: 1,
+    "codepoints": len,
+    "utf8": lambda unit: len(unit.encode('utf-8')),
+    "utf16": lambda unit: len(unit.encode('utf-16-le')) // 2,
+}
+
+@lru_cache(maxsize=None)
+def get_charset_table(charset_weights):
+    # (문자셋 이름, 가중치) 튜플로 샘플링 테이블(문자셋 목록, 누적 가중치)을 만들어 재사용합니다.
+    charsets = []
+    cum_weights = []
+    total = 0.0
+    for name, weight in charset_weights:
+        if name not in CHARSET_REGISTRY:
+            raise KeyError(f"등록되지 않은 문자셋입니다: {name} (사용 가능: {', '.join(sorted(CHARSET_REGISTRY))})")
+        charset = CHARSET_REGISTRY[name]
+        weight = charset.weight if weight is None else float(weight)
+        if weight <= 0 or not (len(charset.codepoints) or charset.graphemes):
+            continue
+        total += weight
+        charsets.append(charset)
+        cum_weights.append(total)
+    if not charsets:
+        raise ValueError("샘플링할 문자셋이 없습니다.")
+    return tuple(charsets), tuple(cum_weights)
+
+def normalize_charset_weights(charsets):
+    # 문자셋 지정값(이름 리스트 또는 {이름: 가중치})을 캐시 키로 사용할 수 있는 튜플로 변환합니다.
+    if charsets is None:
+        charsets = ["korean", "japanese", "digits", "punctuation"]
+    if isinstance(charsets, str):
+        charsets = [charsets]
+    if isinstance(charsets, dict):
+        return tuple(sorted(charsets.items()))
+    return tuple((name, None) for name in charsets)
+
+def sample_grapheme(charsets, cum_weights, rng):
+    # 문자셋을 가중치로 고른 뒤, 문자셋 안에서 단일 문자/조합 문자를 균등하게 하나 고릅니다.
+    charset = rng.choices(charsets, cum_weights=cum_weights)[0]
+    index = int(rng.random() * (len(charset.codepoints) + len(charset.graphemes)))
+    if index < len(charset.codepoints):
+        return chr(charset.codepoints[index])
+    return charset.graphemes[index - len(charset.codepoints)]
+
+def generate_charset_string(length, charsets=None, measure="graphemes", prefix="", rng=None, max_attempts=8):
+    # 레지스트리의 문자셋으로 문자열을 생성합니다.
+    # length는 measure 기준의 최대 길이입니다. (graphemes: 글자 수, codepoints: 코드포인트 수, utf8: 바이트 수, utf16: UTF-16 코드 유닛 수)
+    # 다음 글자가 길이 제한을 넘으면 max_attempts번까지 다른 글자를 뽑아보고, 모두 넘으면 생성을 멈춥니다.
+    rng = rng or random
+    unit_length = LENGTH_MEASURES[measure]
+    table, cum_weights = get_charset_table(normalize_charset_weights(charsets))
 
-    # 숫자 및 특수문자 범위 설정
-    numbers = string.digits
-    special_chars = string.punctuation
+    units = []
+    used = 0
+    attempts = 0
+    while used < length and attempts < max_attempts:
+        unit = sample_grapheme(table, cum_weights, rng)
+        size = unit_length(unit)
+        if used + size > length:
+            attempts += 1
+            continue
+        units.append(unit)
+        used += size
+        attempts = 0
+    return prefix + ''.join(units)
+
+def generate_charset_strings(count, length, charsets=None, measure="graphemes", prefix="", rng=None):
+    # generate_charset_string()을 count번 실행하여 리스트로 리턴합니다.
+    rng = rng or random
+    return [generate_charset_string(length, charsets, measure, prefix, rng) for _ in range(count)]
+
+# 기본 문자셋 등록 (register_charset()으로 문자셋을 추가할 수 있습니다.)
+register_charset("korean", ranges=[(0xAC00, 0xD7A3)])
+register_charset("hiragana", ranges=[(0x3041, 0x3096), (0x309D, 0x309F)])
+register_charset("katakana", ranges=[(0x30A1, 0x30FA), (0x30FC, 0x30FF)])
+register_charset("japanese", ranges=[(0x3041, 0x3096), (0x309D, 0x309F), (0x30A1, 0x30FA), (0x30FC, 0x30FF)])
+register_charset("chinese", ranges=[(0x4E00, 0x9FFF)])
+register_charset("thai", ranges=[(0x0E01, 0x0E30), (0x0E32, 0x0E32), (0x0E40, 0x0E46), (0x0E50, 0x0E59)], graphemes=THAI_GRAPHEMES)
+register_charset("arabic", ranges=[(0x0621, 0x063A), (0x0641, 0x064A), (0x0660, 0x0669)], graphemes=ARABIC_GRAPHEMES)
+register_charset("emoji", ranges=[(0x1F600, 0x1F64F), (0x1F680, 0x1F6C5), (0x1F90C, 0x1F93A)], graphemes=EMOJI_GRAPHEMES)
+register_charset("combining", graphemes=COMBINING_GRAPHEMES)
+register_charset("fullwidth", ranges=[(0xFF01, 0xFF5E), (0xFF66, 0xFF9D)])
+register_charset("latin", chars=string.ascii_letters)
+register_charset("digits", chars=string.digits)
+register_charset("punctuation", chars=string.punctuation)
+
+def get_random_item(my_list, rng=None):
+    if not my_list:
+        return None  # 빈 리스트인 경우 None을 반환
+    return (rng or random).choice(my_list)
 
-    # 문자 리스트 생성
+@lru_cache(maxsize=None)
+def get_char_pool(use_korean=True, use_japanese=True, use_numbers=True, use_special_chars=True):
+    # 옵션 조합별 문자 풀은 한 번만 만들고 재사용합니다.
     chars = ""
     if use_korean:
-        chars += ''.join(korean_chars)
+        chars += ''.join(map(chr, KOREAN_CODEPOINTS))
     if use_japanese:
-        chars += ''.join(japanese_chars)
+        chars += ''.join(map(chr, JAPANESE_CODEPOINTS))
     if use_numbers:
-        chars += numbers
+        chars += string.digits
     if use_special_chars:
-        chars += special_chars
+        chars += string.punctuation
+    return chars
+
+@lru_cache(maxsize=None)
+def get_codepoint_array(use_korean=True, use_japanese=True, use_numbers=True, use_special_chars=True):
+    # NumPy 샘플링용 코드포인트 배열 (uint32)
+    pool = get_char_pool(use_korean, use_japanese, use_numbers, use_special_chars)
+    return np.array([ord(c) for c in pool], dtype=np.uint32)
+
+def generate_random_string(length, use_korean=True, use_japanese=True, use_numbers=True, use_special_chars=True, prefix="", rng=None):
+    chars = get_char_pool(use_korean, use_japanese, use_numbers, use_special_chars)
 
     # 주어진 길이만큼 무작위 문자 선택
-    random_string = prefix + ''.join(random.choice(chars) for _ in range(length))
+    random_string = prefix + ''.join((rng or random).choices(chars, k=length))
 
     return random_string
 
-# 사용자로부터 파일명 입력 받기
-input_filename = input("기존 YAML 파일명을 입력하세요: ")
-output_filename = input("새로운 YAML 파일명을 입력하세요: ")
-
-# 기존 YAML 파일 로드
-with open(input_filename, 'r') as file:
-    data = yaml.load(file, Loader=yaml.FullLoader)
-
-random_string = generate_random_string(5, use_korean=True, use_japanese=True, use_numbers=True, use_special_chars=True, prefix="")
-type_list = ['table', 'pickpoint', 'charging_station', 'route']
-random_type = get_random_item(type_list)
-
-# 새로운 데이터 생성
-new_data = {
-    random_string: {
-            'name': random_string,
-            'orientation': {
-                'w': 0,
-                'x': 0,
-                'y': 0,
-                'z': 0
-            },
-            'position': {
-                'x': 0,
-                'y': 0,
-                'z': 0
-            },
-            'type': random_type
-        }
-}
-print(random_string, random_type)
-
-# data = {
-#     'name': 'John Smith',
-#     'age': 30,
-#     'height': 180.5,
-#     'is_student': True,
-#     'fruits': ['apple', 'banana', 'cherry'],
-#     'address': {
-#         'street': '123 Main St',
-#         'city': 'Anytown',
-#         'zip': '12345'
-#     }
-# }
-
-# 기존 데이터에 새로운 데이터 추가
-data['destinations'].update(new_data)
-
-# 수정된 데이터를 새로운 YAML 파일로 저장
-with open(output_filename, 'w') as new_file:
-    yaml.dump(data, new_file)
+def generate_random_strings(count, length, use_korean=True, use_japanese=True, use_numbers=True, use_special_chars=True, prefix="", rng=None, use_numpy=True):
+    # 길이가 length인 무작위 문자열 count개를 한 번에 생성합니다.
+    # NumPy가 있으면 코드포인트 배열에서 (count, length) 크기로 한 번에 샘플링하고, 없으면 random.choices를 한 번만 호출합니다.
+    rng = rng or random
+    if count <= 0:
+        return []
+    if length <= 0:
+        return [prefix] * count
+
+    if use_numpy and np is not None:
+        codepoints = get_codepoint_array(use_korean, use_japanese, use_numbers, use_special_chars)
+        generator = np.random.default_rng(rng.getrandbits(64))
+        sampled = codepoints[generator.integers(0, len(codepoints), size=(count, length))]
+        # (count, length) uint32 배열을 길이 length의 유니코드 문자열 배열로 변환 (복사 없이 view)
+        strings = sampled.view(f'U{length}').ravel().tolist()
+    else:
+        chars = get_char_pool(use_korean, use_japanese, use_numbers, use_special_chars)
+        joined = ''.join(rng.choices(chars, k=count * length))
+        strings = [joined[i:i + length] for i in range(0, count * length, length)]
+
+    if prefix:
+        return [prefix + s for s in strings]
+    return strings
+
+def benchmark_generation(count=100000, length=5, repeat=3):
+    # 문자열 생성 방식별 처리량(strings/sec)을 측정합니다.
+    cases = [
+        ("generate_random_string (단건 반복)", lambda: [generate_random_string(length) for _ in range(count)]),
+        ("generate_random_strings (random.choices)", lambda: generate_random_strings(count, length, use_numpy=False)),
+    ]
+    if np is not None:
+        cases.append(("generate_random_strings (NumPy)", lambda: generate_random_strings(count, length, use_numpy=True)))
+    else:
+        print("NumPy가 설치되어 있지 않아 NumPy 측정을 건너뜁니다.")
+
+    print(f"문자열 {count:,}개 x 길이 {length} 생성 (최소 {repeat}회 측정)")
+    for label, func in cases:
+        elapsed = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            elapsed.append(time.perf_counter() - started)
+        best = min(elapsed)
+        print(f"  {label:<45} {best:8.3f}s  {count / best:>14,.0f} strings/sec")
+
+# =====================================
+# YAML 목적지(destinations) 생성
+# =====================================
+# LibYAML(C 확장)이 설치되어 있으면 C 로더/덤퍼를 사용합니다.
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+DESTINATION_TYPES = ['table', 'pickpoint', 'charging_station', 'route']
+STREAM_CHUNK_SIZE = 1000
+
+def build_destination(name, destination_type, position=(0, 0, 0), orientation=(0, 0, 0, 0)):
+    # 목적지 레코드 하나를 생성합니다. (position: x, y, z / orientation: w, x, y, z)
+    return {
+        'name': name,
+        'orientation': {
+            'w': orientation[0],
+            'x': orientation[1],
+            'y': orientation[2],
+            'z': orientation[3]
+        },
+        'position': {
+            'x': position[0],
+            'y': position[1],
+            'z': position[2]
+        },
+        'type': destination_type
+    }
+
+def make_pose_sampler(bounds=((-50.0, 50.0), (-50.0, 50.0), (0.0, 0.0)), distribution="uniform", routes=None,
+                      clusters=8, cluster_spread=2.0, cluster_skew=1.0, route_jitter=0.0, planar=True, rng=None, decimals=4):
+    # 목적지 위치/방향을 NumPy로 한 번에 생성하는 샘플러를 만듭니다.
+    # 리턴된 sample(count)는 (positions, orientations) 리스트를 리턴합니다. (positions: [x, y, z], orientations: [w, x, y, z])
+    #   - distribution="uniform": bounds 안에서 균등하게 배치
+    #   - distribution="clustered": bounds 안의 클러스터 중심 주변에 정규분포로 배치 (cluster_skew가 클수록 일부 클러스터에 밀집)
+    #   - distribution="route": routes(폴리라인 [[x, y, z], ...] 리스트)를 따라 길이에 비례하여 배치하고, 진행 방향을 바라보도록 회전
+    #   - planar=True이면 z축 회전(yaw)만 사용하고, False이면 임의의 3차원 회전을 사용합니다. (항상 단위 쿼터니언)
+    if np is None:
+        raise RuntimeError("위치/방향 생성에는 NumPy가 필요합니다. (pip install numpy)")
+
+    generator = np.random.default_rng((rng or random).getrandbits(64))
+    low = np.array([b[0] for b in bounds], dtype=np.float64)
+    high = np.array([b[1] for b in bounds], dtype=np.float64)
+
+    if distribution == "clustered":
+        centers = generator.uniform(low, high, size=(clusters, 3))
+        cluster_weights = 1.0 / np.arange(1, clusters + 1) ** cluster_skew
+        cluster_weights /= cluster_weights.sum()
+    elif distribution == "route":
+        if not routes:
+            raise ValueError("route 배치에는 routes(폴리라인 목록)가 필요합니다.")
+        segment_starts = np.concatenate([np.asarray(route, dtype=np.float64)[:-1] for route in routes])
+        segment_ends = np.concatenate([np.asarray(route, dtype=np.float64)[1:] for route in routes])
+        segment_vectors = segment_ends - segment_starts
+        segment_lengths = np.linalg.norm(segment_vectors, axis=1)
+        if not segment_lengths.sum():
+            raise ValueError("routes의 전체 길이가 0입니다.")
+        segment_weights = segment_lengths / segment_lengths.sum()
+        segment_yaws = np.arctan2(segment_vectors[:, 1], segment_vectors[:, 0])
+    elif distribution != "uniform":
+        raise ValueError(f"지원하지 않는 배치 방식입니다: {distribution}")
+
+    def sample(count):
+        yaws = None
+        if distribution == "uniform":
+            positions = generator.uniform(low, high, size=(count, 3))
+        elif distribution == "clustered":
+            assigned = generator.choice(clusters, size=count, p=cluster_weights)
+            positions = np.clip(centers[assigned] + generator.normal(0.0, cluster_spread, size=(count, 3)), low, high)
+        else:
+            segments = generator.choice(len(segment_lengths), size=count, p=segment_weights)
+            t = generator.random(count)[:, None]
+            positions = segment_starts[segments] + segment_vectors[segments] * t
+            if route_jitter:
+                positions[:, :2] += generator.normal(0.0, route_jitter, size=(count, 2))
+            yaws = segment_yaws[segments]
+
+        if planar:
+            if yaws is None:
+                yaws = generator.uniform(-np.pi, np.pi, size=count)
+            half = yaws / 2.0
+            orientations = np.zeros((count, 4))
+            orientations[:, 0] = np.cos(half)
+            orientations[:, 3] = np.sin(half)
+        else:
+            orientations = generator.normal(size=(count, 4))
+            orientations /= np.linalg.norm(orientations, axis=1, keepdims=True)
+            orientations[orientations[:, 0] < 0] *= -1  # w >= 0으로 정규화
+
+        return np.round(positions, decimals).tolist(), np.round(orientations, 6).tolist()
+
+    return sample
+
+DESTINATION_BATCH_SIZE = 10000
+DESTINATION_MAX_EMPTY_BATCHES = 20  # 새 이름이 하나도 나오지 않은 배치가 연속으로 이만큼 나오면 생성을 중단합니다.
+
+def check_destination_name_space(count, length, existing_names=()):
+    # 길이 length의 이름 공간(문자 풀 크기 ** length)에서 기존 이름을 제외하고 count개의 새 이름을 만들 수 있는지 확인합니다.
+    pool = set(get_char_pool())
+    length = max(length, 0)
+    taken = sum(1 for name in set(existing_names) if len(name) == length and set(name) <= pool)
+    available = len(pool) ** length - taken
+    if count > available:
+        raise ValueError(f"길이 {length}의 목적지 이름은 {max(available, 0):,}개까지만 새로 만들 수 있습니다. (요청 {count:,}개, --length를 늘려주세요.)")
+
+def iter_random_destinations(count, length=5, existing_names=(), rng=None, pose_sampler=None, collision_rate=0.0):
+    # 이름이 겹치지 않는 무작위 목적지 (키, 레코드)를 count개 생성합니다.
+    # 이름은 generate_random_strings()로 한 번에 생성하고, 기존 이름과 겹치는 경우만 다시 생성합니다.
+    # pose_sampler(make_pose_sampler의 리턴값)를 지정하면 위치/방향을 채우고, 지정하지 않으면 기존처럼 0으로 채웁니다.
+    # collision_rate 비율만큼은 이미 생성된 목적지와 같은 'name'을 사용합니다. (키는 "이름#번호"로 겹치지 않게 생성)
+    # 이름 공간보다 많이 요청하거나, 남은 이름이 너무 적어서 새 이름이 나오지 않으면 ValueError가 발생합니다.
+    check_destination_name_space(count, length, existing_names)
+    rng = rng or random
+    used_names = set(existing_names)
+    emitted_names = []
+    collision_count = 0
+    empty_batches = 0
+    remaining = count
+    while remaining > 0:
+        batch = []
+        for name in generate_random_strings(min(remaining, DESTINATION_BATCH_SIZE), length, rng=rng):
+            if name in used_names:
+                continue
+            used_names.add(name)
+            batch.append(name)
+        if not batch:
+            empty_batches += 1
+            if empty_batches >= DESTINATION_MAX_EMPTY_BATCHES:
+                raise ValueError(f"새 목적지 이름을 만들지 못했습니다. (남은 {remaining:,}개, 길이 {length}의 이름 공간이 거의 찼습니다. --length를 늘려주세요.)")
+            continue
+        empty_batches = 0
+
+        types = rng.choices(DESTINATION_TYPES, k=len(batch))
+        positions, orientations = pose_sampler(len(batch)) if pose_sampler else (None, None)
+
+        for i, name in enumerate(batch):
+            key = name
+            if collision_rate and emitted_names and rng.random() < collision_rate:
+                name = emitted_names[int(rng.random() * len(emitted_names))]
+                while key in used_names:
+                    collision_count += 1
+                    key = f"{name}#{collision_count}"
+                used_names.add(key)
+            else:
+                emitted_names.append(name)
+
+            if pose_sampler:
+                yield key, build_destination(name, types[i], positions[i], orientations[i])
+            else:
+                yield key, build_destination(name, types[i])
+        remaining -= len(batch)
+
+def load_yaml(filename):
+    with open(filename, 'r', encoding='utf-8') as file:
+        return yaml.load(file, Loader=YAML_LOADER) or {}
+
+def add_random_destinations(data, count, length=5, rng=None, pose_sampler=None, collision_rate=0.0):
+    # data['destinations']에 무작위 목적지 count개를 추가하고, 추가된 이름 리스트를 리턴합니다.
+    destinations = data.get('destinations') or {}
+    data['destinations'] = destinations
+    new_names = []
+    for name, record in iter_random_destinations(count, length, list(destinations.keys()), rng, pose_sampler, collision_rate):
+        destinations[name] = record
+        new_names.append(name)
+    return new_names
+
+def write_destinations_yaml(data, new_destinations, output_filename):
+    # YAML 파일을 스트리밍으로 작성합니다.
+    # 전체 데이터를 한 번에 dump하지 않고, destinations 항목을 STREAM_CHUNK_SIZE개씩 나누어 바로 파일에 씁니다.
+    # new_destinations는 (이름, 레코드)를 생성하는 이터레이터이며, 기존 destinations 뒤에 이어서 작성됩니다.
+    written = 0
+    with open(output_filename, 'w', encoding='utf-8') as new_file:
+        for key in sorted(data, key=str):
+            if key != 'destinations':
+                yaml.dump({key: data[key]}, new_file, Dumper=YAML_DUMPER, default_flow_style=False)
+                continue
+
+            existing = data.get('destinations') or {}
+            new_file.write("destinations:\n")
+            chunk = {}
+            for entries_source in (existing.items(), new_destinations):
+                for name, record in entries_source:
+                    chunk[name] = record
+                    if len(chunk) >= STREAM_CHUNK_SIZE:
+                        written += write_destination_chunk(chunk, new_file)
+                        chunk = {}
+            written += write_destination_chunk(chunk, new_file)
+            if not written:
+                new_file.write("  {}\n")
+    return written
+
+def write_destination_chunk(chunk, new_file):
+    if not chunk:
+        return 0
+    dumped = yaml.dump(chunk, Dumper=YAML_DUMPER, default_flow_style=False, sort_keys=False)
+    new_file.write("".join("  " + line for line in dumped.splitlines(True)))
+    return len(chunk)
+
+def generate_destinations_file(input_filename, output_filename, count, length=5, seed=None, stream=False, geometry=None, collision_rate=0.0):
+    # 기존 YAML 파일에 무작위 목적지 count개를 추가하여 새로운 YAML 파일로 저장합니다.
+    # seed를 지정하면 같은 입력에 대해 항상 같은 결과를 생성합니다.
+    # geometry(make_pose_sampler의 인자 딕셔너리)를 지정하면 위치/방향을 생성합니다.
+    rng = random.Random(seed)
+    data = load_yaml(input_filename)
+    data.setdefault('destinations', {})
+    pose_sampler = make_pose_sampler(rng=rng, **geometry) if geometry is not None else None
+
+    started = time.perf_counter()
+    if stream:
+        existing_names = list((data.get('destinations') or {}).keys())
+        check_destination_name_space(count, length, existing_names)  # 출력 파일을 열기 전에 확인합니다.
+        new_destinations = iter_random_destinations(count, length, existing_names, rng, pose_sampler, collision_rate)
+        write_destinations_yaml(data, new_destinations, output_filename)
+    else:
+        add_random_destinations(data, count, length, rng, pose_sampler, collision_rate)
+        with open(output_filename, 'w', encoding='utf-8') as new_file:
+            yaml.dump(data, new_file, Dumper=YAML_DUMPER, default_flow_style=False)
+    print(f"목적지 {count:,}개 추가 완료: {output_filename} ({time.perf_counter() - started:.2f}s)")
+
+def add_random_destination(input_filename, output_filename):
+    # 기존 YAML 파일에 무작위 목적지 1개를 추가합니다. (대화형 실행용)
+    data = load_yaml(input_filename)
+    data.setdefault('destinations', {})
+    random_string = add_random_destinations(data, 1)[0]
+    print(random_string, data['destinations'][random_string]['type'])
+
+    # 수정된 데이터를 새로운 YAML 파일로 저장
+    with open(output_filename, 'w', encoding='utf-8') as new_file:
+        yaml.dump(data, new_file, Dumper=YAML_DUMPER, default_flow_style=False)
+
+# =====================================
+# 샤드 단위 테스트 코퍼스 생성
+# =====================================
+CORPUS_FORMATS = ("jsonl", "csv", "yaml")
+CORPUS_FIELDS = ["id", "name", "type"]
+CORPUS_BATCH_SIZE = 10000
+
+def derive_shard_seed(master_seed, shard_index):
+    # 마스터 시드와 샤드 번호로 샤드별 시드를 만듭니다. (워커 수, 실행 순서와 무관하게 항상 같은 값)
+    digest = hashlib.sha256(f"{master_seed}:{shard_index}".encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big')
+
+def get_shard_range(total, shard_count, shard_index):
+    # 전체 total개를 shard_count개로 나눴을 때 shard_index 샤드의 (시작 id, 개수)를 리턴합니다.
+    base, extra = divmod(total, shard_count)
+    start = shard_index * base + min(shard_index, extra)
+    return start, base + (1 if shard_index < extra else 0)
+
+def get_shard_filename(output_dir, shard_index, shard_count, fmt):
+    return os.path.join(output_dir, f"corpus-{shard_index:05d}-of-{shard_count:05d}.{fmt}")
+
+def generate_corpus_shard(shard_index, shard_count, total, master_seed, output_dir, fmt="jsonl", length=5, charsets=None, use_numpy=True):
+    # 샤드 하나를 생성하여 파일로 저장하고, 샤드 정보(파일명, 개수, sha256)를 리턴합니다.
+    # charsets를 지정하면 문자셋 레지스트리(generate_charset_strings)로, 지정하지 않으면 generate_random_strings로 이름을 생성합니다.
+    rng = random.Random(derive_shard_seed(master_seed, shard_index))
+    start, count = get_shard_range(total, shard_count, shard_index)
+    filename = get_shard_filename(output_dir, shard_index, shard_count, fmt)
+
+    with open(filename, 'w', encoding='utf-8', newline='') as f:
+        writer = None
+        if fmt == "csv":
+            writer = csv.writer(f)
+            writer.writerow(CORPUS_FIELDS)
+
+        for batch_start in range(0, count, CORPUS_BATCH_SIZE):
+            batch_count = min(CORPUS_BATCH_SIZE, count - batch_start)
+            if charsets:
+                names = generate_charset_strings(batch_count, length, charsets, rng=rng)
+            else:
+                names = generate_random_strings(batch_count, length, rng=rng, use_numpy=use_numpy)
+            types = rng.choices(DESTINATION_TYPES, k=batch_count)
+            first_id = start + batch_start
+
+            if fmt == "jsonl":
+                f.write("".join(
+                    json.dumps({"id": first_id + i, "name": name, "type": t}, ensure_ascii=False) + "\n"
+                    for i, (name, t) in enumerate(zip(names, types))
+                ))
+            elif fmt == "csv":
+                writer.writerows([first_id + i, name, t] for i, (name, t) in enumerate(zip(names, types)))
+            else:
+                records = [{"id": first_id + i, "name": name, "type": t} for i, (name, t) in enumerate(zip(names, types))]
+                yaml.dump(records, f, Dumper=YAML_DUMPER, allow_unicode=True, default_flow_style=False, sort_keys=False)
+
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+
+    return {"shard": shard_index, "file": os.path.basename(filename), "start_id": start, "count": count, "sha256": digest.hexdigest()}
+
+def generate_corpus(total, shard_count, master_seed, output_dir, fmt="jsonl", length=5, charsets=None, workers=None, shard_indexes=None):
+    # 프로세스 풀로 샤드를 병렬 생성하고, 샤드 정보를 manifest.json에 저장합니다.
+    # shard_indexes를 지정하면 해당 샤드만 생성합니다. (CI 샤드별로 자기 파일만 생성하는 경우)
+    if fmt not in CORPUS_FORMATS:
+        raise ValueError(f"지원하지 않는 형식입니다: {fmt} (사용 가능: {', '.join(CORPUS_FORMATS)})")
+    if shard_count < 1:
+        raise ValueError(f"샤드 개수는 1 이상이어야 합니다: {shard_count}")
+    invalid_indexes = sorted({index for index in shard_indexes or [] if not 0 <= index < shard_count})
+    if invalid_indexes:
+        raise ValueError(f"샤드 번호는 0 ~ {shard_count - 1} 범위여야 합니다: {', '.join(map(str, invalid_indexes))}")
+    if charsets:
+        get_charset_table(normalize_charset_weights(charsets))  # 잘못된 문자셋 이름은 워커 실행 전에 확인
+
+    os.makedirs(output_dir, exist_ok=True)
+    shard_indexes = list(range(shard_count)) if shard_indexes is None else sorted(set(shard_indexes))
+    use_numpy = np is not None
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = [
+            executor.submit(generate_corpus_shard, shard_index, shard_count, total, master_seed, output_dir, fmt, length, charsets, use_numpy)
+            for shard_index in shard_indexes
+        ]
+        shards = [future.result() for future in futures]
+    elapsed = time.perf_counter() - started
+
+    manifest = {
+        "total": total,
+        "shard_count": shard_count,
+        "master_seed": master_seed,
+        "format": fmt,
+        "length": length,
+        "charsets": charsets,
+        "backend": "numpy" if use_numpy and not charsets else "random",
+        "shards": shards
+    }
+    manifest_name = "manifest.json" if len(shard_indexes) == shard_count else f"manifest-{shard_indexes[0]:05d}.json"
+    with open(os.path.join(output_dir, manifest_name), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    generated = sum(shard["count"] for shard in shards)
+    print(f"코퍼스 {generated:,}건 / 샤드 {len(shards)}개 생성 완료: {output_dir} ({elapsed:.2f}s, {generated / max(elapsed, 1e-9):,.0f} strings/sec)")
+    return manifest
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="다국어 테스트용 무작위 문자열 생성기")
+    subparsers = parser.add_subparsers(dest="command")
+
+    benchmark_parser = subparsers.add_parser("benchmark", help="문자열 생성 처리량 측정")
+    benchmark_parser.add_argument("--count", type=int, default=100000, help="생성할 문자열 개수 (기본 100000)")
+    benchmark_parser.add_argument("--length", type=int, default=5, help="문자열 길이 (기본 5)")
+    benchmark_parser.add_argument("--repeat", type=int, default=3, help="측정 반복 횟수 (기본 3)")
+
+    destinations_parser = subparsers.add_parser("destinations", help="YAML 파일에 무작위 목적지를 한 번에 추가")
+    destinations_parser.add_argument("-i", "--input", required=True, help="기존 YAML 파일명")
+    destinations_parser.add_argument("-o", "--output", required=True, help="새로운 YAML 파일명")
+    destinations_parser.add_argument("-n", "--count", type=int, default=1, help="추가할 목적지 개수 (기본 1)")
+    destinations_parser.add_argument("--length", type=int, default=5, help="목적지 이름 길이 (기본 5)")
+    destinations_parser.add_argument("--seed", type=int, default=None, help="재현 가능한 생성을 위한 시드")
+    destinations_parser.add_argument("--stream", action="store_true", help="목적지를 나누어 바로 파일에 작성 (대용량 파일용)")
+    destinations_parser.add_argument("--distribution", choices=["zero", "uniform", "clustered", "route"], default="zero", help="위치 배치 방식 (기본 zero: 기존처럼 모두 0)")
+    destinations_parser.add_argument("--bounds", default="-50,50,-50,50,0,0", help="배치 범위 xmin,xmax,ymin,ymax[,zmin,zmax] (기본 -50,50,-50,50,0,0)")
+    destinations_parser.add_argument("--routes-file", default=None, help="route 배치에 사용할 폴리라인 YAML/JSON 파일 ([[[x, y, z], ...], ...])")
+    destinations_parser.add_argument("--clusters", type=int, default=8, help="clustered 배치의 클러스터 개수 (기본 8)")
+    destinations_parser.add_argument("--cluster-spread", type=float, default=2.0, help="클러스터 반경(표준편차) (기본 2.0)")
+    destinations_parser.add_argument("--cluster-skew", type=float, default=1.0, help="클러스터 밀집도 편향 (0이면 균등, 기본 1.0)")
+    destinations_parser.add_argument("--route-jitter", type=float, default=0.0, help="route 배치의 좌우 흔들림(표준편차) (기본 0)")
+    destinations_parser.add_argument("--full-rotation", action="store_true", help="z축 회전 대신 임의의 3차원 회전 사용")
+    destinations_parser.add_argument("--collision-rate", type=float, default=0.0, help="이름(name)이 겹치는 목적지 비율 (기본 0)")
+
+    corpus_parser = subparsers.add_parser("corpus", help="샤드 단위 테스트 코퍼스를 병렬로 생성")
+    corpus_parser.add_argument("--total", type=int, required=True, help="생성할 전체 문자열 개수")
+    corpus_parser.add_argument("--shards", type=int, default=1, help="샤드 개수 (기본 1)")
+    corpus_parser.add_argument("--seed", type=int, default=0, help="마스터 시드 (기본 0)")
+    corpus_parser.add_argument("--format", choices=CORPUS_FORMATS, default="jsonl", help="출력 형식 (기본 jsonl)")
+    corpus_parser.add_argument("--output-dir", default="corpus", help="출력 디렉토리 (기본 ./corpus)")
+    corpus_parser.add_argument("--length", type=int, default=5, help="문자열 길이 (기본 5)")
+    corpus_parser.add_argument("--charsets", default="", help="문자셋 레지스트리 이름 목록 (예: korean,emoji,thai)")
+    corpus_parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본 CPU 코어 수)")
+    corpus_parser.add_argument("--only-shard", type=int, action="append", default=None, help="지정한 샤드만 생성 (0부터 --shards - 1까지, 여러 번 지정 가능)")
+
+    args = parser.parse_args()
+
+    if args.command == "benchmark":
+        benchmark_generation(args.count, args.length, args.repeat)
+    elif args.command == "corpus":
+        charsets = [name.strip() for name in args.charsets.split(",") if name.strip()] or None
+        try:
+            generate_corpus(args.total, args.shards, args.seed, args.output_dir, args.format, args.length, charsets, args.workers, args.only_shard)
+        except ValueError as e:
+            parser.error(str(e))
+    elif args.command == "destinations":
+        geometry = None
+        if args.distribution != "zero":
+            values = [float(v) for v in args.bounds.split(",")]
+            if len(values) == 4:
+                values += [0.0, 0.0]
+            routes = load_yaml(args.routes_file) if args.routes_file else None
+            geometry = {
+                "bounds": tuple(zip(values[0::2], values[1::2])),
+                "distribution": args.distribution,
+                "routes": routes,
+                "clusters": args.clusters,
+                "cluster_spread": args.cluster_spread,
+                "cluster_skew": args.cluster_skew,
+                "route_jitter": args.route_jitter,
+                "planar": not args.full_rotation
+            }
+        try:
+            generate_destinations_file(args.input, args.output, args.count, args.length, args.seed, args.stream, geometry, args.collision_rate)
+        except ValueError as e:
+            parser.error(str(e))
+    else:
+        # 사용자로부터 파일명 입력 받기
+        input_filename = input("기존 YAML 파일명을 입력하세요: ")
+        output_filename = input("새로운 YAML 파일명을 입력하세요: ")
+        add_random_destination(input_filename, output_filename)
@@ -0,0 +1,255 @@
+"""
+string_validator.py
+- 다국어 문자열 제약조건 일괄 검증 (UTF-8/UTF-16 길이, 표시 폭, 글자 수, 금지 문자, 인코딩 왕복)
+- 문자열을 코드포인트 배열로 변환하여 NumPy 벡터 연산으로 검사
+- 문자 속성(표시 폭, 결합 여부, 인코딩 가능 여부)은 코퍼스에 등장한 고유 코드포인트에 대해서만 한 번 계산
+- 위반 결과는 CSV 또는 JSON으로 저장
+"""
+
+import argparse
+import csv
+import fnmatch
+import json
+import os
+import sys
+import time
+import unicodedata
+
+import numpy as np
+import yaml
+
+CHUNK_SIZE = 100000  # 한 번에 배열로 변환할 문자열 수 (메모리 사용량 제한, 배열 크기는 묶음의 전체 코드포인트 수에 비례)
+CHECKS = ("max_utf8_bytes", "max_utf16_units", "max_width", "max_graphemes", "forbidden_chars", "encodings")
+VIOLATION_FIELDS = ["key", "rule", "check", "value", "limit", "text"]
+
+# =====================================
+# 코퍼스 로드
+# =====================================
+def flatten_strings(data, prefix=""):
+    # 중첩된 dict/list에서 문자열 값만 ("a.b.0.c", 값) 형태로 추출합니다. (번역 파일, destinations YAML 등)
+    if isinstance(data, str):
+        yield prefix, data
+    elif isinstance(data, dict):
+        for key, value in data.items():
+            yield from flatten_strings(value, f"{prefix}.{key}" if prefix else str(key))
+    elif isinstance(data, list):
+        for index, value in enumerate(data):
+            yield from flatten_strings(value, f"{prefix}.{index}" if prefix else str(index))
+
+def load_corpus(path, field="name"):
+    # 검증할 문자열을 (키, 문자열) 리스트로 로드합니다.
+    #   - .jsonl / .csv: 각 행의 field 컬럼 (키는 "id.field", id가 없으면 행 번호)
+    #   - .json / .yaml / .yml: 모든 문자열 값 (키는 "a.b.c" 경로)
+    #   - 그 외: 한 줄에 문자열 하나
+    ext = os.path.splitext(path)[1].lower()
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if ext == ".jsonl":
+            records = []
+            for line_no, line in enumerate(f):
+                if line.strip():
+                    row = json.loads(line)
+                    records.append((f"{row.get('id', line_no)}.{field}", str(row.get(field, ""))))
+            return records
+        if ext == ".csv":
+            return [(f"{row.get('id', i)}.{field}", row.get(field) or "") for i, row in enumerate(csv.DictReader(f))]
+        if ext == ".json":
+            return list(flatten_strings(json.load(f)))
+        if ext in (".yaml", ".yml"):
+            return list(flatten_strings(yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))))
+        return [(str(i), line.rstrip("\r\n")) for i, line in enumerate(f)]
+
+def load_constraints(path):
+    # 제약조건 설정을 로드합니다.
+    # {"default": {...}, "fields": {"키 패턴(fnmatch)": {...}}} 형식이며, 키와 처음 일치하는 패턴의 제약조건을 사용합니다.
+    with open(path, 'r', encoding='utf-8') as f:
+        constraints = json.load(f)
+    constraints.setdefault("default", {})
+    constraints.setdefault("fields", {})
+    return constraints
+
+def match_rule(key, constraints):
+    for pattern in constraints["fields"]:
+        if fnmatch.fnmatchcase(key, pattern):
+            return pattern
+    return "default"
+
+# UAX #29 SpacingMark 중 Mc(결합 문자)가 아닌 코드포인트 (태국어 SARA AM, 라오어 AM)
+GRAPHEME_SPACING_MARKS = {0x0E33, 0x0EB3}
+# UAX #29 Prepend: 뒤 글자와 합쳐져서 하나의 글자가 되는 코드포인트 (아랍어 숫자 기호, 일부 인도계 문자의 선행 자음 기호)
+GRAPHEME_PREPEND_RANGES = (
+    (0x0600, 0x0605), (0x06DD, 0x06DD), (0x070F, 0x070F), (0x0890, 0x0891), (0x08E2, 0x08E2), (0x0D4E, 0x0D4E),
+    (0x110BD, 0x110BD), (0x110CD, 0x110CD), (0x111C2, 0x111C3), (0x1193F, 0x1193F), (0x11941, 0x11941),
+    (0x11A3A, 0x11A3A), (0x11A84, 0x11A89), (0x11D46, 0x11D46), (0x11F02, 0x11F02)
+)
+
+# =====================================
+# 문자 속성 테이블
+# =====================================
+def is_grapheme_prepend(cp):
+    return any(low <= cp <= high for low, high in GRAPHEME_PREPEND_RANGES)
+
+def is_grapheme_extender(cp):
+    # 앞 글자에 붙어서 하나의 글자(grapheme cluster)를 이루는 코드포인트인지 확인합니다. (UAX #29 Extend/SpacingMark 근사)
+    category = unicodedata.category(chr(cp))
+    return (
+        category in ("Mn", "Me", "Mc")
+        or cp in GRAPHEME_SPACING_MARKS
+        or cp == 0x200D  # ZWJ
+        or 0xFE00 <= cp <= 0xFE0F  # 이모지/텍스트 표시 선택자
+        or 0x1F3FB <= cp <= 0x1F3FF  # 이모지 피부색 수식어
+        or 0xE0020 <= cp <= 0xE007F  # 태그 문자 (지역 국기)
+        or 0x1160 <= cp <= 0x11FF or 0xD7B0 <= cp <= 0xD7FF  # 한글 옛 자모 중성/종성
+    )
+
+def display_width(cp):
+    # 터미널/고정폭 UI 기준의 표시 폭 (East Asian Width W/F는 2, 결합 문자와 서식 문자는 0)
+    ch = chr(cp)
+    if cp in GRAPHEME_SPACING_MARKS:
+        return 1
+    if unicodedata.category(ch) in ("Mn", "Me", "Cf") or is_grapheme_extender(cp):
+        return 0
+    return 2 if unicodedata.east_asian_width(ch) in ("W", "F") else 1
+
+def build_property_tables(unique_codepoints, forbidden_chars="", encodings=()):
+    # 고유 코드포인트별 속성 배열을 만듭니다. 코퍼스 전체가 아닌 고유 코드포인트 수만큼만 계산합니다.
+    codepoints = unique_codepoints.tolist()
+    forbidden = set(map(ord, forbidden_chars))
+    tables = {
+        "width": np.array([display_width(cp) if cp else 0 for cp in codepoints], dtype=np.int32),
+        "extend": np.array([bool(cp) and is_grapheme_extender(cp) for cp in codepoints], dtype=bool),
+        "prepend": np.array([is_grapheme_prepend(cp) for cp in codepoints], dtype=bool),
+        "forbidden": np.array([cp in forbidden for cp in codepoints], dtype=bool),
+    }
+    for encoding in encodings:
+        unencodable = []
+        for cp in codepoints:
+            try:
+                ch = chr(cp)
+                unencodable.append(bool(cp) and ch.encode(encoding).decode(encoding) != ch)
+            except (UnicodeError, LookupError):
+                unencodable.append(True)
+        tables[f"unencodable:{encoding}"] = np.array(unencodable, dtype=bool)
+    return tables
+
+# =====================================
+# 벡터 검사
+# =====================================
+def to_codepoint_array(texts):
+    # 문자열 리스트를 이어 붙인 1차원 uint32 코드포인트 배열과 코드포인트별 행 번호, 행 길이 배열로 변환합니다.
+    # 가장 긴 문자열 길이로 행을 채우지 않으므로, 배열 크기는 전체 코드포인트 수에 비례합니다. (긴 번역 문단이 있어도 메모리가 늘어나지 않음)
+    # (np.array(texts, dtype=str)는 끝의 NUL 문자를 지우므로, 전체 문자열을 UTF-32로 한 번에 인코딩합니다.)
+    lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+    codepoints = np.frombuffer("".join(texts).encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    rows = np.repeat(np.arange(len(texts)), lengths)
+    return codepoints, rows, lengths
+
+def measure_texts(texts, forbidden_chars="", encodings=()):
+    # 문자열 리스트의 길이 지표와 위반 여부를 배열로 계산합니다. (행별 합계는 행 번호 기준 np.bincount)
+    codepoints, rows, lengths = to_codepoint_array(texts)
+    row_count = len(texts)
+    unique_codepoints, inverse = np.unique(codepoints, return_inverse=True)
+    tables = build_property_tables(unique_codepoints, forbidden_chars, encodings)
+
+    def count_rows(mask):
+        return np.bincount(rows[mask], minlength=row_count)
+
+    metrics = {
+        "utf8_bytes": lengths + count_rows(codepoints > 0x7F) + count_rows(codepoints > 0x7FF) + count_rows(codepoints > 0xFFFF),
+        "utf16_units": lengths + count_rows(codepoints > 0xFFFF),
+        "width": np.bincount(rows, weights=tables["width"][inverse], minlength=row_count).astype(np.int64),
+    }
+
+    # 글자 수: 결합 문자가 아니고, 같은 문자열에서 바로 앞이 ZWJ 또는 Prepend가 아닌 코드포인트가 새 글자의 시작입니다.
+    # 국기(Regional Indicator)는 2개가 한 글자이므로 별도로 절반만 셉니다.
+    regional = (codepoints >= 0x1F1E6) & (codepoints <= 0x1F1FF)
+    joined = np.zeros(len(codepoints), dtype=bool)
+    joined[1:] = (rows[1:] == rows[:-1]) & ((codepoints[:-1] == 0x200D) | tables["prepend"][inverse[:-1]])
+    starts = ~tables["extend"][inverse] & ~joined & ~regional
+    metrics["graphemes"] = count_rows(starts) + (count_rows(regional) + 1) // 2
+
+    metrics["forbidden"] = count_rows(tables["forbidden"][inverse]) > 0
+    for encoding in encodings:
+        metrics[f"unencodable:{encoding}"] = count_rows(tables[f"unencodable:{encoding}"][inverse]) > 0
+    return metrics
+
+def validate_records(records, constraints):
+    # (키, 문자열) 리스트를 제약조건별로 묶어서 검사하고, 위반 목록을 리턴합니다.
+    groups = {}
+    for key, text in records:
+        groups.setdefault(match_rule(key, constraints), []).append((key, text))
+
+    violations = []
+    for rule, group in groups.items():
+        rule_constraints = constraints["default"] if rule == "default" else constraints["fields"][rule]
+        if not any(rule_constraints.get(check) for check in CHECKS):
+            continue
+        forbidden_chars = rule_constraints.get("forbidden_chars", "")
+        encodings = tuple(rule_constraints.get("encodings", ()))
+
+        for start in range(0, len(group), CHUNK_SIZE):
+            chunk = group[start:start + CHUNK_SIZE]
+            texts = [text for _, text in chunk]
+            metrics = measure_texts(texts, forbidden_chars, encodings)
+
+            failed = []
+            for check, metric in (("max_utf8_bytes", "utf8_bytes"), ("max_utf16_units", "utf16_units"),
+                                  ("max_width", "width"), ("max_graphemes", "graphemes")):
+                limit = rule_constraints.get(check)
+                if limit is not None:
+                    for index in np.flatnonzero(metrics[metric] > limit).tolist():
+                        failed.append((index, check, int(metrics[metric][index]), limit))
+            if forbidden_chars:
+                for index in np.flatnonzero(metrics["forbidden"]).tolist():
+                    found = "".join(sorted(set(texts[index]) & set(forbidden_chars)))
+                    failed.append((index, "forbidden_chars", found, forbidden_chars))
+            for encoding in encodings:
+                for index in np.flatnonzero(metrics[f"unencodable:{encoding}"]).tolist():
+                    failed.append((index, "encodings", encoding, encoding))
+
+            for index, check, value, limit in sorted(failed, key=lambda item: item[0]):
+                key, text = chunk[index]
+                violations.append({"key": key, "rule": rule, "check": check, "value": value, "limit": limit, "text": text})
+    return violations
+
+def write_violations(violations, output_filename):
+    # 확장자에 따라 CSV 또는 JSON으로 저장합니다.
+    if output_filename.lower().endswith(".json"):
+        with open(output_filename, 'w', encoding='utf-8') as f:
+            json.dump(violations, f, ensure_ascii=False, indent=2)
+    else:
+        with open(output_filename, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.DictWriter(f, fieldnames=VIOLATION_FIELDS)
+            writer.writeheader()
+            writer.writerows(violations)
+    print(f"위반 목록 저장 완료: {output_filename}")
+
+def print_summary(records, violations, elapsed):
+    counts = {}
+    for violation in violations:
+        counts[violation["check"]] = counts.get(violation["check"], 0) + 1
+    print(f"\n 총 {len(records):,}개 문자열 검증 완료 ({elapsed:.2f}s, {len(records) / max(elapsed, 1e-9):,.0f} strings/sec)")
+    if not violations:
+        print("위반 항목이 없습니다.")
+        return
+    print(f"위반 {len(violations):,}건")
+    for check, count in sorted(counts.items(), key=lambda item: -item[1]):
+        print(f"  {check:<16} {count:>10,}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="다국어 문자열 길이/인코딩 제약조건 일괄 검증기")
+    parser.add_argument("corpus", help="검증할 파일 (.jsonl / .csv / .json / .yaml / .txt)")
+    parser.add_argument("-c", "--constraints", required=True, help="제약조건 JSON 파일 (예: string_constraints.json)")
+    parser.add_argument("--field", default="name", help=".jsonl/.csv에서 검증할 컬럼 (기본 name)")
+    parser.add_argument("-o", "--output", default="violations.csv", help="위반 목록 저장 파일 (.csv 또는 .json, 기본 violations.csv)")
+    args = parser.parse_args()
+
+    records = load_corpus(args.corpus, args.field)
+    constraints = load_constraints(args.constraints)
+
+    started = time.perf_counter()
+    violations = validate_records(records, constraints)
+    print_summary(records, violations, time.perf_counter() - started)
+
+    if violations:
+        write_violations(violations, args.output)
+        sys.exit(1)
@@ -0,0 +1,76 @@
+"""
+test_string_validator.py
+- string_validator.py 회귀 테스트 (python -m pytest loacalization-tools 또는 python -m unittest)
+"""
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import random_strings
+import string_validator
+
+CONSTRAINTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "string_constraints.json")
+
+class MixedLengthTest(unittest.TestCase):
+    # 길이가 다른 문자열을 한 배열로 만들 때 생기는 빈 칸(0)이 NUL 문자로 취급되지 않아야 합니다.
+
+    def test_padding_is_not_forbidden(self):
+        constraints = string_validator.load_constraints(CONSTRAINTS_PATH)
+        records = [("a", "ab"), ("b", "abcdef"), ("c", ""), ("d", "가나다라마바사")]
+        self.assertEqual(string_validator.validate_records(records, constraints), [])
+
+    def test_real_nul_is_forbidden_and_counted(self):
+        constraints = string_validator.load_constraints(CONSTRAINTS_PATH)
+        records = [("a", "ab"), ("b", "a\x00"), ("c", "\x00x"), ("d", "abcdef")]
+        violations = string_validator.validate_records(records, constraints)
+        self.assertEqual([(v["key"], v["check"], v["value"]) for v in violations],
+                         [("b", "forbidden_chars", "\x00"), ("c", "forbidden_chars", "\x00")])
+
+        metrics = string_validator.measure_texts(["a\x00", "ab", "\x00", "abcdef"])
+        self.assertEqual(metrics["utf8_bytes"].tolist(), [2, 2, 1, 6])
+        self.assertEqual(metrics["utf16_units"].tolist(), [2, 2, 1, 6])
+        self.assertEqual(metrics["graphemes"].tolist(), [2, 2, 1, 6])
+
+    def test_mixed_lengths_metrics(self):
+        metrics = string_validator.measure_texts(["", "a", "가😀", "é"], encodings=("euc-kr",))
+        self.assertEqual(metrics["utf8_bytes"].tolist(), [0, 1, 7, 3])
+        self.assertEqual(metrics["utf16_units"].tolist(), [0, 1, 3, 2])
+        self.assertEqual(metrics["graphemes"].tolist(), [0, 1, 2, 1])
+        self.assertEqual(metrics["unencodable:euc-kr"].tolist(), [False, False, True, True])
+
+class GraphemeClusterTest(unittest.TestCase):
+    # UAX #29 SpacingMark(태국어 SARA AM)와 Prepend(아랍어 숫자 기호)도 앞/뒤 글자와 하나의 글자로 셉니다.
+
+    def test_thai_sara_am(self):
+        metrics = string_validator.measure_texts(["กำ", "น้ำ", "ກຳ", "ภาษาไทย"])
+        self.assertEqual(metrics["graphemes"].tolist(), [1, 1, 1, 7])
+        self.assertEqual(metrics["width"].tolist(), [2, 2, 2, 7])
+
+    def test_generated_thai_strings(self):
+        rng = random.Random(1)
+        texts = [random_strings.generate_charset_string(10, ["thai"], rng=rng) for _ in range(2000)]
+        self.assertEqual(set(string_validator.measure_texts(texts)["graphemes"].tolist()), {10})
+
+    def test_prepend(self):
+        metrics = string_validator.measure_texts(["\u0600\u0661\u0662", "a\u0600"])
+        self.assertEqual(metrics["graphemes"].tolist(), [2, 2])
+
+class LongStringTest(unittest.TestCase):
+    # 긴 문자열이 하나 있어도 다른 행의 지표는 그대로이고, 배열이 가장 긴 문자열 길이만큼 늘어나지 않아야 합니다.
+
+    def test_long_paragraph_in_chunk(self):
+        texts = ["가" * 10000] + ["ab", "", "\x00"] * 1000
+        metrics = string_validator.measure_texts(texts, forbidden_chars="\x00")
+        self.assertEqual(metrics["utf8_bytes"][:4].tolist(), [30000, 2, 0, 1])
+        self.assertEqual(metrics["width"][:4].tolist(), [20000, 2, 0, 0])
+        self.assertEqual(int(metrics["forbidden"].sum()), 1000)
+
+        codepoints, rows, lengths = string_validator.to_codepoint_array(texts)
+        self.assertEqual(len(codepoints), 10000 + 3000)
+        self.assertEqual(len(rows), len(codepoints))
+
+if __name__ == "__main__":
+    unittest.main()
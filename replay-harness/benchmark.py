@@ -0,0 +1,238 @@
+"""
+benchmark.py
+- 로컬 대역 서버(stub_servers.py)를 띄우고 jql_search(일반/샤딩), jira_report.job, confluence_report를 처음부터 끝까지 실행
+- 이슈(리뷰) 수 1k / 10k / 100k 단계별로 처리량(건/초)과 요청 지연 시간(p50/p95/max)을 측정
+- 처리 건수가 요청한 규모보다 적으면(대상 스크립트가 일부 페이지만 조회한 경우) 결과에 incomplete로 표시하고 경고를 출력
+- 외부 계정(Atlassian, Slack, Gmail, Google Play) 없이 실행되며, 설정 파일은 임시 디렉토리에 생성
+- Google Play는 HTTP가 아닌 google_play_scraper 라이브러리 내부 프로토콜을 사용하므로, 같은 인터페이스의 합성 모듈로 대체
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import types
+from datetime import datetime, timedelta
+
+from stub_servers import StubServers, get_last_month
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(script_dir)
+sys.path.insert(0, os.path.join(REPO_DIR, "jira-automation"))
+sys.path.insert(0, os.path.join(REPO_DIR, "confluence-reporter"))
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+TARGETS = ["jql_search", "jql_search_sharded", "jira_report", "confluence_report"]
+
+# =====================================
+# 합성 Google Play 리뷰
+# =====================================
+def install_play_store_standin(review_count):
+    # google_play_scraper.reviews()와 같은 형태(리뷰 리스트, continuation_token)로 지난달 리뷰를 최신순으로 돌려줍니다.
+    # review_count개를 모두 돌려준 다음에는 지난달 이전 리뷰 1건을 돌려주어 수집을 종료시킵니다.
+    year, month = get_last_month()
+    month_start = datetime(year, month, 1)
+    month_end = (month_start + timedelta(days=32)).replace(day=1) - timedelta(seconds=1)
+    step = (month_end - month_start) / max(review_count, 1)
+    contents = ["앱이 자주 멈춰요 로그인 오류", "업데이트 이후 속도가 빨라졌어요", "알림이 오지 않습니다", "UI가 깔끔해서 좋아요 great app", "결제 화면에서 튕김 crash"]
+
+    def reviews(app_id, lang="ko", country="kr", sort=None, count=100, filter_score_with=None, continuation_token=None):
+        offset = continuation_token or 0
+        if offset > review_count:
+            return [], None
+        end = min(offset + count, review_count)
+        result = [{
+            "reviewId": f"gp-{index}",
+            "score": 5 - index % 5,
+            "content": f"{contents[index % len(contents)]} #{index}",
+            "at": month_end - step * index
+        } for index in range(offset, end)]
+        if end == review_count:
+            result.append({"reviewId": "gp-old", "score": 3, "content": "지난달 이전 리뷰", "at": month_start - timedelta(days=1)})
+            return result, None
+        return result, end
+
+    module = types.ModuleType("google_play_scraper")
+    module.Sort = types.SimpleNamespace(NEWEST=2, MOST_RELEVANT=1)
+    module.reviews = reviews
+    sys.modules["google_play_scraper"] = module
+
+# =====================================
+# 대상별 실행
+# =====================================
+def run_jql_search(stub, size, workdir):
+    import jql_search
+
+    jql_search.JIRA_BASE_URL = stub.base_url
+    jql_search.JIRA_EMAIL = "bench@example.com"
+    jql_search.JIRA_API_TOKEN = "stub-token"
+
+    jql = jql_search.clean_jql_with_pdcleaner("project = QA ORDER BY created DESC")
+    issues = jql_search.fetch_issues_with_jql(jql, max_results=size)
+    jql_search.print_issues(issues)
+    jql_search.save_to_csv(issues, os.path.join(workdir, "jira_issues.csv"))
+    return len(issues or [])
+
+def run_jql_search_sharded(stub, size, workdir):
+    # 샤딩 모드는 created 구간별 이슈 수(approximate-count)로 샤드를 나눈 뒤, 샤드마다 마지막 페이지까지 조회합니다.
+    import jql_search
+
+    jql_search.JIRA_BASE_URL = stub.base_url
+    jql_search.JIRA_EMAIL = "bench@example.com"
+    jql_search.JIRA_API_TOKEN = "stub-token"
+
+    issues, failed_shards = jql_search.fetch_issues_sharded("project = QA ORDER BY created DESC")
+    if failed_shards:
+        raise RuntimeError(f"샤드 {len(failed_shards)}개 조회 실패")
+    return len(issues or [])
+
+def run_jira_report(stub, size, workdir):
+    import jira_report
+
+    config = {
+        "jira": {"base_url": stub.base_url, "email": "bench@example.com", "api_token": "stub-token"},
+        "slack": {"webhook_url": f"{stub.base_url}/slack/webhook", "min_interval": 0},
+        "gmail": {
+            "smtp_server": stub.host, "smtp_port": stub.smtp_port, "starttls": False,
+            "sender_email": "bench@example.com", "app_password": "stub-password",
+            "recipient_emails": ["qa@example.com"]
+        }
+    }
+    config_path = os.path.join(workdir, "jira_config.json")
+    with open(config_path, "w", encoding="utf-8") as f:
+        json.dump(config, f)
+
+    jira_report.CONFIG_PATH = config_path
+    jira_report.script_dir = workdir
+    jira_report.job()
+    return stub.issues_served
+
+def run_confluence_report(stub, size, workdir):
+    # 의존성이 없으면 initialize_confluence_client()가 오류만 출력하고 None을 리턴하므로, 먼저 import해서 건너뜀으로 처리합니다.
+    import atlassian, pandas  # noqa: F401
+    install_play_store_standin(size)
+    import confluence_report
+
+    config = {
+        "auth": {"username": "bench@example.com", "api_token": "stub-token"},
+        "confluence": {"base_url": stub.base_url},
+        "review_config": {
+            "gp_app_id": "com.example.bench", "render_mode": "sections", "rows_per_section": 500,
+            "as_app_id": "1234567890", "as_country_codes": ["kr", "us", "jp"],
+            "as_feed_url": f"{stub.base_url}/appstore/{{country}}/rss/customerreviews/page={{page}}/id={{app_id}}/sortby=mostrecent/json",
+            "archive_path": os.path.join(workdir, "review_archive.json"),
+            "space_key": "QA", "parent_page_id": "1"
+        },
+        "market_share_config": {
+            "target_url": f"{stub.base_url}/statcounter/", "fetch_backend": "http",
+            "space_key": "QA", "parent_page_id": "1"
+        }
+    }
+    confluence_client = confluence_report.initialize_confluence_client(config)
+    if confluence_client is None:
+        raise RuntimeError("Confluence 클라이언트 초기화 실패")
+
+    # 보고서 스크립트는 CSV 파일을 현재 디렉토리에 작성하므로, 임시 디렉토리에서 실행합니다.
+    current_dir = os.getcwd()
+    os.chdir(workdir)
+    try:
+        confluence_report.scrape_reviews_store(config, confluence_client)
+        confluence_report.crawl_market_share(config, confluence_client)
+    finally:
+        os.chdir(current_dir)
+    return size
+
+RUNNERS = {"jql_search": run_jql_search, "jql_search_sharded": run_jql_search_sharded, "jira_report": run_jira_report, "confluence_report": run_confluence_report}
+
+# =====================================
+# 측정 및 결과 출력
+# =====================================
+def percentile(values, ratio):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+def run_case(stub, target, size, verbose=False):
+    # 대상 스크립트 1회 실행 결과 (처리 건수, 소요 시간, 경로별 지연 시간)를 딕셔너리로 리턴합니다.
+    stub.configure(issue_count=size)
+    with tempfile.TemporaryDirectory() as workdir, open(os.devnull, "w", encoding="utf-8") as devnull:
+        started = time.perf_counter()
+        error = None
+        try:
+            with contextlib.redirect_stdout(sys.stdout if verbose else devnull):
+                processed = RUNNERS[target](stub, size, workdir)
+        except ImportError as e:
+            return {"target": target, "size": size, "skipped": f"의존성 없음 ({e.name})"}
+        except Exception as e:
+            processed, error = 0, f"{type(e).__name__}: {e}"
+        elapsed = time.perf_counter() - started
+
+    durations, status_counts = stub.stats.snapshot()
+    routes = {}
+    for route, values in sorted(durations.items()):
+        routes[route] = {
+            "count": len(values),
+            "p50_ms": round(statistics.median(values), 2),
+            "p95_ms": round(percentile(values, 0.95), 2),
+            "max_ms": round(max(values), 2)
+        }
+    throttled = sum(count for (route, status), count in status_counts.items() if status == 429)
+    return {
+        "target": target, "size": size, "processed": processed, "elapsed_s": round(elapsed, 3),
+        "throughput": round(processed / elapsed, 1) if elapsed else 0.0,
+        "requests": sum(route["count"] for route in routes.values()), "throttled": throttled,
+        # 처리 건수가 요청한 규모보다 적으면 대상 스크립트가 전체를 조회하지 않은 것이므로 규모별 비교에서 제외해야 합니다.
+        "incomplete": error is None and processed < size,
+        "routes": routes, "error": error
+    }
+
+def print_result(result):
+    if result.get("skipped"):
+        print(f"{result['target']:<18} {result['size']:>8,}  건너뜀: {result['skipped']}")
+        return
+    print(f"{result['target']:<18} {result['size']:>8,}  처리 {result['processed']:>8,}/{result['size']:,}건  "
+          f"{result['elapsed_s']:>8.3f}s  {result['throughput']:>10,.1f}건/s  요청 {result['requests']:>6,}회  429 {result['throttled']}회")
+    for route, route_stats in result["routes"].items():
+        print(f"    {route:<22} {route_stats['count']:>6,}회  p50 {route_stats['p50_ms']:>8.2f}ms  "
+              f"p95 {route_stats['p95_ms']:>8.2f}ms  max {route_stats['max_ms']:>8.2f}ms")
+    if result["incomplete"]:
+        print(f"    ⚠️ 처리 건수({result['processed']:,}건)가 요청한 규모({result['size']:,}건)보다 적습니다. (대상 스크립트의 조회 상한 또는 페이지 처리 확인 필요)")
+    if result["error"]:
+        print(f"    ⚠️ 실행 오류: {result['error']}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="로컬 대역 서버 기반 보고서 스크립트 벤치마크")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="이슈(리뷰) 수 목록 (기본 1000,10000,100000)")
+    parser.add_argument("--targets", default=",".join(TARGETS), help=f"실행할 대상 (기본 {','.join(TARGETS)})")
+    parser.add_argument("--latency-ms", type=float, default=0, help="모든 요청에 추가할 응답 지연 (ms)")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="응답 지연 무작위 편차 (ms)")
+    parser.add_argument("--page-size", type=int, default=100, help="대역 서버가 한 번에 응답하는 최대 이슈 수 (기본 100)")
+    parser.add_argument("--throttle-every", type=int, default=0, help="Jira 요청 N번마다 429 응답 (기본 사용 안 함)")
+    parser.add_argument("--no-total", action="store_true", help="Jira 검색 응답에서 total을 빼고 nextPageToken으로만 페이지 처리 (Jira Cloud /search/jql과 동일)")
+    parser.add_argument("--output", help="결과를 JSON 파일로 저장")
+    parser.add_argument("--verbose", action="store_true", help="대상 스크립트의 출력을 그대로 표시")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    targets = [target.strip() for target in args.targets.split(",") if target.strip()]
+    unknown = [target for target in targets if target not in RUNNERS]
+    if unknown:
+        parser.error(f"알 수 없는 대상: {', '.join(unknown)}")
+
+    stub_config = {"latency_ms": args.latency_ms, "jitter_ms": args.jitter_ms, "max_page_size": args.page_size, "throttle_every": args.throttle_every, "search_total": not args.no_total}
+    results = []
+    with StubServers(stub_config) as stub:
+        print(f"대역 서버: {stub.base_url} (SMTP {stub.host}:{stub.smtp_port})\n")
+        for target in targets:
+            for size in sizes:
+                result = run_case(stub, target, size, args.verbose)
+                print_result(result)
+                results.append(result)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"config": stub_config, "results": results}, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장 완료: {args.output}")
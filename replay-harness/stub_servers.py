@@ -0,0 +1,664 @@
+"""
+stub_servers.py
+- Jira / Confluence / Slack / StatCounter / SMTP 로컬 대역(stand-in) 서버
+- 외부 계정 없이 jql_search.py, jira_report.py, confluence_report.py를 실행하고 성능을 측정하기 위한 용도
+- Jira 검색 결과는 이슈 번호로부터 결정적으로 생성 (같은 설정이면 항상 같은 응답)
+- 응답 지연(latency_ms, jitter_ms)과 429 응답(throttle_every) 주입, total 없는 검색 응답(search_total=False) 지원
+- 요청별 처리 시간을 경로 단위로 기록하여 벤치마크에서 지연 시간 통계로 사용
+"""
+
+import bisect
+import itertools
+import json
+import os
+import random
+import re
+import socketserver
+import threading
+import time
+import calendar
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+STATCOUNTER_FIXTURE_PATH = os.path.join(script_dir, "fixtures", "statcounter_snapshot.html")
+
+DEFAULT_STUB_CONFIG = {
+    "issue_count": 1000,      # 검색 결과 전체 이슈 수 (total)
+    "max_page_size": 100,     # 한 번에 응답하는 최대 이슈 수 (Jira Cloud의 /search/jql 상한과 동일)
+    "search_total": True,     # 검색 응답에 total/startAt 포함 (False이면 Jira Cloud의 /search/jql처럼 nextPageToken/isLast만 응답)
+    "latency_ms": 0,          # 모든 요청에 추가하는 응답 지연
+    "jitter_ms": 0,           # 응답 지연에 더하는 무작위 편차 (0 ~ jitter_ms)
+    "throttle_every": 0,      # Jira 요청 N번마다 429 응답 (0이면 사용 안 함)
+    "retry_after": 1,         # 429 응답의 Retry-After 헤더 값 (초)
+    "app_store_review_hours": 2,  # 앱 스토어 리뷰 피드의 리뷰 간격 (시간), 국가별 최신순 500건 (10페이지)
+    "slack_min_interval_ms": 0  # Slack 웹훅 요청 사이 최소 간격, 이보다 빨리 오면 429 응답 (0이면 사용 안 함, 실제 웹훅은 1000)
+}
+
+STATUSES = ["To Do", "In Progress", "In Review", "Reopened", "Blocked"]
+PRIORITIES = ["Highest", "High", "Medium", "Low", "Lowest"]
+ASSIGNEES = [None] + [(f"5f8e3b2c12345600{index:08x}", f"QA Tester {index:02d}") for index in range(1, 21)]
+AUTOMATION_AUTHOR = {"accountId": "557058:automation-for-jira", "displayName": "Automation for Jira", "accountType": "app"}
+
+# JQL의 created 구간 조건 (jql_search.py 샤딩 모드가 만드는 형식)
+JQL_CREATED_PATTERN = re.compile(r'created\s*(>=|<)\s*"([^"]+)"', re.IGNORECASE)
+
+# StatCounter 경로별 항목 이름 (fixtures/statcounter_snapshot.html에 채워 넣습니다.)
+STATCOUNTER_ITEMS = {
+    "android-version-market-share": ("Android Version Market Share", ["14.0", "13.0", "12.0", "11.0", "10.0"]),
+    "ios-version-market-share": ("iOS Version Market Share", ["iOS 17.5", "iOS 17.4", "iOS 16.7", "iOS 17.3", "iOS 15.8"]),
+    "vendor-market-share": ("Vendor Market Share", ["Samsung", "Apple", "LG", "Xiaomi", "Google"]),
+    "browser-market-share": ("Browser Market Share", ["Chrome", "Samsung Internet", "Safari", "Edge", "Whale Browser"]),
+    "browser-version-market-share": ("Browser Version Market Share", ["Chrome for Android", "Chrome 125.0", "Safari iPhone", "Samsung Internet 25.0", "Edge 125"]),
+    "ai-chatbot-market-share": ("AI Chatbot Market Share", ["ChatGPT", "Perplexity", "Copilot", "Gemini", "Claude"])
+}
+
+# =====================================
+# 요청 기록
+# =====================================
+class RequestStats:
+    """경로별 요청 수, 상태 코드, 처리 시간(ms)을 기록합니다. 여러 스레드에서 동시에 호출됩니다."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.durations = {}
+        self.status_counts = {}
+
+    def reset(self):
+        with self.lock:
+            self.durations = {}
+            self.status_counts = {}
+
+    def record(self, route, status, duration_ms):
+        with self.lock:
+            self.durations.setdefault(route, []).append(duration_ms)
+            self.status_counts[(route, status)] = self.status_counts.get((route, status), 0) + 1
+
+    def snapshot(self):
+        with self.lock:
+            return {route: list(values) for route, values in self.durations.items()}, dict(self.status_counts)
+
+# =====================================
+# 합성 데이터
+# =====================================
+def get_issue_updated(index, now):
+    # index번째 이슈의 updated 시각 (created는 updated의 30일 전)
+    return now - timedelta(days=7 + index % 40, minutes=random.Random(index).randrange(1440))
+
+def build_issue(index, base_url, now=None):
+    # index번째 이슈를 결정적으로 생성합니다. (Jira /search/jql 응답의 issues 항목 형식)
+    now = now or datetime.now(timezone.utc)
+    updated = get_issue_updated(index, now)
+    assignee = ASSIGNEES[index % len(ASSIGNEES)]
+    comments = [{
+        "author": get_human_author(index),
+        "updated": (updated - timedelta(days=day)).strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+    } for day in range(index % 4, 0, -1)]
+    return {
+        "id": str(10000 + index),
+        "key": f"QA-{index + 1}",
+        "self": f"{base_url}/rest/api/3/issue/{10000 + index}",
+        "fields": {
+            "summary": f"[합성] {STATUSES[index % len(STATUSES)]} 상태 이슈 #{index + 1} - 로그인 화면 문자열 잘림",
+            "status": {"name": STATUSES[index % len(STATUSES)]},
+            "priority": {"name": PRIORITIES[index * 7 % len(PRIORITIES)]},
+            "assignee": {"accountId": assignee[0], "displayName": assignee[1]} if assignee else None,
+            "created": (updated - timedelta(days=30)).strftime("%Y-%m-%dT%H:%M:%S.000+0000"),
+            "updated": updated.strftime("%Y-%m-%dT%H:%M:%S.000+0000"),
+            "comment": {"comments": comments, "total": len(comments)}
+        }
+    }
+
+def get_human_author(index):
+    account_id, display_name = ASSIGNEES[index % (len(ASSIGNEES) - 1) + 1]
+    return {"accountId": account_id, "displayName": display_name, "accountType": "atlassian"}
+
+def build_changelog(index, now):
+    # index번째 이슈의 변경 이력: 사람의 상태 변경 1건 + updated 시각의 봇 Rank 변경 1건 (짝수 이슈만)
+    # 사람의 마지막 변경은 updated보다 (index % 3) * 5일 이전이므로, 봇 변경을 제외하면 미활동 기간이 길어집니다.
+    updated = get_issue_updated(index, now)
+    histories = [{
+        "id": str(index * 10 + 1),
+        "author": get_human_author(index),
+        "created": (updated - timedelta(days=index % 3 * 5)).strftime("%Y-%m-%dT%H:%M:%S.000+0000"),
+        "items": [{"field": "status", "fieldId": "status", "fromString": "To Do", "toString": STATUSES[index % len(STATUSES)]}]
+    }]
+    if index % 2 == 0:
+        histories.append({
+            "id": str(index * 10 + 2),
+            "author": AUTOMATION_AUTHOR,
+            "created": updated.strftime("%Y-%m-%dT%H:%M:%S.000+0000"),
+            "items": [{"field": "Rank", "fieldId": "customfield_10019", "fromString": "", "toString": "Ranked higher"}]
+        })
+    return histories
+
+def get_last_month(now=None):
+    # 보고서 스크립트와 같은 기준으로 지난달 (연도, 월)을 리턴합니다.
+    first_day = (now or datetime.now()).replace(day=1)
+    last_month = first_day - timedelta(days=1)
+    return last_month.year, last_month.month
+
+def render_statcounter_page(path, template):
+    # 녹화된 StatCounter 페이지에 경로별 항목과 지난달 캡션을 채워 넣습니다.
+    stat_type = path.strip("/").split("/")[0]
+    title, items = STATCOUNTER_ITEMS.get(stat_type, ("Market Share", [f"Item {i}" for i in range(1, 6)]))
+    rng = random.Random(path)
+    shares = sorted((round(rng.uniform(2, 40), 2) for _ in items), reverse=True)
+    year, month = get_last_month()
+
+    page = template.replace("__TITLE__", title).replace("__PATH__", path.split("south-korea")[0])
+    page = page.replace("__MONTH_NAME__", calendar.month_name[month]).replace("__YEAR__", str(year))
+    for index, (item, share) in enumerate(zip(items, shares), start=1):
+        page = page.replace(f"__ITEM_{index}__", item).replace(f"__SHARE_{index}__", f"{share:.2f}")
+    return page.replace("__SHARE_OTHER__", f"{max(0.0, 100 - sum(shares)):.2f}")
+
+# =====================================
+# HTTP 대역 서버 (Jira / Confluence / Slack / StatCounter)
+# =====================================
+class StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024  # 동시 연결 수백 개를 받을 수 있도록 listen backlog를 늘립니다. (기본 5)
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive (requests.Session 연결 재사용)
+    disable_nagle_algorithm = True  # 헤더와 본문을 나누어 쓸 때 생기는 지연(Nagle + delayed ACK) 방지
+
+    def log_message(self, format, *args):
+        pass  # 요청마다 콘솔에 출력하지 않습니다.
+
+    def do_GET(self):
+        self.dispatch("GET")
+
+    def do_POST(self):
+        self.dispatch("POST")
+
+    def do_PUT(self):
+        self.dispatch("PUT")
+
+    def read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def send_json(self, status, data, headers=None):
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_text(self, status, text, content_type="text/plain; charset=utf-8", headers=None):
+        body = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def dispatch(self, method):
+        started = time.perf_counter()
+        stub = self.server.stub
+        parsed = urlparse(self.path)
+        path = re.sub(r"^/wiki(?=/rest/)", "", parsed.path)  # Confluence Cloud의 /wiki 접두사 허용
+        query = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        body = self.read_body()
+
+        config = stub.config
+        if config["latency_ms"] or config["jitter_ms"]:
+            time.sleep((config["latency_ms"] + random.uniform(0, config["jitter_ms"])) / 1000)
+
+        route, status = "unknown", 404
+        try:
+            for pattern, route_method, name, handler in ROUTES:
+                match = re.fullmatch(pattern, path)
+                if match and route_method == method:
+                    route = name
+                    if name.startswith("jira") and stub.should_throttle():
+                        status = 429
+                        self.send_json(429, {"errorMessages": ["Rate limit exceeded (stub)"]}, {"Retry-After": str(config["retry_after"])})
+                    else:
+                        status = handler(self, stub, match, query, body)
+                    break
+            else:
+                self.send_json(404, {"message": f"stub 경로 없음: {method} {path}"})
+        except Exception as e:
+            status = 500
+            self.send_json(500, {"message": f"stub 처리 오류: {e}"})
+        finally:
+            stub.stats.record(route, status, (time.perf_counter() - started) * 1000)
+
+# --- Jira ---
+def select_issue_indexes(stub, jql):
+    # JQL의 created 구간 조건과 "ORDER BY created [ASC|DESC]"만 해석합니다. (그 외 조건은 무시하고 전체 이슈가 해당됩니다.)
+    conditions = JQL_CREATED_PATTERN.findall(jql)
+    order_by_created = re.search(r"ORDER\s+BY\s+created(\s+DESC)?", jql, re.IGNORECASE)
+    if not conditions and not order_by_created:
+        return range(stub.config["issue_count"])
+
+    created_times, indexes = stub.get_created_timeline()
+    low, high = 0, len(indexes)
+    for operator, value in conditions:
+        position = bisect.bisect_left(created_times, datetime.strptime(value, "%Y/%m/%d %H:%M"))
+        if operator == ">=":
+            low = max(low, position)
+        else:
+            high = min(high, position)
+    selected = indexes[low:high] if low < high else []
+    return selected[::-1] if order_by_created and order_by_created.group(1) else selected
+
+def handle_jira_search(handler, stub, match, query, body):
+    # GET(쿼리스트링) / POST(JSON 본문) 모두 startAt, maxResults를 지원합니다.
+    # "search_total"이 False이면 startAt은 무시하고, 응답의 nextPageToken으로만 다음 페이지를 요청할 수 있습니다.
+    params = json.loads(body or b"{}") if handler.command == "POST" else query
+    with_total = stub.config["search_total"]
+    token = params.get("nextPageToken")
+    start_at = int(token.removeprefix("stub-page-")) if token else int(params.get("startAt", 0)) if with_total else 0
+    requested = int(params.get("maxResults", 50))
+    selected = select_issue_indexes(stub, params.get("jql", ""))
+    page = selected[start_at:start_at + max(0, min(requested, stub.config["max_page_size"]))]
+    issues = [build_issue(index, stub.base_url, stub.now) for index in page]
+    with stub.lock:
+        stub.issues_served += len(issues)
+    is_last = start_at + len(issues) >= len(selected)
+    data = {"maxResults": requested, "isLast": is_last, "issues": issues}
+    if with_total:
+        data.update(startAt=start_at, total=len(selected))
+    elif not is_last:
+        data["nextPageToken"] = f"stub-page-{start_at + len(issues)}"
+    handler.send_json(200, data)
+    return 200
+
+def handle_jira_approximate_count(handler, stub, match, query, body):
+    params = json.loads(body or b"{}")
+    handler.send_json(200, {"count": len(select_issue_indexes(stub, params.get("jql", "")))})
+    return 200
+
+def handle_jira_pdcleaner(handler, stub, match, query, body):
+    queries = json.loads(body or b"{}").get("queries", [])
+    handler.send_json(200, {"queryStrings": queries, "queries": [{"query": q} for q in queries]})
+    return 200
+
+def handle_jira_changelog_bulkfetch(handler, stub, match, query, body):
+    # issueIdsOrKeys의 각 이슈(아이디 또는 QA-n 키) 변경 이력을 돌려줍니다. 한 요청에 최대 1000개 이슈를 받습니다.
+    params = json.loads(body or b"{}")
+    issue_ids = params.get("issueIdsOrKeys", [])
+    if len(issue_ids) > 1000:
+        handler.send_json(400, {"errorMessages": ["issueIdsOrKeys는 최대 1000개까지 지정할 수 있습니다."]})
+        return 400
+    changelogs = []
+    for issue_id in issue_ids:
+        issue_id = str(issue_id)
+        index = int(issue_id.split("-")[-1]) - 1 if "-" in issue_id else int(issue_id) - 10000
+        if 0 <= index < stub.config["issue_count"]:
+            changelogs.append({"issueId": str(10000 + index), "changeHistories": build_changelog(index, stub.now)})
+    handler.send_json(200, {"issueChangeLogs": changelogs})
+    return 200
+
+def handle_jira_issue_bulkfetch(handler, stub, match, query, body):
+    # issueIdsOrKeys의 이슈 중 존재하는 이슈만 돌려줍니다. (순서 보장 없음 - 역순으로 응답) 한 요청에 최대 100개 이슈를 받습니다.
+    params = json.loads(body or b"{}")
+    issue_keys = params.get("issueIdsOrKeys", [])
+    if len(issue_keys) > 100:
+        handler.send_json(400, {"errorMessages": ["issueIdsOrKeys는 최대 100개까지 지정할 수 있습니다."]})
+        return 400
+    issues, errors = [], []
+    for issue_key in reversed(issue_keys):
+        project, _, number = str(issue_key).upper().partition("-")
+        if project == "QA" and number.isdigit() and 0 < int(number) <= stub.config["issue_count"]:
+            issues.append(build_issue(int(number) - 1, stub.base_url, stub.now))
+        else:
+            errors.append({"issueIdsOrKeys": [issue_key], "status": 404, "elementErrors": {"errorMessages": ["Issue does not exist or you do not have permission to see it."]}})
+    with stub.lock:
+        stub.issues_served += len(issues)
+    handler.send_json(200, {"issues": issues, "issueErrors": errors})
+    return 200
+
+def handle_jira_comment(handler, stub, match, query, body):
+    handler.send_json(201, {"id": str(stub.next_id()), "issueKey": match.group(1)})
+    return 201
+
+# --- Confluence ---
+def content_response(page):
+    return {
+        "id": page["id"], "type": "page", "title": page["title"], "space": {"key": page["space"]},
+        "version": {"number": page["version"]},
+        "body": {"storage": {"value": page["body"], "representation": "storage"}},
+        "_links": {"webui": f"/pages/viewpage.action?pageId={page['id']}"}
+    }
+
+def handle_confluence_search(handler, stub, match, query, body):
+    with stub.lock:
+        pages = [page for page in stub.pages.values() if page["space"] == query.get("spaceKey") and page["title"] == query.get("title")]
+    handler.send_json(200, {"results": [content_response(page) for page in pages], "size": len(pages)})
+    return 200
+
+def handle_confluence_create(handler, stub, match, query, body):
+    data = json.loads(body)
+    with stub.lock:
+        page_id = str(stub.next_id())
+        stub.pages[page_id] = {
+            "id": page_id, "title": data["title"], "space": data["space"]["key"], "version": 1,
+            "body": data.get("body", {}).get("storage", {}).get("value", ""), "properties": {}, "attachments": {}
+        }
+        page = stub.pages[page_id]
+    handler.send_json(200, content_response(page))
+    return 200
+
+def get_page_or_404(handler, stub, page_id):
+    with stub.lock:
+        page = stub.pages.get(page_id)
+    if page is None:
+        handler.send_json(404, {"message": f"페이지 없음: {page_id}"})
+    return page
+
+def handle_confluence_get(handler, stub, match, query, body):
+    page = get_page_or_404(handler, stub, match.group(1))
+    if page is None:
+        return 404
+    handler.send_json(200, content_response(page))
+    return 200
+
+def handle_confluence_history(handler, stub, match, query, body):
+    page = get_page_or_404(handler, stub, match.group(1))
+    if page is None:
+        return 404
+    handler.send_json(200, {"lastUpdated": {"number": page["version"]}, "latest": True})
+    return 200
+
+def handle_confluence_update(handler, stub, match, query, body):
+    page = get_page_or_404(handler, stub, match.group(1))
+    if page is None:
+        return 404
+    data = json.loads(body)
+    with stub.lock:
+        page["title"] = data.get("title", page["title"])
+        page["body"] = data.get("body", {}).get("storage", {}).get("value", page["body"])
+        page["version"] += 1
+    handler.send_json(200, content_response(page))
+    return 200
+
+def handle_confluence_property(handler, stub, match, query, body):
+    page = get_page_or_404(handler, stub, match.group(1))
+    if page is None:
+        return 404
+    key = match.group(2) or (json.loads(body).get("key") if body else None)
+    with stub.lock:
+        if handler.command == "GET":
+            prop = page["properties"].get(key)
+        else:
+            data = json.loads(body)
+            version = page["properties"].get(key, {}).get("version", {}).get("number", 0) + 1
+            prop = page["properties"][key] = {"key": key, "value": data.get("value"), "version": {"number": version}}
+    if prop is None:
+        handler.send_json(404, {"message": f"속성 없음: {key}"})
+        return 404
+    handler.send_json(200, prop)
+    return 200
+
+def handle_confluence_attachment(handler, stub, match, query, body):
+    page = get_page_or_404(handler, stub, match.group(1))
+    if page is None:
+        return 404
+    if handler.command == "GET":
+        with stub.lock:
+            names = [name for name in page["attachments"] if not query.get("filename") or name == query["filename"]]
+            results = [{"id": page["attachments"][name]["id"], "title": name} for name in names]
+        handler.send_json(200, {"results": results, "size": len(results)})
+        return 200
+
+    # multipart 본문에서 파일 이름만 추출합니다. (내용은 크기만 기록)
+    found = re.search(rb'filename="([^"]+)"', body)
+    filename = found.group(1).decode("utf-8", "replace") if found else "attachment"
+    with stub.lock:
+        attachment = page["attachments"].setdefault(filename, {"id": f"att{stub.next_id()}"})
+        attachment["size"] = len(body)
+    handler.send_json(200, {"results": [{"id": attachment["id"], "title": filename}], "size": 1})
+    return 200
+
+# --- Slack / StatCounter ---
+def handle_slack_webhook(handler, stub, match, query, body):
+    with stub.lock:
+        now = time.monotonic()
+        min_interval = stub.config["slack_min_interval_ms"] / 1000
+        if min_interval and now - stub.slack_last_post < min_interval:
+            handler.send_text(429, "rate_limited", headers={"Retry-After": "1"})
+            return 429
+        stub.slack_last_post = now
+        stub.slack_messages.append(json.loads(body or b"{}"))
+    handler.send_text(200, "ok")
+    return 200
+
+# --- App Store ---
+def handle_app_store_feed(handler, stub, match, query, body):
+    # 국가별 고객 리뷰 피드 (최신순, 페이지당 50건, 최대 10페이지), 작성 시각은 -07:00 timezone으로 응답합니다.
+    country, page = match.group(1), int(match.group(2))
+    if not 1 <= page <= 10:
+        handler.send_json(400, {"errorMessages": ["page는 1~10입니다."]})
+        return 400
+    pacific = timezone(timedelta(hours=-7))
+    step = timedelta(hours=stub.config["app_store_review_hours"])
+    entries = []
+    for index in range((page - 1) * 50, page * 50):
+        written = (stub.now - step * (index + 1)).astimezone(pacific)
+        entries.append({
+            "author": {"name": {"label": f"reviewer-{country}-{index}"}},
+            "updated": {"label": written.strftime("%Y-%m-%dT%H:%M:%S%z")[:-2] + ":" + written.strftime("%z")[-2:]},
+            "im:rating": {"label": str(5 - index % 5)},
+            "title": {"label": f"리뷰 제목 {index}"},
+            "content": {"label": f"[{country}] 앱 스토어 리뷰 #{index} 로그인 오류가 있어요", "attributes": {"type": "text"}},
+            "id": {"label": f"{country}-{index}"}
+        })
+    handler.send_json(200, {"feed": {"entry": entries}})
+    return 200
+
+def handle_statcounter(handler, stub, match, query, body):
+    handler.send_text(200, render_statcounter_page(match.group(1), stub.statcounter_template), "text/html; charset=utf-8")
+    return 200
+
+# (경로 정규식, 메서드, 경로 이름, 처리 함수) - 위에서부터 처음 일치하는 경로를 사용합니다.
+ROUTES = [
+    (r"/rest/api/3/search/jql", "GET", "jira.search", handle_jira_search),
+    (r"/rest/api/3/search/jql", "POST", "jira.search", handle_jira_search),
+    (r"/rest/api/3/search/approximate-count", "POST", "jira.count", handle_jira_approximate_count),
+    (r"/rest/api/3/jql/pdcleaner", "POST", "jira.pdcleaner", handle_jira_pdcleaner),
+    (r"/rest/api/3/issue/([\w-]+)/comment", "POST", "jira.comment", handle_jira_comment),
+    (r"/rest/api/3/issue/bulkfetch", "POST", "jira.bulkfetch", handle_jira_issue_bulkfetch),
+    (r"/rest/api/3/changelog/bulkfetch", "POST", "jira.changelog", handle_jira_changelog_bulkfetch),
+    (r"/rest/api/content/?", "GET", "confluence.search", handle_confluence_search),
+    (r"/rest/api/content/?", "POST", "confluence.create", handle_confluence_create),
+    (r"/rest/api/content/(\d+)/history", "GET", "confluence.history", handle_confluence_history),
+    (r"/rest/api/content/(\d+)/property(?:/([^/]+))?", "GET", "confluence.property", handle_confluence_property),
+    (r"/rest/api/content/(\d+)/property(?:/([^/]+))?", "POST", "confluence.property", handle_confluence_property),
+    (r"/rest/api/content/(\d+)/property(?:/([^/]+))?", "PUT", "confluence.property", handle_confluence_property),
+    (r"/rest/api/content/(\d+)/child/attachment(?:/[\w]+/data)?", "GET", "confluence.attachment", handle_confluence_attachment),
+    (r"/rest/api/content/(\d+)/child/attachment(?:/[\w]+/data)?", "POST", "confluence.attachment", handle_confluence_attachment),
+    (r"/rest/api/content/(\d+)", "GET", "confluence.get", handle_confluence_get),
+    (r"/rest/api/content/(\d+)", "PUT", "confluence.update", handle_confluence_update),
+    (r"/slack/webhook", "POST", "slack.webhook", handle_slack_webhook),
+    (r"/statcounter/(.+)", "GET", "statcounter.page", handle_statcounter),
+    (r"/appstore/(\w+)/rss/customerreviews/page=(\d+)/id=\d+/sortby=mostrecent/json", "GET", "appstore.feed", handle_app_store_feed),
+]
+
+# =====================================
+# SMTP 대역 서버
+# =====================================
+class SMTPStubHandler(socketserver.StreamRequestHandler):
+    # smtplib가 사용하는 최소 명령(EHLO/HELO, AUTH PLAIN/LOGIN, MAIL, RCPT, DATA, RSET, NOOP, QUIT)만 지원합니다.
+    # STARTTLS는 지원하지 않으므로, jira_report 설정의 "gmail"에 "starttls": false를 지정해서 사용합니다.
+
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode("ascii"))
+
+    def handle(self):
+        started = time.perf_counter()
+        stub = self.server.stub
+        self.reply("220 stub-smtp ready")
+        message = {"from": None, "to": [], "size": 0}
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                break
+            command = line.decode("utf-8", "replace").strip()
+            verb = command.split(" ", 1)[0].upper()
+
+            if verb in ("EHLO", "HELO"):
+                self.wfile.write(b"250-stub-smtp\r\n250-AUTH PLAIN LOGIN\r\n250 8BITMIME\r\n")
+            elif verb == "AUTH":
+                if command.upper().startswith("AUTH LOGIN"):
+                    for prompt in ("VXNlcm5hbWU6", "UGFzc3dvcmQ6"):  # "Username:", "Password:" (base64)
+                        self.reply(f"334 {prompt}")
+                        self.rfile.readline()
+                self.reply("235 2.7.0 Authentication successful")
+            elif verb == "MAIL":
+                message = {"from": command[10:].strip("<> "), "to": [], "size": 0}
+                self.reply("250 OK")
+            elif verb == "RCPT":
+                message["to"].append(command[8:].strip("<> "))
+                self.reply("250 OK")
+            elif verb == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                while True:
+                    data_line = self.rfile.readline()
+                    if not data_line or data_line in (b".\r\n", b".\n"):
+                        break
+                    message["size"] += len(data_line)
+                with stub.lock:
+                    stub.emails.append(message)
+                self.reply("250 OK: queued")
+            elif verb in ("RSET", "NOOP"):
+                self.reply("250 OK")
+            elif verb == "QUIT":
+                self.reply("221 Bye")
+                break
+            else:
+                self.reply("502 Command not implemented")
+        stub.stats.record("smtp.session", 250, (time.perf_counter() - started) * 1000)
+
+class ThreadingSMTPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 1024
+
+# =====================================
+# 대역 서버 묶음
+# =====================================
+class StubServers:
+    """HTTP 대역 서버와 SMTP 대역 서버를 백그라운드 스레드로 실행합니다.
+
+    Args:
+        config: DEFAULT_STUB_CONFIG와 같은 키를 가진 딕셔너리 (지정하지 않은 값은 기본값 사용)
+        host: 바인딩할 주소, Default "127.0.0.1"
+
+    Notes:
+        # 1. 포트는 0(임의의 빈 포트)으로 바인딩하며, start() 이후 base_url, smtp_port로 확인합니다.
+        # 2. Confluence 페이지, Slack 메세지, 이메일은 메모리에만 저장됩니다.
+    """
+
+    def __init__(self, config=None, host="127.0.0.1"):
+        self.config = dict(DEFAULT_STUB_CONFIG, **(config or {}))
+        self.host = host
+        self.lock = threading.Lock()
+        self.stats = RequestStats()
+        self.pages = {}
+        self.slack_messages = []
+        self.slack_last_post = 0.0
+        self.emails = []
+        self.issues_served = 0
+        self.now = datetime.now(timezone.utc)
+        self._ids = itertools.count(100001)
+        self._timeline = None
+        self._request_count = 0
+        with open(STATCOUNTER_FIXTURE_PATH, "r", encoding="utf-8") as f:
+            self.statcounter_template = f.read()
+        self.http_server = None
+        self.smtp_server = None
+        self.threads = []
+
+    def next_id(self):
+        return next(self._ids)
+
+    def get_created_timeline(self):
+        # (created 시각 리스트, 이슈 번호 리스트)를 created 오름차순으로 리턴합니다. 이슈 수가 바뀔 때만 다시 계산합니다.
+        with self.lock:
+            if self._timeline is None or len(self._timeline[1]) != self.config["issue_count"]:
+                timeline = sorted(
+                    ((get_issue_updated(index, self.now) - timedelta(days=30)).replace(tzinfo=None), index)
+                    for index in range(self.config["issue_count"])
+                )
+                self._timeline = ([created for created, _ in timeline], [index for _, index in timeline])
+            return self._timeline
+
+    def should_throttle(self):
+        every = self.config["throttle_every"]
+        with self.lock:
+            self._request_count += 1
+            return bool(every) and self._request_count % every == 0
+
+    def configure(self, **changes):
+        # 실행 중에 설정(이슈 수, 지연 등)을 변경하고, 요청 기록을 초기화합니다.
+        self.config.update(changes)
+        self.stats.reset()
+        with self.lock:
+            self._request_count = 0
+            self.issues_served = 0
+            self.slack_messages.clear()
+            self.emails.clear()
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.http_server.server_address[1]}"
+
+    @property
+    def smtp_port(self):
+        return self.smtp_server.server_address[1]
+
+    def start(self):
+        self.http_server = StubHTTPServer((self.host, 0), StubHandler)
+        self.http_server.stub = self
+        self.smtp_server = ThreadingSMTPServer((self.host, 0), SMTPStubHandler)
+        self.smtp_server.stub = self
+        for server in (self.http_server, self.smtp_server):
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            self.threads.append(thread)
+        return self
+
+    def stop(self):
+        for server in (self.http_server, self.smtp_server):
+            if server:
+                server.shutdown()
+                server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+if __name__ == "__main__":
+    # 대역 서버만 단독으로 실행합니다. (스크립트 설정 파일의 URL을 직접 바꿔서 수동으로 확인할 때 사용)
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Jira/Confluence/Slack/StatCounter/SMTP 로컬 대역 서버")
+    parser.add_argument("--issues", type=int, default=DEFAULT_STUB_CONFIG["issue_count"], help="검색 결과 이슈 수")
+    parser.add_argument("--latency-ms", type=float, default=0, help="응답 지연 (ms)")
+    parser.add_argument("--throttle-every", type=int, default=0, help="Jira 요청 N번마다 429 응답")
+    args = parser.parse_args()
+
+    stub = StubServers({"issue_count": args.issues, "latency_ms": args.latency_ms, "throttle_every": args.throttle_every}).start()
+    print(f"HTTP 대역 서버: {stub.base_url}")
+    print(f"  Jira base_url        = {stub.base_url}")
+    print(f"  Confluence base_url  = {stub.base_url}")
+    print(f"  Slack webhook_url    = {stub.base_url}/slack/webhook")
+    print(f"  StatCounter target   = {stub.base_url}/statcounter/")
+    print(f"SMTP 대역 서버: {stub.host}:{stub.smtp_port} (starttls: false)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        stub.stop()
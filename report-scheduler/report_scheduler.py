@@ -0,0 +1,301 @@
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+
+"""jira_report.py와 confluence_report.py의 보고서 작업을 하나의 프로세스에서 주기적으로 실행합니다.
+
+Notes:
+    # 1. 각 스크립트를 crontab으로 매번 실행하는 대신, 이 스케줄러를 한 번 실행해두면 모듈 import, 설정 로드, 클라이언트 초기화가 한 번만 수행됩니다.
+    # 2. 작업별 실행 주기는 "report_scheduler_config.json"에 cron 표현식(분 시 일 월 요일)으로 정의합니다.
+    # 3. 같은 작업이 아직 실행 중이면 다음 실행은 건너뛰고, 스케줄러가 중단된 동안 놓친 실행은 재시작 시 한 번만 실행합니다.
+"""
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(script_dir)
+CONFIG_PATH = os.path.join(script_dir, "report_scheduler_config.json")
+MAX_SLEEP_SECONDS = 60  # 시스템 시간이 바뀌어도 일정이 밀리지 않도록 최대 대기 시간을 제한합니다.
+
+# =====================================
+# cron 표현식
+# =====================================
+CRON_FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]  # 분, 시, 일, 월, 요일(0과 7=일요일)
+
+def parse_cron_field(field, low, high):
+    """cron 필드 하나를 허용 값 집합으로 변환합니다. (*, */n, a-b, a-b/n, a,b,c 지원)"""
+    values = set()
+    for part in field.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text)
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start, end = (int(v) for v in part.split("-", 1))
+        else:
+            start = int(part)
+            end = high if step != 1 else start
+        if start < low or end > high or start > end or step < 1:
+            raise ValueError(f"cron 필드 범위 오류: {field} (허용 범위 {low}-{high})")
+        values.update(range(start, end + 1, step))
+    return values
+
+def parse_cron(expression):
+    """cron 표현식("분 시 일 월 요일")을 필드별 허용 값 집합 리스트로 변환합니다."""
+    fields = expression.split()
+    if len(fields) != 5:
+        raise ValueError(f"cron 표현식은 5개 필드로 구성되어야 합니다: {expression}")
+    parsed = []
+    for field, (low, high) in zip(fields, CRON_FIELD_RANGES):
+        if field == "*":
+            parsed.append(None)  # 제한 없음
+        else:
+            parsed.append(parse_cron_field(field, low, high))
+    if parsed[4] is not None:
+        parsed[4] = {weekday % 7 for weekday in parsed[4]}
+    return parsed
+
+def cron_day_matches(schedule, dt):
+    days, weekdays = schedule[2], schedule[4]
+    weekday = (dt.weekday() + 1) % 7  # datetime: 월=0 → cron: 일=0
+    if days is None and weekdays is None:
+        return True
+    if days is None:
+        return weekday in weekdays
+    if weekdays is None:
+        return dt.day in days
+    return dt.day in days or weekday in weekdays  # 일/요일이 모두 지정되면 둘 중 하나만 맞아도 실행 (표준 cron 동작)
+
+def next_run_after(schedule, after):
+    """after 이후(after 미포함) 처음으로 cron 일정에 맞는 시각을 리턴합니다."""
+    minutes, hours, _, months, _ = schedule
+    dt = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+    limit = dt + timedelta(days=366 * 5)
+    while dt < limit:
+        if months is not None and dt.month not in months:
+            dt = (dt.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            continue
+        if not cron_day_matches(schedule, dt):
+            dt = dt.replace(hour=0, minute=0) + timedelta(days=1)
+            continue
+        if hours is not None and dt.hour not in hours:
+            dt = dt.replace(minute=0) + timedelta(hours=1)
+            continue
+        if minutes is not None and dt.minute not in minutes:
+            dt += timedelta(minutes=1)
+            continue
+        return dt
+    raise ValueError("5년 안에 실행되는 일정이 없습니다.")
+
+# =====================================
+# 작업 정의
+# =====================================
+class ReportScheduler:
+    """보고서 작업 스케줄러
+    보고서 모듈과 클라이언트(Confluence, HTTP 세션, 웹드라이버)를 한 번만 초기화하고, 작업 실행 사이에 재사용합니다.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.state_path = os.path.join(script_dir, config.get("state_path") or "scheduler_state.json")
+        self.state = self.load_state()
+        self.jobs = {}
+        self.locks = {}
+        self.threads = {}
+        self.state_lock = threading.Lock()
+        self.driver_lock = threading.Lock()
+        self.driver = None
+
+        self.jira_report = None
+        self.confluence_report = None
+        self.confluence_config = None
+        self.confluence_client = None
+
+        job_functions = {
+            "jira_report": self.run_jira_report,
+            "app_review": self.run_app_review,
+            "market_share": self.run_market_share,
+        }
+        for name, job_config in config.get("jobs", {}).items():
+            if not job_config.get("enabled", True):
+                continue
+            if name not in job_functions:
+                raise ValueError(f"알 수 없는 작업입니다: {name} (사용 가능: {', '.join(job_functions)})")
+            self.jobs[name] = {"schedule": parse_cron(job_config["cron"]), "cron": job_config["cron"], "func": job_functions[name]}
+            self.locks[name] = threading.Lock()
+
+    # --- 모듈/클라이언트 초기화 (최초 1회) ---
+    def load_modules(self):
+        """필요한 보고서 모듈을 한 번만 import하고, 설정과 클라이언트를 초기화합니다."""
+        if any(name == "jira_report" for name in self.jobs) and self.jira_report is None:
+            jira_dir = os.path.join(REPO_DIR, "jira-automation")
+            sys.path.insert(0, jira_dir)
+            import jira_report
+            jira_report.script_dir = jira_dir
+            jira_report.CONFIG_PATH = self.config.get("jira_config_path") or os.path.join(jira_dir, "jira_config.json")
+            self.jira_report = jira_report
+
+        if any(name in ("app_review", "market_share") for name in self.jobs) and self.confluence_report is None:
+            confluence_dir = os.path.join(REPO_DIR, "confluence-reporter")
+            sys.path.insert(0, confluence_dir)
+            import confluence_report
+            config_path = self.config.get("confluence_config_path") or os.path.join(confluence_dir, "confluence_config.json")
+            self.confluence_config = confluence_report.load_config(config_path)
+            if self.confluence_config is None:
+                raise RuntimeError(f"Confluence 설정을 불러올 수 없습니다: {config_path}")
+            self.confluence_client = confluence_report.initialize_confluence_client(self.confluence_config)
+            if self.confluence_client is None:
+                raise RuntimeError("Confluence 클라이언트 초기화 실패")
+            self.confluence_report = confluence_report
+
+    def get_driver(self):
+        """웹드라이버를 재사용합니다. 드라이버가 없거나 응답하지 않으면 새로 초기화합니다."""
+        with self.driver_lock:
+            if self.driver is not None:
+                try:
+                    self.driver.current_url  # 세션이 살아있는지 확인
+                    return self.driver
+                except Exception:
+                    print("기존 WebDriver 세션이 종료되어 다시 초기화합니다.")
+                    self.driver = None
+            self.driver = self.confluence_report.web_driver_setting(self.confluence_config)
+            return self.driver
+
+    def close(self):
+        if self.driver is not None:
+            self.driver.quit()
+            self.driver = None
+            print("--- WebDriver 종료 ---")
+
+    # --- 작업 ---
+    def run_jira_report(self):
+        self.jira_report.run_all_profiles()
+
+    def run_app_review(self):
+        self.confluence_report.scrape_reviews_store(self.confluence_config, self.confluence_client)
+
+    def run_market_share(self):
+        driver_provider = self.get_driver if self.config.get("keep_driver", True) else None
+        self.confluence_report.crawl_market_share(self.confluence_config, self.confluence_client, driver_provider=driver_provider)
+
+    # --- 실행 상태 ---
+    def load_state(self):
+        if not os.path.exists(self.state_path):
+            return {}
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"스케줄러 상태 파일 로드 오류 (새로 작성합니다): {e}")
+            return {}
+
+    def save_state(self, name, scheduled_at):
+        with self.state_lock:
+            self.state[name] = scheduled_at.isoformat(timespec="minutes")
+            with open(self.state_path, "w", encoding="utf-8") as f:
+                json.dump(self.state, f, ensure_ascii=False, indent=2)
+
+    def start_job(self, name, scheduled_at):
+        """작업을 별도 스레드에서 실행합니다. 같은 작업이 실행 중이면 건너뜁니다."""
+        lock = self.locks[name]
+        if not lock.acquire(blocking=False):
+            print(f"[{datetime.now()}] ⏭️ {name} 작업이 아직 실행 중이어서 {scheduled_at:%Y-%m-%d %H:%M} 실행을 건너뜁니다.")
+            return
+        self.save_state(name, scheduled_at)
+
+        def run():
+            started = time.perf_counter()
+            print(f"\n[{datetime.now()}] ▶️ {name} 작업 시작 (예정 시각 {scheduled_at:%Y-%m-%d %H:%M})")
+            try:
+                self.jobs[name]["func"]()
+                print(f"[{datetime.now()}] ✅ {name} 작업 완료 ({time.perf_counter() - started:.1f}s)")
+            except Exception as e:
+                print(f"[{datetime.now()}] ❌ {name} 작업 실패 ({time.perf_counter() - started:.1f}s): {e}")
+            finally:
+                lock.release()
+
+        thread = threading.Thread(target=run, name=f"job-{name}", daemon=True)
+        self.threads[name] = thread
+        thread.start()
+
+    def initial_runs(self, now):
+        """다음 실행 시각을 계산합니다. 중단된 동안 놓친 실행이 있으면 바로 실행하도록 현재 시각을 리턴합니다."""
+        next_runs = {}
+        for name, job in self.jobs.items():
+            last_run = self.state.get(name)
+            if last_run and self.config.get("catch_up", True):
+                missed = next_run_after(job["schedule"], datetime.fromisoformat(last_run))
+                if missed <= now:
+                    print(f"놓친 실행 발견: {name} ({missed:%Y-%m-%d %H:%M}) → 바로 실행합니다.")
+                    next_runs[name] = missed
+                    continue
+            next_runs[name] = next_run_after(job["schedule"], now)
+        return next_runs
+
+    def run_forever(self):
+        self.load_modules()
+        next_runs = self.initial_runs(datetime.now())
+        self.print_schedule(next_runs)
+
+        try:
+            while True:
+                now = datetime.now()
+                for name, scheduled_at in next_runs.items():
+                    if scheduled_at <= now:
+                        self.start_job(name, scheduled_at)
+                        next_runs[name] = next_run_after(self.jobs[name]["schedule"], now)
+                        print(f"다음 {name} 실행 예정: {next_runs[name]:%Y-%m-%d %H:%M}")
+
+                wait = (min(next_runs.values()) - datetime.now()).total_seconds()
+                time.sleep(min(max(wait, 1), MAX_SLEEP_SECONDS))
+        except KeyboardInterrupt:
+            print("\n스케줄러 종료 요청 (실행 중인 작업이 끝날 때까지 기다립니다.)")
+            for thread in self.threads.values():
+                thread.join()
+        finally:
+            self.close()
+
+    def run_once(self, name):
+        """작업 하나를 즉시 실행하고 종료합니다."""
+        if name not in self.jobs:
+            raise ValueError(f"설정에 없거나 비활성화된 작업입니다: {name}")
+        self.load_modules()
+        try:
+            self.start_job(name, datetime.now())
+            self.threads[name].join()
+        finally:
+            self.close()
+
+    def print_schedule(self, next_runs):
+        print("등록된 작업:")
+        for name, scheduled_at in next_runs.items():
+            print(f"  {name:<14} cron='{self.jobs[name]['cron']}'  다음 실행: {scheduled_at:%Y-%m-%d %H:%M}")
+
+
+if __name__ == "__main__":
+    """메인 함수 실행
+
+    # 1. python report_scheduler.py            → 스케줄러 실행 (Ctrl+C로 종료)
+    # 2. python report_scheduler.py --list     → 작업별 다음 실행 시각 출력
+    # 3. python report_scheduler.py --once JOB → 작업 하나를 즉시 실행 (jira_report / app_review / market_share)
+    """
+    parser = argparse.ArgumentParser(description="QA 보고서 스케줄러")
+    parser.add_argument("--config", default=CONFIG_PATH, help="스케줄러 설정 파일 경로")
+    parser.add_argument("--list", action="store_true", help="작업별 다음 실행 시각만 출력")
+    parser.add_argument("--once", default=None, help="지정한 작업을 즉시 한 번 실행")
+    args = parser.parse_args()
+
+    with open(args.config, "r", encoding="utf-8") as f:
+        scheduler = ReportScheduler(json.load(f))
+
+    if args.list:
+        scheduler.print_schedule(scheduler.initial_runs(datetime.now()))
+    elif args.once:
+        scheduler.run_once(args.once)
+    else:
+        print("🗓️ QA 보고서 스케줄러 실행 중 (Ctrl+C로 종료)")
+        scheduler.run_forever()